@@ -0,0 +1,312 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import takewhile
+from typing import Callable, Iterator, Optional
+
+import dspy
+
+from model.classify import MultiSubjectClassifier
+from model.lm import OLLAMA_NUM_PARALLEL, configure_lm
+from model.prediction_cache import CachedClassifier, CachedMultiClassifier
+from model.registry import load_program
+from training.dataset import Dataset
+
+# Column names accepted for the two classifier inputs. Datasets use news_article/person_of_interest, CSV exports
+# like the original articles.csv use Description/Subject
+ARTICLE_COLUMNS = ('news_article', 'Description')
+SUBJECT_COLUMNS = ('person_of_interest', 'Subject')
+LABEL_COLUMNS = ('sentiment', 'Sentiment')
+
+# How many groups of rows may be submitted ahead of the group currently being written, per worker
+IN_FLIGHT_PER_WORKER = 4
+
+# How often progress is reported, in rows
+REPORT_EVERY = 50
+
+# Most people of interest sent in a single multi-subject LM call
+MAX_SUBJECTS_PER_CALL = 8
+
+
+def _first(row: dict, columns: tuple[str, ...]) -> Optional[str]:
+    for column in columns:
+        if row.get(column):
+            return row[column]
+    return None
+
+
+def iter_rows(path: str) -> Iterator[dict]:
+    """
+    Streams the rows of a CSV file, a JSONL file or a dataset one at a time.
+
+    Args:
+        path (str): A `.csv` file with a header row, a `.jsonl` file with one object per line (like the dataset
+            sources in training/data), or a built dataset directory (see training/dataset.py).
+
+    Yields:
+        dict: The row, with values keyed by column name.
+    """
+    if os.path.isfile(os.path.join(path, 'dataset.json')):
+        yield from Dataset(path).records()
+    elif path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif path.endswith('.csv'):
+        # Article descriptions can be long quoted fields
+        csv.field_size_limit(sys.maxsize)
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+    else:
+        raise ValueError(f"Input must be a .csv or .jsonl file or a dataset directory, got: {path}")
+
+
+def completed_rows(path: str) -> int:
+    """
+    Counts the results already written to `path`, so a run can resume after them.
+
+    Results are written in input order, so the output file doubles as the checkpoint. A trailing partial
+    line left behind by a crash is truncated away.
+    """
+    if not os.path.exists(path):
+        return 0
+    count = 0
+    good_bytes = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            count += 1
+            good_bytes += len(line)
+    if good_bytes != os.path.getsize(path):
+        with open(path, 'r+b') as f:
+            f.truncate(good_bytes)
+    return count
+
+
+def errored_rows(path: str) -> set[int]:
+    """Row numbers whose result in `path` is an error, e.g. an LM timeout or a response that failed to parse."""
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'r', encoding='utf-8') as f:
+        return {result['row'] for result in map(json.loads, f) if 'error' in result}
+
+
+def token_count(usage: dict) -> int:
+    """Sums the total tokens over every LM in a `get_lm_usage()` dict."""
+    return sum((model_usage or {}).get('total_tokens') or 0 for model_usage in (usage or {}).values())
+
+
+def _result_for(row_number: int, row: dict, subject: str) -> dict:
+    result = {'row': row_number, 'person_of_interest': subject}
+    label = _first(row, LABEL_COLUMNS)
+    if label is not None:
+        result['label'] = label
+    return result
+
+
+def classify_group(program: dspy.Module, multi: Optional[dspy.Module], rows: list[tuple[int, dict]],
+                   default_subject: str) -> list[dict]:
+    """
+    Classifies rows that share the same article.
+
+    A single row goes through `program`. Several rows go through `multi` in one LM call, and the LM usage of that
+    call is reported on the first row of the group only so token totals stay correct.
+    """
+    article = _first(rows[0][1], ARTICLE_COLUMNS) or ''
+    subjects = [_first(row, SUBJECT_COLUMNS) or default_subject for _, row in rows]
+    results = [_result_for(row_number, row, subject) for (row_number, row), subject in zip(rows, subjects)]
+
+    try:
+        if len(rows) == 1 or multi is None:
+            for result, subject in zip(results, subjects):
+                resp = program(news_article=article, person_of_interest=subject)
+                result.update(sentiment=resp.sentiment, confidence=resp.confidence, reasoning=resp.reasoning,
+                              usage=resp.get_lm_usage())
+        else:
+            resp = multi(news_article=article, people_of_interest=subjects)
+            for result, classification in zip(results, resp.classifications):
+                result.update(sentiment=classification.sentiment, confidence=classification.confidence,
+                              reasoning=classification.reasoning, group=rows[0][0])
+            results[0]['usage'] = resp.get_lm_usage()
+    except Exception as e:
+        for result in results:
+            if 'sentiment' not in result:
+                result['error'] = str(e)
+    return results
+
+
+def iter_groups(rows: Iterator[tuple[int, dict]], max_subjects: int) -> Iterator[list[tuple[int, dict]]]:
+    """Groups consecutive rows with the same article, up to `max_subjects` rows per group."""
+    group: list[tuple[int, dict]] = []
+    for row_number, row in rows:
+        if group and (len(group) >= max_subjects
+                      or _first(row, ARTICLE_COLUMNS) != _first(group[0][1], ARTICLE_COLUMNS)):
+            yield group
+            group = []
+        group.append((row_number, row))
+    if group:
+        yield group
+
+
+def classify_in_order(program: dspy.Module, multi: Optional[dspy.Module], groups: Iterator[list[tuple[int, dict]]],
+                      default_subject: str, workers: int) -> Iterator[dict]:
+    """
+    Classifies `groups` on `workers` threads and yields their results in input order.
+
+    At most `workers * IN_FLIGHT_PER_WORKER` groups are submitted ahead of the one being yielded, so memory stays
+    flat regardless of how many groups there are.
+    """
+    max_in_flight = workers * IN_FLIGHT_PER_WORKER
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for group in groups:
+            pending.append(pool.submit(classify_group, program, multi, group, default_subject))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def retry_errors(program: dspy.Module, multi: Optional[dspy.Module], input_path: str, output_path: str,
+                 workers: int, default_subject: str, max_subjects: int, on_result: Callable[[dict], None]) -> int:
+    """
+    Classifies the rows that failed in earlier runs again and replaces their results in `output_path`.
+
+    Results are in input order, so the retried rows come back in the order they appear in the output and are
+    written as the output is copied to a temporary file, which is then swapped in. A crash mid-retry leaves the
+    previous results intact. Each new result is passed to `on_result`. Returns how many rows still failed.
+    """
+    failed = errored_rows(output_path)
+    if not failed:
+        return 0
+    print(f"Retrying {len(failed)} rows that failed in earlier runs")
+    last = max(failed)
+    numbered = takewhile(lambda numbered_row: numbered_row[0] <= last, enumerate(iter_rows(input_path)))
+    rows = ((row_number, row) for row_number, row in numbered if row_number in failed)
+    results = classify_in_order(program, multi, iter_groups(rows, max_subjects), default_subject, workers)
+
+    still_failing = 0
+    tmp_path = output_path + '.tmp'
+    with open(output_path, 'r', encoding='utf-8') as src, open(tmp_path, 'w', encoding='utf-8') as out:
+        for line in src:
+            if json.loads(line)['row'] not in failed:
+                out.write(line)
+                continue
+            result = next(results)
+            on_result(result)
+            still_failing += 'error' in result
+            out.write(json.dumps(result, ensure_ascii=False) + '\n')
+    os.replace(tmp_path, output_path)
+    return still_failing
+
+
+def run_batch(program: dspy.Module, input_path: str, output_path: str, workers: int = OLLAMA_NUM_PARALLEL,
+              default_subject: str = '', limit: Optional[int] = None,
+              max_subjects: int = MAX_SUBJECTS_PER_CALL, multi: Optional[dspy.Module] = None) -> dict:
+    """
+    Classifies every row of `input_path` and appends the results to `output_path` as JSONL.
+
+    Rows are read lazily and at most `workers * IN_FLIGHT_PER_WORKER` groups are in memory at any time, so memory
+    stays flat regardless of the input size. Consecutive rows about the same article are classified together with
+    one `MultiSubjectClassifier` call. Results are written in input order as soon as they are ready, and
+    rows already present in `output_path` are skipped, so an interrupted run picks up where it stopped. Rows that
+    failed in an earlier run are retried first.
+
+    Args:
+        program (dspy.Module): The classifier to run for each row.
+        input_path (str): The CSV or JSONL file to classify.
+        output_path (str): The JSONL file results are appended to.
+        workers (int): Number of concurrent LM calls. Should match the Ollama server's OLLAMA_NUM_PARALLEL.
+        default_subject (str): Person of interest for rows that don't have one.
+        limit (int): Stop after this many rows of the input, counting rows done in earlier runs.
+        max_subjects (int): Most rows classified in one multi-subject call. 1 classifies every row on its own.
+        multi (dspy.Module): The classifier for groups of rows, `MultiSubjectClassifier.from_single(program)` if
+            not given.
+
+    Returns:
+        dict: Rows classified (retried rows included), errors, elapsed seconds, rows/sec and tokens/sec for this run.
+    """
+    if multi is None and max_subjects > 1:
+        multi = MultiSubjectClassifier.from_single(program)
+
+    stats = {'rows': 0, 'errors': 0, 'tokens': 0}
+    start = time.perf_counter()
+    skip = completed_rows(output_path)
+
+    def report():
+        elapsed = time.perf_counter() - start
+        stats['seconds'] = round(elapsed, 3)
+        stats['rows_per_sec'] = round(stats['rows'] / elapsed, 3) if elapsed else 0.0
+        stats['tokens_per_sec'] = round(stats['tokens'] / elapsed, 3) if elapsed else 0.0
+        print(f"{stats['rows']} rows classified ({skip} done before this run), {stats['rows_per_sec']} rows/sec, "
+              f"{stats['tokens_per_sec']} tokens/sec, {stats['errors']} errors")
+
+    def record(result: dict):
+        stats['rows'] += 1
+        stats['tokens'] += token_count(result.get('usage'))
+        if 'error' in result:
+            stats['errors'] += 1
+        if stats['rows'] % REPORT_EVERY == 0:
+            report()
+
+    if skip:
+        print(f"Resuming after {skip} completed rows")
+        still_failing = retry_errors(program, multi, input_path, output_path, workers, default_subject, max_subjects,
+                                     record)
+        if still_failing:
+            print(f"{still_failing} rows failed again, they will be retried on the next run")
+
+    def rows_to_classify() -> Iterator[tuple[int, dict]]:
+        for row_number, row in enumerate(iter_rows(input_path)):
+            if limit is not None and row_number >= limit:
+                break
+            if row_number >= skip:
+                yield row_number, row
+
+    with open(output_path, 'a', encoding='utf-8') as out:
+        groups = iter_groups(rows_to_classify(), max_subjects)
+        for result in classify_in_order(program, multi, groups, default_subject, workers):
+            out.write(json.dumps(result, ensure_ascii=False) + '\n')
+            out.flush()
+            record(result)
+
+    report()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Classify a CSV or JSONL file of (article, person) pairs.')
+    parser.add_argument('input', help='.csv or .jsonl file with news_article/Description and person_of_interest/Subject columns, or a dataset directory')
+    parser.add_argument('output', help='.jsonl file results are appended to. Rerunning with the same file resumes')
+    parser.add_argument('--program', default='bs_fewshot',
+                        help="'zero_shot' or the name of a saved program in artifacts.json (default: bs_fewshot)")
+    parser.add_argument('--workers', type=int, default=OLLAMA_NUM_PARALLEL,
+                        help='concurrent LM calls, defaults to $OLLAMA_NUM_PARALLEL or 4')
+    parser.add_argument('--subject', default='', help='person of interest for rows without one')
+    parser.add_argument('--limit', type=int, default=None, help='only classify the first N rows of the input')
+    parser.add_argument('--cache', action='store_true',
+                        help='answer rows already classified by this program from the prediction cache')
+    parser.add_argument('--max-subjects', type=int, default=MAX_SUBJECTS_PER_CALL,
+                        help='most consecutive rows about the same article classified in one LM call, 1 disables grouping')
+    args = parser.parse_args()
+
+    lm = configure_lm()
+    program = load_program(args.program)
+    multi = MultiSubjectClassifier.from_single(program) if args.max_subjects > 1 else None
+    if args.cache:
+        program = CachedClassifier(program, lm)
+        multi = multi and CachedMultiClassifier(multi, lm, program.cache)
+    stats = run_batch(program, args.input, args.output, workers=args.workers, default_subject=args.subject,
+                      limit=args.limit, max_subjects=args.max_subjects, multi=multi)
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
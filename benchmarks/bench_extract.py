@@ -0,0 +1,59 @@
+import argparse
+import json
+import time
+from pathlib import Path
+
+from scraper.extract import CHUNK_SIZE, DEFAULT_MAX_CHARS, ENGINES
+
+# Synthetic pages shaped like news articles (a typical article, a long page, a page without an article container),
+# not copies of real sites, so timings compare the engines with each other rather than predict live pages
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+
+
+def chunked(body: bytes, size: int = CHUNK_SIZE) -> list[bytes]:
+    """Splits a saved page the way `iter_content` would hand it to the extractor."""
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def bench(engine: str, body: bytes, repeat: int, max_chars: int) -> dict:
+    extract = ENGINES[engine]
+    chunks = chunked(body)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = extract(iter(chunks), encoding='utf-8', max_chars=max_chars)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        'engine': engine,
+        'median_ms': round(timings[len(timings) // 2] * 1000, 3),
+        'min_ms': round(timings[0] * 1000, 3),
+        'chars': len(text),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark of the article extraction engines over saved HTML pages.')
+    parser.add_argument('--repeat', type=int, default=20, help='runs per engine and page')
+    parser.add_argument('--max-chars', type=int, default=DEFAULT_MAX_CHARS, help='article text budget')
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    args = parser.parse_args()
+
+    results = []
+    for fixture in sorted(FIXTURES_DIR.glob('*.html')):
+        body = fixture.read_bytes()
+        for engine in ENGINES:
+            result = bench(engine, body, args.repeat, args.max_chars)
+            result.update(fixture=fixture.name, kb=round(len(body) / 1024, 1))
+            results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'fixture':<24}{'kb':>8}  {'engine':<8}{'median ms':>11}{'min ms':>9}{'chars':>8}")
+    for r in results:
+        print(f"{r['fixture']:<24}{r['kb']:>8}  {r['engine']:<8}{r['median_ms']:>11}{r['min_ms']:>9}{r['chars']:>8}")
+
+
+if __name__ == "__main__":
+    main()
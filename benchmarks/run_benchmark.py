@@ -0,0 +1,184 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, get_args
+
+import dspy
+from dspy.utils.usage_tracker import track_usage
+
+from benchmarks.stub_lm_server import StubOllamaServer
+from model.classify import Classify
+from model.lm import LM_API_BASE, configure_lm
+from model.registry import load_program
+from training.dataset import Dataset
+from training.training_set import sentiment_match_metric
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+# Labels Classify can answer with. Rows labelled anything else (neutral) are not scored
+LABELS = get_args(Classify.output_fields['sentiment'].annotation)
+
+PROGRAMS = ('zero_shot', 'bs_fewshot', 'zero_shot_miprov2')
+DATASETS = ('training_set', 'articles')
+
+# Metrics where a higher value is a regression, and where a lower value is
+LOWER_IS_BETTER = ('p50_ms', 'p95_ms', 'p99_ms', 'prompt_tokens_per_call', 'completion_tokens_per_call')
+HIGHER_IS_BETTER = ('rows_per_sec', 'accuracy')
+
+
+def load_dataset(name: str, limit: Optional[int]) -> list[dspy.Example]:
+    """
+    The first `limit` examples of a dataset in training/data.
+
+    The articles dataset has article-level labels and no person of interest, so its rows are classified with an
+    empty subject and only the positive/negative rows count towards accuracy.
+    """
+    return list(Dataset(name)[:limit])
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(q / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def _usage(usage: dict) -> tuple[int, int]:
+    prompt = sum((u or {}).get('prompt_tokens') or 0 for u in usage.values())
+    completion = sum((u or {}).get('completion_tokens') or 0 for u in usage.values())
+    return prompt, completion
+
+
+def run_case(program: dspy.Module, examples: list[dspy.Example], concurrency: int) -> dict:
+    """Classifies `examples` with `concurrency` threads and summarizes latency, tokens, throughput and accuracy."""
+
+    def one(example: dspy.Example) -> dict:
+        start = time.perf_counter()
+        try:
+            # Tracked here rather than with get_lm_usage() so bare dspy.Predict programs are counted too
+            with track_usage() as usage_tracker:
+                pred = program(**example.inputs())
+        except Exception as e:
+            return {'latency': time.perf_counter() - start, 'error': str(e)}
+        latency = time.perf_counter() - start
+        prompt, completion = _usage(usage_tracker.get_total_tokens())
+        scored = example.sentiment in LABELS
+        return {'latency': latency, 'prompt_tokens': prompt, 'completion_tokens': completion,
+                'scored': scored, 'correct': scored and bool(sentiment_match_metric(example, pred))}
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(one, examples))
+    wall = time.perf_counter() - start
+
+    ok = [o for o in outcomes if 'error' not in o]
+    latencies_ms = [o['latency'] * 1000 for o in ok]
+    calls = [o for o in ok if o['prompt_tokens']]
+    scored = [o for o in ok if o['scored']]
+    return {
+        'rows': len(examples),
+        'errors': len(outcomes) - len(ok),
+        'p50_ms': round(percentile(latencies_ms, 50), 2),
+        'p95_ms': round(percentile(latencies_ms, 95), 2),
+        'p99_ms': round(percentile(latencies_ms, 99), 2),
+        'lm_calls': len(calls),
+        'prompt_tokens': sum(o['prompt_tokens'] for o in ok),
+        'completion_tokens': sum(o['completion_tokens'] for o in ok),
+        'prompt_tokens_per_call': round(sum(o['prompt_tokens'] for o in calls) / len(calls), 1) if calls else 0.0,
+        'completion_tokens_per_call': round(sum(o['completion_tokens'] for o in calls) / len(calls), 1) if calls else 0.0,
+        'rows_per_sec': round(len(examples) / wall, 3) if wall else 0.0,
+        'accuracy': round(sum(o['correct'] for o in scored) / len(scored), 4) if scored else None,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list[str]:
+    """Lists the metrics of `current` that got worse than `baseline` by more than `tolerance` (relative)."""
+    previous = {(r['program'], r['dataset'], r['concurrency']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        before = previous.get((result['program'], result['dataset'], result['concurrency']))
+        if before is None:
+            continue
+        case = f"{result['program']}/{result['dataset']}/c{result['concurrency']}"
+        for metric in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (metric in LOWER_IS_BETTER and change > tolerance) or (metric in HIGHER_IS_BETTER and change < -tolerance):
+                regressions.append(f"{case} {metric}: {old} -> {new} ({change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark latency, tokens, throughput and accuracy of the classifiers.')
+    parser.add_argument('--programs', default=','.join(PROGRAMS), help="comma separated, 'zero_shot' or saved program names")
+    parser.add_argument('--datasets', default=','.join(DATASETS), help='comma separated datasets in training/data, e.g. training_set and/or articles')
+    parser.add_argument('--concurrency', default='1,4,8', help='comma separated thread counts')
+    parser.add_argument('--limit', type=int, default=100, help='most examples per dataset')
+    parser.add_argument('--stub', action='store_true', help='run against a local stub LM server instead of Ollama')
+    parser.add_argument('--stub-parallel', type=int, default=4, help='requests the stub serves at once')
+    parser.add_argument('--output', default=None, help='results JSON file, defaults to benchmarks/results/<commit>.json')
+    parser.add_argument('--compare', default=None, help='baseline results JSON to diff against')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='relative change counted as a regression')
+    args = parser.parse_args()
+
+    # litellm's response models warn on every Ollama response
+    warnings.filterwarnings('ignore', message='Pydantic serializer warnings')
+
+    server = StubOllamaServer(parallel=args.stub_parallel).start() if args.stub else None
+    api_base = server.api_base if server else LM_API_BASE
+    configure_lm(api_base)
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'config': {'stub': args.stub, 'stub_parallel': args.stub_parallel if args.stub else None,
+                   'limit': args.limit, 'python': platform.python_version(), 'dspy': dspy.__version__},
+        'results': [],
+    }
+
+    concurrency_levels = [int(c) for c in args.concurrency.split(',')]
+    for dataset in args.datasets.split(','):
+        examples = load_dataset(dataset, args.limit)
+        for program_name in args.programs.split(','):
+            program = load_program(program_name)
+            for concurrency in concurrency_levels:
+                result = {'program': program_name, 'dataset': dataset, 'concurrency': concurrency,
+                          **run_case(program, examples, concurrency)}
+                report['results'].append(result)
+                print(json.dumps(result))
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{(commit or 'local')[:12]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + '\n')
+    print(f"Results written to {output}")
+
+    if server:
+        server.shutdown()
+
+    if args.compare:
+        regressions = compare(json.loads(Path(args.compare).read_text()), report, args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
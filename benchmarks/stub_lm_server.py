@@ -0,0 +1,143 @@
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from model.preprocess import CHARS_PER_TOKEN, mentions
+
+# Words the stub counts to decide between a positive and a negative answer
+POSITIVE_WORDS = {'praised', 'award', 'best', 'win', 'won', 'support', 'endorsed', 'strong', 'success', 'welcomed',
+                  'leader', 'lead', 'results', 'popular', 'gains', 'front-runner', 'held'}
+NEGATIVE_WORDS = {'accused', 'criticism', 'criticized', 'attack', 'charged', 'lawsuit', 'scandal', 'failed', 'unpopular',
+                  'elite', 'allegations', 'guilty', 'assault', 'cut', 'tatters', 'crisis', 'lost'}
+
+_FIELD = re.compile(r'\[\[ ## (\w+) ## \]\]\n(.*?)(?=\n\n\[\[ ## |\n\nRespond with |\Z)', re.DOTALL)
+_OUTPUT_FIELDS = re.compile(r'Your output fields are:\n(.*?)\n(?:All interactions|\n)', re.DOTALL)
+_FIELD_NAME = re.compile(r'`(\w+)`')
+
+
+def _input_fields(content: str) -> dict[str, str]:
+    return {name: value.strip() for name, value in _FIELD.findall(content)}
+
+
+def _classify(article: str, subject: str) -> tuple[str, float, str]:
+    if subject and not mentions(article, subject):
+        return 'unrelated', 0.95, f'{subject} is not mentioned in the article.'
+    words = re.findall(r"[\w-]+", article.lower())
+    score = sum(w in POSITIVE_WORDS for w in words) - sum(w in NEGATIVE_WORDS for w in words)
+    sentiment = 'positive' if score >= 0 else 'negative'
+    return sentiment, 0.8, f'The article uses {"favourable" if score >= 0 else "critical"} language about {subject or "its subject"}.'
+
+
+def stub_completion(messages: list[dict]) -> str:
+    """
+    Answers a dspy ChatAdapter prompt for `Classify` or `ClassifyMany` deterministically.
+
+    The answer depends only on the last user message, so results are reproducible between runs and commits.
+    """
+    system = next((m['content'] for m in messages if m['role'] == 'system'), '')
+    match = _OUTPUT_FIELDS.search(system)
+    output_fields = _FIELD_NAME.findall(match.group(1)) if match else ['reasoning', 'sentiment', 'confidence']
+    inputs = _input_fields(messages[-1]['content'])
+    article = inputs.get('news_article', '')
+
+    values = {}
+    if 'classifications' in output_fields:
+        try:
+            people = json.loads(inputs.get('people_of_interest', '[]'))
+        except json.JSONDecodeError:
+            people = []
+        classifications = []
+        for person in people:
+            sentiment, confidence, reasoning = _classify(article, person)
+            classifications.append({'person_of_interest': person, 'sentiment': sentiment,
+                                    'confidence': confidence, 'reasoning': reasoning})
+        values['classifications'] = json.dumps(classifications)
+        values['reasoning'] = 'Classified each person of interest separately.'
+    else:
+        sentiment, confidence, reasoning = _classify(article, inputs.get('person_of_interest', ''))
+        values.update(sentiment=sentiment, confidence=str(confidence), reasoning=reasoning)
+
+    parts = [f'[[ ## {name} ## ]]\n{values.get(name, "")}' for name in output_fields]
+    return '\n\n'.join(parts + ['[[ ## completed ## ]]'])
+
+
+class StubOllamaHandler(BaseHTTPRequestHandler):
+    """Serves `/api/chat` like Ollama does for non-streaming requests."""
+
+    def do_POST(self):
+        if not self.path.endswith('/api/chat'):
+            self.send_error(404)
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        messages = body.get('messages', [])
+        prompt_tokens = sum(len(m.get('content') or '') for m in messages) // CHARS_PER_TOKEN
+        content = stub_completion(messages)
+        completion_tokens = len(content) // CHARS_PER_TOKEN
+
+        server = self.server
+        with server.slots:
+            # Simulates prefill and decode time, with at most `parallel` requests running at once like Ollama
+            time.sleep(server.base_latency + prompt_tokens * server.prefill_latency + completion_tokens * server.decode_latency)
+
+        payload = json.dumps({
+            'model': body.get('model', 'stub'),
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'message': {'role': 'assistant', 'content': content},
+            'done': True,
+            'done_reason': 'stop',
+            'prompt_eval_count': prompt_tokens,
+            'eval_count': completion_tokens,
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubOllamaServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the Ollama server, so the benchmarks run in CI without a model.
+
+    Latency is `base_latency + prompt tokens * prefill_latency + completion tokens * decode_latency` seconds, and
+    only `parallel` requests are served at once, mirroring OLLAMA_NUM_PARALLEL.
+    """
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, parallel: int = 4, base_latency: float = 0.02,
+                 prefill_latency: float = 0.00002, decode_latency: float = 0.0005):
+        super().__init__((host, port), StubOllamaHandler)
+        self.slots = threading.BoundedSemaphore(parallel)
+        self.base_latency = base_latency
+        self.prefill_latency = prefill_latency
+        self.decode_latency = decode_latency
+
+    @property
+    def api_base(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'StubOllamaServer':
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a stub Ollama /api/chat server for benchmarks.')
+    parser.add_argument('--port', type=int, default=11435)
+    parser.add_argument('--parallel', type=int, default=4, help='requests served at once, like OLLAMA_NUM_PARALLEL')
+    args = parser.parse_args()
+
+    server = StubOllamaServer(port=args.port, parallel=args.parallel)
+    print(f"Stub LM server listening on {server.api_base}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,83 +1,60 @@
 import dspy
 import dspy.evaluate
-import requests
-from bs4 import BeautifulSoup
 import gradio as gr
-from functools import lru_cache
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from urllib.parse import urlparse
 from training.training_set import generate_dspy_training_examples, sentiment_match_metric
-from model.classify import Classify, SentimentClassifier
-from dspy.teleprompt import BootstrapFewShot, MIPROv2, LabeledFewShot, BootstrapFewShotWithRandomSearch
+from model.classify import Classify, MultiSubjectClassifier
+from model.registry import ArtifactRegistry
+from model.compaction import load_or_compact
+from model.optimizer import load_optimized
+from model.prediction_cache import CachedClassifier, CachedMultiClassifier, PredictionCache
+from model.lm import OLLAMA_NUM_PARALLEL, configure_lm
+from scraper.cache import normalize_url
+from scraper.fetch import parse_paras_out_of_news_url, cache as article_cache
+from serving.limit import ConcurrencyLimited
+from serving.singleflight import SingleFlight
 
 
 
-lm = dspy.LM(
-    'ollama_chat/llama3.2:latest',
-    api_base='http://localhost:11434',api_key='',cache=False, temperature=0.1, max_tokens=4096)
-dspy.configure(lm=lm)
-dspy.settings.configure(track_usage=True)
+lm = configure_lm()
 
 url = "https://www.bbc.com/news/articles/c20l2evgny6o"
 # url = 'https://www.cbc.ca/news/politics/liberal-oppo-csfn-1.7509217'
 # url = "https://en.wikipedia.org/wiki/Python_(programming_language)"
 # url = 'https://www.cbc.ca/news/politics/english-leaders-debate-election-2025-1.7513834'
 
-headers = {'User-Agent' : 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.0 Safari/605.1.15'}
-
 # evaluate_flag is used to run the training_set to get a metric of how we did thus far
 evaluate_flag = False
 
 # If True, shows prompts
 show_history = False
 
-# If true, optimizes the model using specified optimizer
+# If true, uses the optimized model saved in the artifact registry by `uv run python -m model.optimizer`. A warning is
+# printed when the Classify signature, the training set or the LM config changed since it was optimized
 optimize = True
 
-# If True, serializes (state-only. See https://dspy.ai/tutorials/saving/#whole-program-saving for details) the optimized model for classification
-save_model = True
-
-# Generate a prompt using a teacher model
-generate_prompt = False
+# If True, serves the optimized model with compacted few-shot demos (see model/compaction.py), sending only the
+# most similar ones with each call
+compact_demos = True
 
+# If True, answers repeated (article, person of interest) queries from the prediction cache in .cache/predictions.sqlite.
+# Use `uv run python -m model.prediction_cache clear` to invalidate it
+cache_predictions = True
 
+# LM calls running at once. Match the Ollama server's OLLAMA_NUM_PARALLEL so requests queue here instead of in Ollama
+lm_concurrency = OLLAMA_NUM_PARALLEL
 
-@lru_cache(maxsize=1024)
-def parse_paras_out_of_news_url(url: str) -> str:
-    """
-    Fetches the content of a news article from the given URL.
+# Requests Gradio works on at once. Higher than lm_concurrency so fetches overlap LM calls and duplicate
+# requests can join one already in flight
+serving_concurrency = 4 * OLLAMA_NUM_PARALLEL
 
-    This function sends an HTTP GET request to the specified URL and returns the 
-    response content as a string if the request is successful. If the request fails 
-    or encounters an error, an appropriate error message is returned.
+# Requests waiting in the Gradio queue before new ones are turned away with "queue full"
+max_queue_size = 64
 
-    Args:
-        url (str): The URL of the news article to fetch.
-
-    Returns:
-        str: The content of the news article if the request is successful, or an 
-        error message if the request fails or times out.
-
-    Exceptions:
-        - Returns "Error: Request timed out" if the request exceeds the timeout limit.
-        - Returns "Error: <error_message>" for any other exceptions encountered.
-    """
-    try:
-        r = requests.get(url, timeout=10, headers=headers)
-        if r.status_code == 200:
-            html_resp = r.text
-            soup = BeautifulSoup(html_resp, 'html.parser')
-            article : str = ''
-        
-            for i in soup.find_all('p'):
-                article += i.get_text()
-            return article
-
-        else:
-            return f"Error: {r.status_code}"
-    except requests.exceptions.Timeout:
-        return "Error: Request timed out"
-    except Exception as e:
-        return f"Error: {str(e)}"
 
 
 def main():
@@ -89,56 +66,87 @@ def main():
         evaluator = dspy.Evaluate(devset=training_set, num_threads=5,display_progress=True, display_table=True)
         evaluator(classify, metric=sentiment_match_metric)
 
+    single_classifier = classify
     if optimize:
-        optimized_classifier = SentimentClassifier()
-        optimizerBootStrap = BootstrapFewShot(metric=sentiment_match_metric)
-        teacher_classifier = optimizerBootStrap.compile(optimized_classifier, trainset=training_set)
-        if save_model:
-            teacher_classifier.save('./optimized_classifier_bs_fewshot.json')
-
-        if generate_prompt:
-            # Zero-shot instruction optimization
-            optimizer = MIPROv2(metric=sentiment_match_metric, auto='light', num_threads=15)
-            optimized_classifier = optimizer.compile(SentimentClassifier(), teacher=teacher_classifier,
-                                                    trainset=training_set, max_labeled_demos=0, max_bootstrapped_demos=0,
-                                                    requires_permission_to_run=False)
-
-            evaluator = dspy.Evaluate(devset=training_set, num_threads=5,display_progress=True, display_table=True)
-            evaluator(optimized_classifier, metric=sentiment_match_metric)
-        
-            if save_model:
-                optimized_classifier.save('./optimized_classifier_zero_shot_miprov2.json')
-
-
-
-
-    def GetSentiment(url: str, subject : str) -> str:
+        registry = ArtifactRegistry()
+        # Optimizing is its own command (`uv run python -m model.optimizer`), startup only loads what it saved
+        teacher_classifier = load_optimized(registry, 'bs_fewshot', training_set, lm)
+
+        if teacher_classifier is not None and compact_demos:
+            teacher_classifier = load_or_compact(registry, 'bs_fewshot', teacher_classifier, training_set, lm)
+        if teacher_classifier is not None:
+            single_classifier = teacher_classifier
+
+    # Several people of interest about the same article are classified in one LM call
+    multi_classifier = MultiSubjectClassifier.from_single(single_classifier)
+
+    # Only calls that reach the LM take a slot, answers from the prediction cache never wait for one
+    lm_slots = threading.BoundedSemaphore(lm_concurrency)
+    single_classifier = ConcurrencyLimited(single_classifier, lm_slots)
+    multi_classifier = ConcurrencyLimited(multi_classifier, lm_slots)
+    if cache_predictions:
+        prediction_cache = PredictionCache()
+        single_classifier = CachedClassifier(single_classifier, lm, prediction_cache)
+        multi_classifier = CachedMultiClassifier(multi_classifier, lm, prediction_cache)
+
+    # One thread per request Gradio works on, so requests waiting for an LM slot never hold up cache hits
+    classifier_threads = ThreadPoolExecutor(max_workers=serving_concurrency, thread_name_prefix='classifier')
+    # Identical in-flight requests share one fetch and one classifier call
+    fetch_flight = SingleFlight()
+    classify_flight = SingleFlight()
+
+    async def run_classifier(classifier, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(classifier_threads, partial(classifier, **kwargs))
+
+    async def GetSentiment(url: str, subject : str) -> str:
         if urlparse(url)[0] != "https":
             return "Invalid URL"
-        article = parse_paras_out_of_news_url(url)
-        
+        subjects = [s.strip() for s in subject.split(',') if s.strip()]
+        if not subjects:
+            return "Invalid subject"
+        subject_key = tuple(' '.join(s.casefold().split()) for s in subjects)
+        url_key = normalize_url(url)
+        article = await fetch_flight.do(url_key, lambda: asyncio.to_thread(parse_paras_out_of_news_url, url))
+        print("article cache:", article_cache.stats())
+
         # print("Article:", article)
+        if len(subjects) > 1:
+            print("Running Multi-Subject Classifier")
+            resp = await classify_flight.do((url_key, subject_key), lambda: run_classifier(
+                multi_classifier, news_article=article, people_of_interest=subjects))
+            print("Response:", resp)
+            print("lm usage:", resp.get_lm_usage())
+            print("coalesced:", classify_flight.stats())
+            if cache_predictions:
+                print("prediction cache:", prediction_cache.stats()['hits'], "hits")
+            return '\n\n'.join(f'{c.person_of_interest}: sentiment: {c.sentiment}, \n\nconfidence: {c.confidence},\n\nreasoning: {c.reasoning}'
+                                for c in resp.classifications)
+
         if optimize:
             print("Running Optimized Classifier")
-            resp = teacher_classifier(news_article=article, person_of_interest=subject)
         else:
             print("Running Classifier")
-            resp = classify(news_article=article, person_of_interest=subject)
+        resp = await classify_flight.do((url_key, subject_key), lambda: run_classifier(
+            single_classifier, news_article=article, person_of_interest=subjects[0]))
 
         print("Response:", resp)
         if show_history:
             dspy.inspect_history(n=1)
         print("lm usage:", resp.get_lm_usage())
+        print("coalesced:", classify_flight.stats())
+        if cache_predictions:
+            print("prediction cache:", prediction_cache.stats()['hits'], "hits")
         return f'sentiment: {resp.sentiment}, \n\nconfidence: {resp.confidence},\n\nreasoning: {resp.reasoning}'
 
     demo = gr.Interface(
         fn=GetSentiment,
-        inputs=[gr.Textbox(label="Enter URL"), gr.Textbox(label="Person of Interest")],
+        inputs=[gr.Textbox(label="Enter URL"), gr.Textbox(label="Person of Interest (comma separated for several)")],
         outputs=gr.Textbox(label="Sentiment"),
         title="News Article Sentiment Classifier",
         description="""Classify the sentiment of a news article as postive, negative or nuetral based on a given subject.
         Also provide the confidence score ranging from 0 to 1. Also provides reasning on why the sentiment is classified as such.""",
     )
+    demo.queue(default_concurrency_limit=serving_concurrency, max_size=max_queue_size)
     demo.launch()
 
 if __name__ == "__main__":
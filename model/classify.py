@@ -1,5 +1,7 @@
 import dspy
-from typing import Literal
+from typing import Literal, Optional
+from pydantic import BaseModel
+from model.preprocess import DEFAULT_TOKEN_BUDGET, focus_article, mentions
 
 class Classify(dspy.Signature):
     """
@@ -13,11 +15,159 @@ class Classify(dspy.Signature):
     confidence: float = dspy.OutputField()
     reasoning: str = dspy.OutputField()
 
+def not_mentioned(person_of_interest: str) -> dspy.Prediction:
+    """The answer for a person of interest the article never mentions, given without calling the LM."""
+    return dspy.Prediction(sentiment='unrelated', confidence=1.0,
+                           reasoning=f'{person_of_interest} is not mentioned in the article.')
+
 class SentimentClassifier(dspy.Module):
-    """Classify a news article sentiment based on a given person and the news article itself."""
-    def __init__(self):
+    """
+    Classify a news article sentiment based on a given person and the news article itself.
+
+    Only the passages mentioning the person of interest (see `model.preprocess.focus_article`), up to
+    `token_budget` tokens, are sent to the LM. If the person is never mentioned, "unrelated" is returned without
+    an LM call. A `token_budget` of None sends the whole article.
+    """
+    def __init__(self, token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET, aliases: Optional[dict[str, list[str]]] = None):
         super().__init__()
         self.classify = dspy.ChainOfThoughtWithHint(Classify)
+        self.token_budget = token_budget
+        self.aliases = aliases or {}
     
+    def prepare_article(self, news_article: str, person_of_interest: str) -> Optional[str]:
+        """The article text sent to the LM, or None if the person of interest is not mentioned."""
+        if self.token_budget is None:
+            return news_article
+        return focus_article(news_article, [person_of_interest], self.token_budget, self.aliases)
+
     def forward(self, news_article: str, person_of_interest: str) -> Classify:
-        return self.classify(news_article=news_article, person_of_interest=person_of_interest)
\ No newline at end of file
+        news_article = self.prepare_article(news_article, person_of_interest)
+        if news_article is None:
+            return not_mentioned(person_of_interest)
+        return self.classify(news_article=news_article, person_of_interest=person_of_interest)
+
+class SubjectSentiment(BaseModel):
+    person_of_interest: str
+    sentiment: Literal['unrelated', 'positive', 'negative']
+    confidence: float
+    reasoning: str
+
+
+class ClassifyMany(dspy.Signature):
+    """
+    Determine for each of the given people of interest if the news article portrays them in a positive or negative light.
+    If a person is not mentioned in the article, classify their sentiment as "unrelated".
+    Return exactly one classification per person of interest, in the order they are given.
+    """
+
+    news_article: str = dspy.InputField()
+    people_of_interest: list[str] = dspy.InputField()
+    classifications: list[SubjectSentiment] = dspy.OutputField()
+
+
+# Appended to instructions carried over from an optimized single-subject program, which only talk about one person
+MANY_SUBJECTS_INSTRUCTIONS = ("Classify each of the given people of interest separately. "
+                              "Return exactly one classification per person of interest, in the order they are given.")
+
+
+def _normalize_subject(subject: str) -> str:
+    return ' '.join(subject.lower().split())
+
+
+def group_demos_by_article(demos: list) -> list[dict]:
+    """Turns single-subject `Classify` demos into `ClassifyMany` demos, one per distinct article."""
+    grouped: dict[str, list] = {}
+    for demo in demos:
+        demo = dict(demo)
+        grouped.setdefault(demo['news_article'], []).append(demo)
+
+    many_demos = []
+    for article, subject_demos in grouped.items():
+        classifications = [
+            SubjectSentiment(person_of_interest=d['person_of_interest'], sentiment=d['sentiment'],
+                             confidence=float(d.get('confidence', 1.0)), reasoning=d.get('reasoning', ''))
+            for d in subject_demos
+        ]
+        many_demos.append({
+            'news_article': article,
+            'people_of_interest': [c.person_of_interest for c in classifications],
+            'reasoning': ' '.join(c.reasoning for c in classifications if c.reasoning),
+            'classifications': classifications,
+        })
+    return many_demos
+
+
+class MultiSubjectClassifier(dspy.Module):
+    """
+    Classify a news article sentiment for several people of interest in a single LM call.
+
+    The article and any few-shot demos are sent once instead of once per person. People the article never
+    mentions are classified "unrelated" without the LM, and the article is cut to the passages about the rest,
+    like `SentimentClassifier` does. Subjects the LM leaves out of its answer are classified with `single`, the
+    one-subject classifier, if it is given.
+    """
+    def __init__(self, single: dspy.Module = None, token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+                 aliases: Optional[dict[str, list[str]]] = None):
+        super().__init__()
+        self.classify = dspy.ChainOfThought(ClassifyMany)
+        self.single = single
+        self.token_budget = token_budget
+        self.aliases = aliases or {}
+
+    @classmethod
+    def from_single(cls, single: dspy.Module) -> 'MultiSubjectClassifier':
+        """
+        Builds a multi-subject classifier reusing the few-shot demos of a compiled `SentimentClassifier`.
+
+        Instructions an optimizer (e.g. MIPROv2) wrote for the single-subject program are carried over too, followed
+        by `MANY_SUBJECTS_INSTRUCTIONS`.
+        """
+        multi = cls(single=single, token_budget=getattr(single, 'token_budget', DEFAULT_TOKEN_BUDGET),
+                    aliases=getattr(single, 'aliases', None))
+        predictors = [predictor for _, predictor in single.named_predictors()]
+        multi.classify.predict.demos = group_demos_by_article([demo for p in predictors for demo in p.demos])
+        optimized = [p.signature.instructions for p in predictors if p.signature.instructions != Classify.instructions]
+        if optimized:
+            signature = multi.classify.predict.signature
+            multi.classify.predict.signature = signature.with_instructions(f'{optimized[0]}\n\n{MANY_SUBJECTS_INSTRUCTIONS}')
+        return multi
+
+    def forward(self, news_article: str, people_of_interest: list[str]) -> dspy.Prediction:
+        """
+        Returns a prediction whose `classifications` holds one `SubjectSentiment` per person of interest,
+        in the same order as `people_of_interest`.
+        """
+        mentioned = list(people_of_interest)
+        focused_article = news_article
+        if self.token_budget is not None:
+            mentioned = [s for s in people_of_interest if mentions(news_article, s, self.aliases.get(s))]
+            if mentioned:
+                focused_article = focus_article(news_article, mentioned, self.token_budget, self.aliases)
+
+        by_subject = {}
+        reasoning = ''
+        if mentioned:
+            resp = self.classify(news_article=focused_article, people_of_interest=mentioned)
+            by_subject = {_normalize_subject(c.person_of_interest): c for c in resp.classifications}
+            reasoning = resp.reasoning
+
+        classifications = []
+        for subject in people_of_interest:
+            if subject not in mentioned:
+                unrelated = not_mentioned(subject)
+                classifications.append(SubjectSentiment(person_of_interest=subject, sentiment=unrelated.sentiment,
+                                                        confidence=unrelated.confidence,
+                                                        reasoning=unrelated.reasoning))
+                continue
+            found = by_subject.get(_normalize_subject(subject))
+            if found is None and self.single is not None:
+                single_resp = self.single(news_article=news_article, person_of_interest=subject)
+                found = SubjectSentiment(person_of_interest=subject, sentiment=single_resp.sentiment,
+                                         confidence=single_resp.confidence, reasoning=single_resp.reasoning)
+            elif found is None:
+                raise ValueError(f"The model did not return a classification for '{subject}'")
+            else:
+                found = found.model_copy(update={'person_of_interest': subject})
+            classifications.append(found)
+
+        return dspy.Prediction(classifications=classifications, reasoning=reasoning)
@@ -0,0 +1,211 @@
+import argparse
+import math
+import re
+from collections import Counter
+from typing import Optional
+
+import dspy
+
+from model.classify import Classify, SentimentClassifier, not_mentioned
+from model.preprocess import estimate_tokens, focus_article, split_sentences
+from model.registry import ArtifactRegistry
+
+# Article tokens kept per demo
+DEFAULT_DEMO_TOKEN_BUDGET = 192
+
+# Demos kept per distinct article. The bootstrapped demos repeat the same article for 4-6 people
+DEFAULT_MAX_PER_ARTICLE = 1
+
+# Demos sent with each call by KNNSentimentClassifier
+DEFAULT_K = 4
+
+_WORD = re.compile(r'\w+')
+
+
+def compact_article(news_article: str, person_of_interest: str, token_budget: int = DEFAULT_DEMO_TOKEN_BUDGET) -> str:
+    """
+    Cuts a demo article down to `token_budget` tokens.
+
+    Keeps the passages about the person of interest. For "unrelated" demos, where the person is never mentioned,
+    the lead sentences are kept instead so the demo still shows an article without them.
+    """
+    focused = focus_article(news_article, [person_of_interest], token_budget)
+    if focused is not None:
+        return focused
+
+    lead: list[str] = []
+    used = 0
+    for sentence in split_sentences(news_article):
+        used += estimate_tokens(sentence)
+        if used > token_budget:
+            break
+        lead.append(sentence)
+    return ' '.join(lead)
+
+
+def compact_demos(demos: list, token_budget: int = DEFAULT_DEMO_TOKEN_BUDGET,
+                  max_per_article: Optional[int] = DEFAULT_MAX_PER_ARTICLE) -> list[dict]:
+    """
+    Compacts few-shot `Classify` demos.
+
+    Demos sharing an article are deduplicated down to `max_per_article`, preferring sentiments that are least
+    represented among the demos kept so far, and every kept article is cut with `compact_article`.
+    """
+    by_article: dict[str, list[dict]] = {}
+    for demo in demos:
+        demo = dict(demo)
+        by_article.setdefault(demo['news_article'], []).append(demo)
+
+    kept: list[dict] = []
+    label_counts: Counter = Counter()
+    for article, article_demos in by_article.items():
+        if max_per_article is not None:
+            article_demos = sorted(article_demos, key=lambda d: label_counts[d['sentiment']])[:max_per_article]
+        for demo in article_demos:
+            label_counts[demo['sentiment']] += 1
+            kept.append({**demo, 'news_article': compact_article(article, demo['person_of_interest'], token_budget)})
+    return kept
+
+
+def compact_program(program: dspy.Module, token_budget: int = DEFAULT_DEMO_TOKEN_BUDGET,
+                    max_per_article: Optional[int] = DEFAULT_MAX_PER_ARTICLE) -> dspy.Module:
+    """Returns a copy of `program` with the demos of every predictor compacted."""
+    compacted = program.deepcopy()
+    for _, predictor in compacted.named_predictors():
+        predictor.demos = compact_demos(predictor.demos, token_budget, max_per_article)
+    return compacted
+
+
+class DemoIndex:
+    """Small TF-IDF index over demos, to pick the demos most similar to a query."""
+
+    def __init__(self, demos: list):
+        self.demos = [dict(d) for d in demos]
+        docs = [self._terms(d['person_of_interest'] + ' ' + d['news_article']) for d in self.demos]
+        document_frequency = Counter(term for doc in docs for term in set(doc))
+        self.idf = {term: math.log((1 + len(docs)) / (1 + df)) + 1 for term, df in document_frequency.items()}
+        self.vectors = [self._vector(doc) for doc in docs]
+
+    @staticmethod
+    def _terms(text: str) -> Counter:
+        return Counter(w.lower() for w in _WORD.findall(text))
+
+    def _vector(self, terms: Counter) -> dict[str, float]:
+        vector = {t: c * self.idf.get(t, 0.0) for t, c in terms.items()}
+        norm = math.sqrt(sum(v * v for v in vector.values())) or 1.0
+        return {t: v / norm for t, v in vector.items() if v}
+
+    def nearest(self, news_article: str, person_of_interest: str, k: int) -> list[dict]:
+        """The `k` demos most similar to the query, most similar last so it sits closest to the query in the prompt."""
+        query = self._vector(self._terms(person_of_interest + ' ' + news_article))
+        scores = [sum(weight * vector.get(t, 0.0) for t, weight in query.items()) for vector in self.vectors]
+        best = sorted(range(len(self.demos)), key=lambda i: scores[i], reverse=True)[:k]
+        return [self.demos[i] for i in reversed(best)]
+
+
+class KNNSentimentClassifier(SentimentClassifier):
+    """
+    `SentimentClassifier` that sends only the `k` saved demos most similar to the query with each call.
+
+    The demos are the ones loaded into the program, ideally already compacted with `compact_program`.
+    """
+    def __init__(self, k: int = DEFAULT_K, **kwargs):
+        super().__init__(**kwargs)
+        self.k = k
+        self._index: Optional[DemoIndex] = None
+        self._indexed_demos = None
+
+    def select_demos(self, news_article: str, person_of_interest: str) -> list[dict]:
+        demos = self.classify.module.predict.demos
+        if self._indexed_demos is not demos:
+            self._index = DemoIndex(demos)
+            self._indexed_demos = demos
+        return self._index.nearest(news_article, person_of_interest, self.k)
+
+    def forward(self, news_article: str, person_of_interest: str) -> Classify:
+        news_article = self.prepare_article(news_article, person_of_interest)
+        if news_article is None:
+            return not_mentioned(person_of_interest)
+        demos = self.select_demos(news_article, person_of_interest)
+        return self.classify(news_article=news_article, person_of_interest=person_of_interest, demos=demos)
+
+
+def prompt_tokens(program: dspy.Module, example: dspy.Example) -> int:
+    """Estimated prompt tokens `program` sends to the LM for `example`, 0 if it answers without the LM."""
+    news_article, person_of_interest = example.news_article, example.person_of_interest
+    predictor = program.classify.module.predict
+    demos = predictor.demos
+    if isinstance(program, SentimentClassifier):
+        news_article = program.prepare_article(news_article, person_of_interest)
+        if news_article is None:
+            return 0
+    if isinstance(program, KNNSentimentClassifier):
+        demos = program.select_demos(news_article, person_of_interest)
+    messages = dspy.ChatAdapter().format(predictor.signature, demos,
+                                         {'news_article': news_article, 'person_of_interest': person_of_interest})
+    return sum(estimate_tokens(m['content']) for m in messages)
+
+
+def load_or_compact(registry: ArtifactRegistry, source_name: str, source: dspy.Module, trainset: list[dspy.Example],
+                    lm: dspy.LM, token_budget: int = DEFAULT_DEMO_TOKEN_BUDGET,
+                    max_per_article: Optional[int] = DEFAULT_MAX_PER_ARTICLE, k: int = DEFAULT_K) -> dspy.Module:
+    """
+    Returns the compacted version of the saved `source_name` program as a `KNNSentimentClassifier`.
+
+    The compacted demos are saved as `<source_name>_compact` in the artifact registry and only rebuilt when the
+    source program or the compaction settings change. A `k` of 0 returns a plain `SentimentClassifier` sending
+    every compacted demo.
+    """
+    name = f'{source_name}_compact'
+    extra = {'source': registry.key_of(source_name), 'token_budget': token_budget, 'max_per_article': max_per_article}
+    program_factory = (lambda: KNNSentimentClassifier(k=k)) if k else SentimentClassifier
+
+    def compile_fn():
+        program = program_factory()
+        program.load_state(source.dump_state())
+        return compact_program(program, token_budget, max_per_article)
+
+    return registry.load_or_compile(name, compile_fn, trainset=trainset, lm=lm, program_factory=program_factory,
+                                    extra=extra)
+
+
+def main():
+    from model.lm import configure_lm
+    from training.training_set import generate_dspy_training_examples, sentiment_match_metric
+
+    parser = argparse.ArgumentParser(description='Compact the few-shot demos of a saved SentimentClassifier.')
+    parser.add_argument('--program', default='bs_fewshot', help='saved program in artifacts.json to compact')
+    parser.add_argument('--token-budget', type=int, default=DEFAULT_DEMO_TOKEN_BUDGET, help='article tokens kept per demo')
+    parser.add_argument('--max-per-article', type=int, default=DEFAULT_MAX_PER_ARTICLE, help='demos kept per distinct article')
+    parser.add_argument('--k', type=int, default=DEFAULT_K, help='demos sent per call, 0 sends all of them')
+    parser.add_argument('--evaluate', action='store_true', help='also compare accuracy on training_set (needs Ollama)')
+    args = parser.parse_args()
+
+    lm = configure_lm()
+    training_set = generate_dspy_training_examples()
+    registry = ArtifactRegistry()
+    source = registry.load_recorded(args.program, program_factory=lambda: SentimentClassifier(token_budget=None))
+    if source is None:
+        raise SystemExit(f"No saved program named '{args.program}' in artifacts.json. Run `uv run python -m model.optimizer` first.")
+
+    candidate = load_or_compact(registry, args.program, source, training_set, lm, args.token_budget,
+                                args.max_per_article, args.k)
+
+    before = [prompt_tokens(source, example) for example in training_set]
+    after = [prompt_tokens(candidate, example) for example in training_set]
+    print(f"demos: {len(source.classify.module.predict.demos)} -> {len(candidate.classify.module.predict.demos)}"
+          f" stored, {args.k or 'all'} sent per call")
+    print(f"mean prompt tokens per example: {sum(before) / len(before):.0f} -> {sum(after) / len(after):.0f}")
+    calls = [t for t in after if t]
+    print(f"mean prompt tokens per LM call: {sum(before) / len(before):.0f} -> {sum(calls) / max(len(calls), 1):.0f}")
+    # Whether it was compiled or loaded is logged by `load_or_compile` above
+    print(f"compacted program: {registry.path_for(args.program + '_compact').name}")
+
+    if args.evaluate:
+        evaluator = dspy.Evaluate(devset=training_set, num_threads=5, display_progress=True)
+        print("accuracy before:", evaluator(source, metric=sentiment_match_metric))
+        print("accuracy after:", evaluator(candidate, metric=sentiment_match_metric))
+
+
+if __name__ == "__main__":
+    main()
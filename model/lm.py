@@ -0,0 +1,22 @@
+import os
+
+import dspy
+
+# Ollama serves llama3.2 locally. OLLAMA_NUM_PARALLEL is the same variable the Ollama server reads to decide
+# how many requests it runs at once, so callers fanning out requests should stay at or below it
+LM_MODEL = 'ollama_chat/llama3.2:latest'
+LM_API_BASE = 'http://localhost:11434'
+OLLAMA_NUM_PARALLEL = int(os.environ.get('OLLAMA_NUM_PARALLEL', '4'))
+
+
+def build_lm(api_base: str = LM_API_BASE) -> dspy.LM:
+    """Builds the LM every entry point classifies with. `api_base` can point it at another Ollama compatible server."""
+    return dspy.LM(LM_MODEL, api_base=api_base, api_key='', cache=False, temperature=0.1, max_tokens=4096)
+
+
+def configure_lm(api_base: str = LM_API_BASE) -> dspy.LM:
+    """Builds the LM, makes it the default for all dspy modules and turns on usage tracking."""
+    lm = build_lm(api_base)
+    dspy.configure(lm=lm)
+    dspy.settings.configure(track_usage=True)
+    return lm
@@ -0,0 +1,449 @@
+import argparse
+import hashlib
+import json
+import multiprocessing
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Callable, Optional
+
+import dspy
+
+from model.classify import Classify, SentimentClassifier
+from model.lm import LM_API_BASE, OLLAMA_NUM_PARALLEL, configure_lm
+from model.prediction_cache import program_identity
+from model.registry import ArtifactRegistry, artifact_key, lm_fingerprint, signature_fingerprint, trainset_fingerprint
+from storage.sqlite import cache_path, connect
+from training.training_set import generate_dspy_training_examples, sentiment_match_metric
+
+DEFAULT_STORE_PATH = cache_path('optimizer.sqlite')
+
+# BootstrapFewShot's defaults
+MAX_BOOTSTRAPPED_DEMOS = 4
+MAX_LABELED_DEMOS = 16
+
+# Like BootstrapFewShot, bootstrapping gives up after this many examples raised
+MAX_ERRORS = 5
+
+# The teacher that runs the training examples. A zero-shot teacher does not depend on the training set, so its traces
+# stay valid when examples are added; BootstrapFewShot's default teacher has labeled demos sampled from the training set
+DEFAULT_TEACHER = 'zero_shot'
+
+# Instruction candidates tried for zero_shot_miprov2, the Classify instructions included. MIPROv2(auto='light')
+# proposes 7 for a single predictor
+DEFAULT_CANDIDATES = 7
+
+# Temperature the instruction proposer samples at, MIPROv2's default
+PROPOSER_TEMPERATURE = 0.5
+
+STAGES = ('bootstrap', 'miprov2')
+
+
+def example_hash(record: dict) -> str:
+    blob = json.dumps(record, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+def example_from_record(record: dict) -> dspy.Example:
+    return dspy.Example(**record['data']).with_inputs(*record['inputs'])
+
+
+class OptimizerStore:
+    """
+    On-disk record of the optimizer's LM work, so no trace or score is ever paid for twice.
+
+    Bootstrap traces are keyed by (teacher program, example) and candidate scores by (candidate program, example),
+    both as hashes, and proposed instructions by the proposal settings. Backed by SQLite in WAL mode like the
+    prediction cache, and every result is committed as soon as it arrives so an interrupted run resumes where it
+    stopped.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+        self._conn = connect(path, ["""
+            CREATE TABLE IF NOT EXISTS traces (
+                program TEXT NOT NULL,
+                example TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (program, example)
+            )
+        """, """
+            CREATE TABLE IF NOT EXISTS evaluations (
+                program TEXT NOT NULL,
+                example TEXT NOT NULL,
+                score REAL NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (program, example)
+            )
+        """, """
+            CREATE TABLE IF NOT EXISTS proposals (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """])
+
+    def _select(self, table: str, column: str, program: str, examples: list[str]) -> dict[str, object]:
+        rows = self._conn.execute(f'SELECT example, {column} FROM {table} WHERE program = ?', (program,)).fetchall()
+        wanted = set(examples)
+        return {example: value for example, value in rows if example in wanted}
+
+    def get_traces(self, program: str, examples: list[str]) -> dict[str, dict]:
+        with self._lock:
+            found = self._select('traces', 'value', program, examples)
+        self.counters['traces_reused'] += len(found)
+        return {example: json.loads(value) for example, value in found.items()}
+
+    def put_trace(self, program: str, example: str, value: dict) -> None:
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO traces (program, example, value, created_at) VALUES (?, ?, ?, ?)',
+                               (program, example, json.dumps(value, ensure_ascii=False, default=str), time.time()))
+            self._conn.commit()
+            self.counters['traces_run'] += 1
+
+    def get_scores(self, program: str, examples: list[str]) -> dict[str, float]:
+        with self._lock:
+            found = self._select('evaluations', 'score', program, examples)
+        self.counters['scores_reused'] += len(found)
+        return found
+
+    def put_score(self, program: str, example: str, score: float) -> None:
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO evaluations (program, example, score, created_at) VALUES (?, ?, ?, ?)',
+                               (program, example, score, time.time()))
+            self._conn.commit()
+            self.counters['scores_run'] += 1
+
+    def get_proposals(self, key: str) -> Optional[list[str]]:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM proposals WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_proposals(self, key: str, instructions: list[str]) -> None:
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO proposals (key, value, created_at) VALUES (?, ?, ?)',
+                               (key, json.dumps(instructions, ensure_ascii=False), time.time()))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            for table in ('traces', 'evaluations', 'proposals'):
+                self._conn.execute(f'DELETE FROM {table}')
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """Reused/run counters of this process, and the stored rows per table."""
+        with self._lock:
+            rows = {table: self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                    for table in ('traces', 'evaluations', 'proposals')}
+        return {'traces_reused': 0, 'traces_run': 0, 'scores_reused': 0, 'scores_run': 0, **self.counters, **rows}
+
+
+# Programs a worker process has built, by program identity, so each is only loaded once per worker
+_worker_programs: dict[str, dspy.Module] = {}
+
+
+def _init_worker(api_base: str) -> None:
+    configure_lm(api_base)
+
+
+def _worker_program(program_id: str, state: dict) -> dspy.Module:
+    if program_id not in _worker_programs:
+        program = SentimentClassifier()
+        program.load_state(state)
+        _worker_programs[program_id] = program
+    return _worker_programs[program_id]
+
+
+def _trace_example(program_id: str, state: dict, record: dict) -> dict:
+    """Runs the teacher on one training example, like `BootstrapFewShot._bootstrap_one_example`."""
+    teacher = _worker_program(program_id, state)
+    example = example_from_record(record)
+    names = {id(predictor): name for name, predictor in teacher.named_predictors()}
+
+    # The teacher must not see the example it is answering among its demos
+    saved_demos = {name: predictor.demos for name, predictor in teacher.named_predictors()}
+    for _, predictor in teacher.named_predictors():
+        predictor.demos = [d for d in predictor.demos if dict(d) != record['data']]
+    try:
+        with dspy.settings.context(trace=[]):
+            prediction = teacher(**example.inputs())
+            trace = dspy.settings.trace
+    finally:
+        for name, predictor in teacher.named_predictors():
+            predictor.demos = saved_demos[name]
+
+    success = bool(sentiment_match_metric(example, prediction, trace))
+    demos = {}
+    if success:
+        for predictor, inputs, outputs in trace:
+            if id(predictor) in names:
+                # SentimentClassifier calls its predictor once, so this is the one demo per predictor BootstrapFewShot keeps
+                demos[names[id(predictor)]] = {'augmented': True, **inputs, **dict(outputs.items())}
+    return {'success': success, 'demos': demos}
+
+
+def _score_example(program_id: str, state: dict, record: dict) -> float:
+    program = _worker_program(program_id, state)
+    example = example_from_record(record)
+    return float(sentiment_match_metric(example, program(**example.inputs())))
+
+
+def run_jobs(pool: Executor, fn: Callable, jobs: list[tuple], on_result: Callable[[tuple, object], None]) -> int:
+    """Runs `fn(*job)` for each job in the pool and hands results to `on_result` as they finish. Returns the failures."""
+    futures = {pool.submit(fn, *job): job for job in jobs}
+    failures = 0
+    for future in as_completed(futures):
+        try:
+            result = future.result()
+        except Exception as e:
+            failures += 1
+            print(f"{fn.__name__} failed: {e}")
+            continue
+        on_result(futures[future], result)
+    return failures
+
+
+def make_teacher(teacher: str, registry: ArtifactRegistry) -> dspy.Module:
+    if teacher == 'zero_shot':
+        return SentimentClassifier()
+    program = registry.load_recorded(teacher)
+    if program is None:
+        raise SystemExit(f"No saved program named '{teacher}' in artifacts.json to use as the teacher")
+    return program
+
+
+def bootstrap(trainset: list[dspy.Example], teacher: dspy.Module, lm: dspy.LM, store: OptimizerStore, pool: Executor,
+              workers: int, max_bootstrapped_demos: int = MAX_BOOTSTRAPPED_DEMOS,
+              max_labeled_demos: int = MAX_LABELED_DEMOS) -> SentimentClassifier:
+    """
+    Compiles a `SentimentClassifier` the way `BootstrapFewShot` does, with the teacher traces kept in `store`.
+
+    Examples are traced in training set order, `workers` at a time, until `max_bootstrapped_demos` of them pass the
+    metric. The demos are the bootstrapped traces followed by labeled examples sampled from the rest, with the same
+    seeded sampling as `BootstrapFewShot._train`, so the same traces give the same program.
+    """
+    teacher_id = program_identity(teacher, lm)
+    state = teacher.dump_state()
+    records = trainset_fingerprint(trainset)
+    hashes = [example_hash(record) for record in records]
+    traces = store.get_traces(teacher_id, hashes)
+    errored: set[int] = set()
+
+    def settled() -> tuple[list[int], Optional[int]]:
+        """The bootstrapped example indices so far, and the first example still needing a trace, if any."""
+        bootstrapped = []
+        for i, h in enumerate(hashes):
+            if len(bootstrapped) >= max_bootstrapped_demos:
+                break
+            if i in errored:
+                continue
+            if h not in traces:
+                return bootstrapped, i
+            # Examples answered without the LM ("unrelated", person never mentioned) leave no demos to keep
+            if traces[h]['success'] and traces[h]['demos']:
+                bootstrapped.append(i)
+        return bootstrapped, None
+
+    def record_trace(job: tuple, value: dict) -> None:
+        h = example_hash(job[2])
+        store.put_trace(teacher_id, h, value)
+        traces[h] = value
+
+    while True:
+        bootstrapped, missing = settled()
+        if missing is None:
+            break
+        batch = [i for i in range(missing, len(trainset)) if hashes[i] not in traces and i not in errored][:workers]
+        run_jobs(pool, _trace_example, [(teacher_id, state, records[i]) for i in batch], record_trace)
+        errored.update(i for i in batch if hashes[i] not in traces)
+        if len(errored) >= MAX_ERRORS:
+            raise RuntimeError(f"Bootstrapping gave up after {len(errored)} examples failed")
+
+    print(f"Bootstrapped {len(bootstrapped)} traces ({store.counters['traces_reused']} traces reused, "
+          f"{store.counters['traces_run']} run)")
+
+    student = SentimentClassifier()
+    validation = [example for i, example in enumerate(trainset) if i not in bootstrapped]
+    random.Random(0).shuffle(validation)
+    rng = random.Random(0)
+    for name, predictor in student.named_predictors():
+        augmented = [dspy.Example(**traces[hashes[i]]['demos'][name]) for i in bootstrapped
+                     if name in traces[hashes[i]]['demos']][:max_bootstrapped_demos]
+        sample_size = max(0, min(max_labeled_demos - len(augmented), len(validation)))
+        validation = rng.sample(validation, sample_size)
+        predictor.demos = augmented + validation
+    return student
+
+
+def with_instructions(instructions: str) -> SentimentClassifier:
+    program = SentimentClassifier()
+    for predictor in program.predictors():
+        predictor.signature = predictor.signature.with_instructions(instructions)
+    return program
+
+
+def propose_instructions(program: dspy.Module, trainset: list[dspy.Example], demos: list[dict], lm: dspy.LM,
+                         store: OptimizerStore, n: int, seed: int = 0) -> list[str]:
+    """
+    `n` instruction candidates for `Classify` written by MIPROv2's grounded proposer, kept in `store`.
+
+    Proposals are keyed by the signature, the LM, `n` and `seed` but not the training set, so adding examples does
+    not pay for new ones. Pass another `seed` to propose a fresh set.
+    """
+    key = hashlib.sha256(json.dumps({'signature': signature_fingerprint(Classify), 'lm': lm_fingerprint(lm), 'n': n,
+                                     'seed': seed}, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    instructions = store.get_proposals(key)
+    if instructions is not None:
+        return instructions
+
+    from dspy.propose import GroundedProposer
+
+    # One demo set per proposal, for the proposer to ground the instructions in, as MIPROv2 does
+    demo_sets = []
+    for i in range(n):
+        demo_set = [dspy.Example(**demo) for demo in demos]
+        random.Random(seed + i).shuffle(demo_set)
+        demo_sets.append(demo_set[:MAX_BOOTSTRAPPED_DEMOS])
+    proposer = GroundedProposer(prompt_model=lm, program=program, trainset=trainset, use_instruct_history=False,
+                                set_history_randomly=False, rng=random.Random(seed))
+    proposed = proposer.propose_instructions_for_program(trainset=trainset, program=program,
+                                                         demo_candidates={0: demo_sets}, trial_logs={}, N=n,
+                                                         T=PROPOSER_TEMPERATURE)
+    instructions = list(dict.fromkeys(str(i).strip() for i in proposed[0]))
+    store.put_proposals(key, instructions)
+    return instructions
+
+
+def evaluate_candidates(candidates: list[dspy.Module], trainset: list[dspy.Example], lm: dspy.LM,
+                        store: OptimizerStore, pool: Executor) -> list[float]:
+    """
+    Mean `sentiment_match_metric` of each candidate over `trainset`.
+
+    Only the (candidate, example) pairs missing from `store` are run, across the process pool. Calls that raise
+    count as 0 like in `dspy.Evaluate`, and are not stored so the next run retries them.
+    """
+    records = trainset_fingerprint(trainset)
+    hashes = [example_hash(record) for record in records]
+    ids = [program_identity(candidate, lm) for candidate in candidates]
+    scores = {program_id: store.get_scores(program_id, hashes) for program_id in ids}
+
+    jobs = [(program_id, candidate.dump_state(), record)
+            for program_id, candidate in zip(ids, candidates)
+            for record, h in zip(records, hashes) if h not in scores[program_id]]
+
+    def record_score(job: tuple, score: float) -> None:
+        h = example_hash(job[2])
+        store.put_score(job[0], h, score)
+        scores[job[0]][h] = score
+
+    run_jobs(pool, _score_example, jobs, record_score)
+    print(f"Evaluated {len(candidates)} candidates ({store.counters['scores_reused']} scores reused, "
+          f"{store.counters['scores_run']} run)")
+    return [sum(scores[program_id].get(h, 0.0) for h in hashes) / len(hashes) for program_id in ids]
+
+
+def artifact_keys(trainset: list[dspy.Example], lm: dspy.LM, teacher: str = DEFAULT_TEACHER,
+                  candidates: int = DEFAULT_CANDIDATES, seed: int = 0,
+                  registry: Optional[ArtifactRegistry] = None) -> dict[str, str]:
+    """
+    The artifact keys the pipeline saves `bs_fewshot` and `zero_shot_miprov2` under for these settings.
+
+    With the default settings they are the keys `ArtifactRegistry.load_or_compile` records the programs under, so
+    programs saved either way stay valid. Other settings are added to the keys.
+    """
+    registry = registry or ArtifactRegistry()
+    bs_extra = None
+    if teacher != DEFAULT_TEACHER:
+        bs_extra = {'teacher': teacher if teacher == 'zero_shot' else registry.key_of(teacher)}
+    bs_key = artifact_key('bs_fewshot', Classify, trainset, lm, extra=bs_extra)
+    miprov2_extra = {'teacher': bs_key}
+    if (candidates, seed) != (DEFAULT_CANDIDATES, 0):
+        miprov2_extra.update(candidates=candidates, seed=seed)
+    miprov2_key = artifact_key('zero_shot_miprov2', Classify, trainset, lm, extra=miprov2_extra)
+    return {'bs_fewshot': bs_key, 'zero_shot_miprov2': miprov2_key}
+
+
+def load_optimized(registry: ArtifactRegistry, name: str, trainset: list[dspy.Example],
+                   lm: dspy.LM) -> Optional[dspy.Module]:
+    """
+    Loads the saved `name` program for serving without ever compiling it.
+
+    A program saved for another training set, signature or LM is still returned, with a reminder to rerun the
+    optimizer. Returns None if nothing was saved yet.
+    """
+    program = registry.load(name, artifact_keys(trainset, lm, registry=registry)[name])
+    if program is not None:
+        print(f"Loaded saved program '{name}'")
+        return program
+    program = registry.load_recorded(name)
+    print(f"Saved program '{name}' is {'out of date' if program is not None else 'missing'}, "
+          f"run `uv run python -m model.optimizer` to optimize it")
+    return program
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Optimize the classifier programs, resuming from the traces and scores saved in .cache/optimizer.sqlite.')
+    parser.add_argument('--stages', default=','.join(STAGES), help='comma separated, bootstrap and/or miprov2')
+    parser.add_argument('--workers', type=int, default=OLLAMA_NUM_PARALLEL, help='worker processes making LM calls')
+    parser.add_argument('--teacher', default=DEFAULT_TEACHER, help="'zero_shot' or a saved program to bootstrap traces with")
+    parser.add_argument('--candidates', type=int, default=DEFAULT_CANDIDATES, help='instruction candidates for miprov2')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the instruction proposals')
+    parser.add_argument('--api-base', default=LM_API_BASE, help='Ollama server')
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH, help='trace and score store')
+    parser.add_argument('--no-save', action='store_true', help="don't save the optimized programs")
+    parser.add_argument('--stats', action='store_true', help='print the store contents and exit')
+    parser.add_argument('--clear', action='store_true', help='delete every stored trace, score and proposal and exit')
+    args = parser.parse_args()
+
+    store = OptimizerStore(args.store)
+    if args.stats or args.clear:
+        if args.clear:
+            store.clear()
+        print(json.dumps(store.stats(), indent=2))
+        return
+
+    stages = args.stages.split(',')
+    lm = configure_lm(args.api_base)
+    trainset = generate_dspy_training_examples()
+    registry = ArtifactRegistry()
+    keys = artifact_keys(trainset, lm, args.teacher, args.candidates, args.seed, registry)
+
+    # Spawned rather than forked, since litellm and dspy start threads at import
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_worker, initargs=(args.api_base,)) as pool:
+        student = None
+        if 'bootstrap' in stages:
+            student = bootstrap(trainset, make_teacher(args.teacher, registry), lm, store, pool, args.workers)
+            if not args.no_save:
+                print(f"Saved 'bs_fewshot' to {registry.save('bs_fewshot', keys['bs_fewshot'], student)}")
+
+        if 'miprov2' in stages:
+            student = student or registry.load_recorded('bs_fewshot') or SentimentClassifier()
+            demos = [dict(demo) for _, predictor in student.named_predictors() for demo in predictor.demos
+                     if demo.get('augmented')]
+            instructions = [Classify.instructions] + [
+                i for i in propose_instructions(SentimentClassifier(), trainset, demos, lm, store, args.candidates - 1,
+                                                args.seed) if i and i != Classify.instructions]
+            candidates = [with_instructions(i) for i in instructions]
+            scores = evaluate_candidates(candidates, trainset, lm, store, pool)
+            for i, (instruction, score) in enumerate(zip(instructions, scores)):
+                print(f"{score:.3f}  [{i}] {' '.join(instruction.split())[:100]}")
+            # Ties go to the earlier candidate, so the Classify instructions win unless beaten
+            best = max(range(len(candidates)), key=lambda i: (scores[i], -i))
+            print(f"Best candidate: [{best}] with {scores[best]:.3f}")
+            if not args.no_save:
+                path = registry.save('zero_shot_miprov2', keys['zero_shot_miprov2'], candidates[best])
+                print(f"Saved 'zero_shot_miprov2' to {path}")
+
+    print(json.dumps(store.stats()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+import dspy
+
+from model.classify import SubjectSentiment
+from model.registry import lm_fingerprint
+from storage.sqlite import cache_path, connect, eviction_target
+
+DEFAULT_CACHE_PATH = cache_path('predictions.sqlite')
+
+# Least recently used predictions are evicted past this many entries
+DEFAULT_MAX_ENTRIES = 50_000
+
+# Output fields of Classify that are stored for a cached prediction
+CACHED_FIELDS = ('sentiment', 'confidence', 'reasoning')
+
+
+def normalize_article(news_article: str) -> str:
+    return ' '.join(news_article.split())
+
+
+def normalize_subject(person_of_interest: str) -> str:
+    return ' '.join(person_of_interest.casefold().split())
+
+
+def _describe(module: dspy.Module, path: str = 'self') -> dict[str, dict]:
+    """
+    The class and settings of `module` and of every module under it, by attribute path, with the saved state
+    (instructions and demos) of each predictor.
+
+    Wrappers with a true `transparent` attribute only change how the program inside them is run, so they are skipped
+    and a wrapped program is described exactly like the program itself.
+    """
+    while getattr(module, 'transparent', False):
+        module = module.program
+    node = {'class': f'{type(module).__module__}.{type(module).__qualname__}'}
+    if isinstance(module, dspy.Predict):
+        node['state'] = module.dump_state()
+    else:
+        node['settings'] = {k: v for k, v in vars(module).items()
+                            if isinstance(v, (int, float, str, dict)) and not k.startswith('_')}
+    described = {path: node}
+    for name, value in vars(module).items():
+        if isinstance(value, dspy.Module) and not name.startswith('_'):
+            described.update(_describe(value, f'{path}.{name}'))
+    return described
+
+
+def program_identity(program: dspy.Module, lm: dspy.LM) -> str:
+    """
+    Hash identifying what a program would answer: the class and settings (e.g. `token_budget`, `k`) of it and of
+    every module inside it, the saved state of its predictors and the LM config. Loading a different optimized
+    program, changing a setting or changing the LM gives a new identity.
+    """
+    payload = {
+        'modules': _describe(program),
+        'lm': lm_fingerprint(lm),
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+def prediction_key(news_article: str, person_of_interest: str, program_id: str) -> str:
+    article_hash = hashlib.sha256(normalize_article(news_article).encode('utf-8')).hexdigest()
+    return hashlib.sha256(f'{program_id}\0{article_hash}\0{normalize_subject(person_of_interest)}'.encode('utf-8')).hexdigest()
+
+
+class PredictionCache:
+    """
+    On-disk cache of classifier outputs, keyed by `prediction_key`.
+
+    Backed by SQLite in WAL mode so several processes can share it, and guarded by a lock so threads can share one
+    instance. Least recently used entries are evicted past `max_entries`.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+        self._conn = connect(path, ["""
+            CREATE TABLE IF NOT EXISTS predictions (
+                key TEXT PRIMARY KEY,
+                program TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """, 'CREATE INDEX IF NOT EXISTS predictions_accessed_at ON predictions (accessed_at)',
+            'CREATE INDEX IF NOT EXISTS predictions_program ON predictions (program)'])
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM predictions WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.counters['misses'] += 1
+                return None
+            self.counters['hits'] += 1
+            self._conn.execute('UPDATE predictions SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, program_id: str, value: dict) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO predictions (key, program, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                (key, program_id, json.dumps(value, ensure_ascii=False), now, now))
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        count = self._conn.execute('SELECT COUNT(*) FROM predictions').fetchone()[0]
+        excess = eviction_target(count, self.max_entries)
+        if not excess:
+            return
+        self._conn.execute('DELETE FROM predictions WHERE key IN '
+                           '(SELECT key FROM predictions ORDER BY accessed_at LIMIT ?)', (excess,))
+        self.counters['evictions'] += excess
+
+    def invalidate(self, program_id: Optional[str] = None) -> int:
+        """Deletes every cached prediction, or only those of one program identity (a prefix is enough)."""
+        with self._lock:
+            if program_id is None:
+                deleted = self._conn.execute('DELETE FROM predictions').rowcount
+            else:
+                deleted = self._conn.execute('DELETE FROM predictions WHERE program LIKE ?',
+                                             (program_id + '%',)).rowcount
+            self._conn.commit()
+        return deleted
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters of this process, and the number of entries per program identity."""
+        with self._lock:
+            programs = dict(self._conn.execute('SELECT program, COUNT(*) FROM predictions GROUP BY program').fetchall())
+            counters = dict(self.counters)
+        return {'hits': 0, 'misses': 0, 'evictions': 0, **counters, 'entries': sum(programs.values()),
+                'programs': programs}
+
+
+class CachedClassifier(dspy.Module):
+    """
+    Serves repeated (article, person of interest) queries from a `PredictionCache` in front of `program`.
+
+    `program` is a `SentimentClassifier`, `dspy.Predict(Classify)` or anything with the same inputs and outputs.
+    Entries are keyed by the normalized article text, the normalized person of interest and the
+    `program_identity` of the program and LM, so a newly loaded program never sees stale answers.
+    """
+    def __init__(self, program: dspy.Module, lm: dspy.LM, cache: Optional[PredictionCache] = None):
+        super().__init__()
+        self.program = program
+        self.cache = cache or PredictionCache()
+        self.program_id = program_identity(program, lm)
+
+    def forward(self, news_article: str, person_of_interest: str) -> dspy.Prediction:
+        key = prediction_key(news_article, person_of_interest, self.program_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return dspy.Prediction(**cached)
+
+        resp = self.program(news_article=news_article, person_of_interest=person_of_interest)
+        self.cache.put(key, self.program_id, {field: resp[field] for field in CACHED_FIELDS})
+        return resp
+
+
+class CachedMultiClassifier(dspy.Module):
+    """
+    Serves each (article, person of interest) pair of a `MultiSubjectClassifier` query from a `PredictionCache`.
+
+    Every person of interest is looked up on its own, and only the ones missing from the cache are sent to `program`
+    in one call, so a query overlapping an earlier one pays only for the new people. Entries are keyed like
+    `CachedClassifier`'s, with the `program_identity` of the multi-subject program.
+    """
+    def __init__(self, program: dspy.Module, lm: dspy.LM, cache: Optional[PredictionCache] = None):
+        super().__init__()
+        self.program = program
+        self.cache = cache or PredictionCache()
+        self.program_id = program_identity(program, lm)
+
+    def forward(self, news_article: str, people_of_interest: list[str]) -> dspy.Prediction:
+        keys = [prediction_key(news_article, subject, self.program_id) for subject in people_of_interest]
+        found = {key: self.cache.get(key) for key in dict.fromkeys(keys)}
+        misses = {key: subject for subject, key in zip(people_of_interest, keys) if found[key] is None}
+
+        resp = None
+        if misses:
+            resp = self.program(news_article=news_article, people_of_interest=list(misses.values()))
+            for key, classification in zip(misses, resp.classifications):
+                found[key] = {field: getattr(classification, field) for field in CACHED_FIELDS}
+                self.cache.put(key, self.program_id, found[key])
+
+        classifications = [SubjectSentiment(person_of_interest=subject, **found[key])
+                           for subject, key in zip(people_of_interest, keys)]
+        pred = dspy.Prediction(classifications=classifications, reasoning=resp.reasoning if resp is not None else '')
+        if resp is not None:
+            pred.set_lm_usage(resp.get_lm_usage())
+        return pred
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or invalidate the prediction cache.')
+    parser.add_argument('command', choices=['stats', 'clear'])
+    parser.add_argument('--program', default=None, help='only clear entries of this program identity (or prefix)')
+    parser.add_argument('--path', default=DEFAULT_CACHE_PATH, help='cache file')
+    args = parser.parse_args()
+
+    cache = PredictionCache(args.path)
+    if args.command == 'clear':
+        print(f"Deleted {cache.invalidate(args.program)} cached predictions")
+    else:
+        print(json.dumps(cache.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import re
+from typing import Optional
+
+# Prompt budget for the article passages, in llama3.2 tokens
+DEFAULT_TOKEN_BUDGET = 1024
+
+# Sentences kept on each side of a sentence mentioning the person of interest
+CONTEXT_SENTENCES = 1
+
+# Rough characters per token for English news text, good enough for budgeting without a tokenizer
+CHARS_PER_TOKEN = 4
+
+# Sentence ends, including the "down.Conservative" joins left behind by scraping paragraphs without separators
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s*(?=[A-Z"“‘])|(?<=[.!?]["”’])\s*(?=[A-Z"“‘])|\n+')
+
+# Name parts too common to identify a person on their own
+_WEAK_NAME_PARTS = {'jr', 'sr', 'ii', 'iii', 'mr', 'mrs', 'ms', 'dr', 'the', 'of', 'de', 'van', 'von'}
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def split_sentences(text: str) -> list[str]:
+    return [s.strip() for s in _SENTENCE_BOUNDARY.split(text) if s and s.strip()]
+
+
+def subject_aliases(person_of_interest: str, aliases: Optional[list[str]] = None) -> list[str]:
+    """
+    Names the person of interest may be referred to by in an article.
+
+    The full name, the surname (last name part) and any extra `aliases`, e.g. ["PM", "Poilievre's party"].
+    """
+    names = [person_of_interest.strip()]
+    parts = [p for p in re.split(r'\s+', person_of_interest.strip()) if p]
+    if len(parts) > 1 and parts[-1].lower().strip('.') not in _WEAK_NAME_PARTS and len(parts[-1]) > 2:
+        names.append(parts[-1])
+    names.extend(aliases or [])
+    return [n for n in dict.fromkeys(names) if n]
+
+
+def _mention_pattern(names: list[str]) -> re.Pattern:
+    alternatives = '|'.join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+    return re.compile(rf'(?<!\w)(?:{alternatives})(?!\w)', re.IGNORECASE)
+
+
+def mentions(article: str, person_of_interest: str, aliases: Optional[list[str]] = None) -> bool:
+    """True if the article mentions the person of interest or one of their aliases."""
+    if not person_of_interest.strip():
+        return True
+    return _mention_pattern(subject_aliases(person_of_interest, aliases)).search(article) is not None
+
+
+def focus_article(news_article: str, people_of_interest: list[str], token_budget: int = DEFAULT_TOKEN_BUDGET,
+                  aliases: Optional[dict[str, list[str]]] = None) -> Optional[str]:
+    """
+    Cuts an article down to the passages about the people of interest.
+
+    Keeps every sentence mentioning one of them, by name, surname or alias, together with `CONTEXT_SENTENCES`
+    sentences on each side, in article order. Passages are added until `token_budget` is reached; gaps between
+    passages are marked with "...".
+
+    Args:
+        news_article (str): The full article text.
+        people_of_interest (list[str]): The people the passages should be about.
+        token_budget (int): Most tokens of article text to keep.
+        aliases (dict[str, list[str]]): Other names each person of interest goes by.
+
+    Returns:
+        Optional[str]: The focused article, or None if none of the people of interest is mentioned. Without a
+        person of interest, e.g. for article-level sentiment, the start of the article is kept.
+    """
+    aliases = aliases or {}
+    budget_chars = token_budget * CHARS_PER_TOKEN
+    names = [name for person in people_of_interest for name in subject_aliases(person, aliases.get(person))]
+    if not names:
+        return news_article[:budget_chars]
+    pattern = _mention_pattern(names)
+    sentences = split_sentences(news_article)
+    hits = [i for i, sentence in enumerate(sentences) if pattern.search(sentence)]
+    if not hits:
+        return None
+
+    keep: list[int] = []
+    used = 0
+    # Mentioning sentences go in first so context sentences never crowd them out of the budget
+    candidates = hits + [j for i in hits for j in range(i - CONTEXT_SENTENCES, i + CONTEXT_SENTENCES + 1)
+                         if 0 <= j < len(sentences) and j != i]
+    for i in dict.fromkeys(candidates):
+        cost = len(sentences[i]) + 1
+        if used + cost > budget_chars:
+            if not keep:
+                # A single mention longer than the budget is cut rather than dropped
+                return sentences[i][:budget_chars]
+            continue
+        keep.append(i)
+        used += cost
+
+    passages: list[str] = []
+    previous = None
+    for i in sorted(keep):
+        if previous is not None and i != previous + 1:
+            passages.append('...')
+        passages.append(sentences[i])
+        previous = i
+    return ' '.join(passages)
@@ -0,0 +1,160 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Optional
+
+import dspy
+
+from model.classify import Classify, SentimentClassifier
+
+# Saved programs live next to main.py so the existing optimized_classifier_*.json files are picked up as-is
+ARTIFACT_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_NAME = 'artifacts.json'
+
+# LM kwargs that do not change what the model generates: credentials and the server endpoint, so pointing a replica
+# at another Ollama host keeps every artifact, cached prediction and optimizer trace valid
+_IGNORED_LM_KWARGS = {'api_key', 'api_base'}
+
+
+def signature_fingerprint(signature: type[dspy.Signature]) -> dict:
+    """Instructions, prefixes, descriptions and field types of a signature."""
+    state = signature.dump_state()
+    state['types'] = {name: str(field.annotation) for name, field in signature.fields.items()}
+    return state
+
+
+def trainset_fingerprint(trainset: list[dspy.Example]) -> list[dict]:
+    """Plain-dict view of the training examples, including which keys are inputs."""
+    return [{'data': example.toDict(), 'inputs': sorted(example.inputs().keys())} for example in trainset]
+
+
+def lm_fingerprint(lm: dspy.LM) -> dict:
+    """The model name and generation settings of an LM, without credentials."""
+    kwargs = {k: v for k, v in lm.kwargs.items() if k not in _IGNORED_LM_KWARGS}
+    return {'model': lm.model, 'model_type': lm.model_type, 'kwargs': kwargs}
+
+
+def artifact_key(name: str, signature: type[dspy.Signature], trainset: list[dspy.Example], lm: dspy.LM,
+                 extra: Optional[dict] = None) -> str:
+    """
+    Computes the cache key for a compiled program.
+
+    The key is a sha256 over the artifact name, the signature, the training set, the LM config and any
+    optimizer specific settings passed through `extra`. If any of them change, the saved program is stale.
+    """
+    payload = {
+        'name': name,
+        'signature': signature_fingerprint(signature),
+        'trainset': trainset_fingerprint(trainset),
+        'lm': lm_fingerprint(lm),
+        'extra': extra or {},
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+class ArtifactRegistry:
+    """
+    Keeps track of the optimized programs saved on disk.
+
+    `artifacts.json` maps an artifact name (e.g. `bs_fewshot`) to the state file holding the compiled
+    `SentimentClassifier` and the key it was compiled for. Loading only recompiles when the key changed
+    or the state file is missing, so restarts don't pay for optimization again.
+    """
+
+    def __init__(self, root: Path = ARTIFACT_DIR, manifest_name: str = MANIFEST_NAME):
+        self.root = Path(root)
+        self.manifest_path = self.root / manifest_name
+
+    def _read_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, 'r') as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest: dict) -> None:
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.write('\n')
+        tmp_path.replace(self.manifest_path)
+
+    def path_for(self, name: str) -> Path:
+        return self.root / f'optimized_classifier_{name}.json'
+
+    def key_of(self, name: str) -> Optional[str]:
+        """Returns the key the saved `name` artifact was compiled for, if any."""
+        return self._read_manifest().get(name, {}).get('key')
+
+    def load(self, name: str, key: str,
+             program_factory: Callable[[], dspy.Module] = SentimentClassifier) -> Optional[dspy.Module]:
+        """Loads the saved `name` artifact if it was compiled for `key`, otherwise returns None."""
+        entry = self._read_manifest().get(name)
+        if not entry or entry.get('key') != key:
+            return None
+        path = self.root / entry['path']
+        if not path.exists():
+            return None
+        program = program_factory()
+        program.load(str(path))
+        return program
+
+    def load_recorded(self, name: str,
+                      program_factory: Callable[[], dspy.Module] = SentimentClassifier) -> Optional[dspy.Module]:
+        """Loads whatever state is recorded for `name` without checking its key, for offline jobs."""
+        entry = self._read_manifest().get(name)
+        if not entry:
+            return None
+        return self.load(name, entry['key'], program_factory)
+
+    def save(self, name: str, key: str, program: dspy.Module) -> Path:
+        """Saves the program state and records `key` for it in the manifest."""
+        path = self.path_for(name)
+        program.save(str(path))
+        manifest = self._read_manifest()
+        manifest[name] = {'path': path.name, 'key': key}
+        self._write_manifest(manifest)
+        return path
+
+    def load_or_compile(self, name: str, compile_fn: Callable[[], dspy.Module], trainset: list[dspy.Example],
+                        lm: dspy.LM, signature: type[dspy.Signature] = Classify,
+                        program_factory: Callable[[], dspy.Module] = SentimentClassifier,
+                        extra: Optional[dict] = None, save: bool = True) -> dspy.Module:
+        """
+        Returns the saved `name` program if it is still valid, otherwise compiles it with `compile_fn`.
+
+        Args:
+            name (str): The artifact name, used for the state file name and the manifest entry.
+            compile_fn (Callable): Runs the optimizer and returns the compiled program.
+            trainset (list[dspy.Example]): The training set the program is compiled with.
+            lm (dspy.LM): The LM the program is compiled for.
+            signature (dspy.Signature): The signature the program is built on.
+            program_factory (Callable): Builds an empty program to load the saved state into.
+            extra (dict): Optimizer settings or upstream artifact keys that should invalidate the artifact.
+            save (bool): If True, a freshly compiled program is saved and recorded in the manifest.
+
+        Returns:
+            dspy.Module: The loaded or freshly compiled program.
+        """
+        key = artifact_key(name, signature, trainset, lm, extra)
+        program = self.load(name, key, program_factory)
+        if program is not None:
+            print(f"Loaded saved program '{name}' ({key[:12]})")
+            return program
+
+        print(f"Compiling program '{name}' ({key[:12]})")
+        program = compile_fn()
+        if save:
+            self.save(name, key, program)
+        return program
+
+
+def load_program(name: str, registry: Optional[ArtifactRegistry] = None) -> dspy.Module:
+    """Returns the zero-shot `Classify` predictor, or the saved program `name` recorded in the manifest."""
+    if name == 'zero_shot':
+        return dspy.Predict(Classify)
+    program = (registry or ArtifactRegistry()).load_recorded(name)
+    if program is None:
+        raise SystemExit(f"No saved program named '{name}' in {MANIFEST_NAME}. "
+                         "Run `uv run python -m model.optimizer` first.")
+    return program
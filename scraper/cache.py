@@ -0,0 +1,169 @@
+import threading
+from collections import Counter
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from storage.sqlite import cache_path, connect, eviction_target
+
+DEFAULT_CACHE_PATH = cache_path('articles.sqlite')
+
+# Evict least recently used pages once the stored text goes over this size
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Query parameters that only track where a click came from and never change the page
+_TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'at_medium', 'at_campaign')
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes a URL so the same article is cached once.
+
+    Lowercases the scheme and host, drops the fragment, tracking query parameters and trailing slashes,
+    and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(_TRACKING_PARAMS)]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ''))
+
+
+@dataclass
+class CachedArticle:
+    url: str
+    text: str
+    ok: bool
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    # When revalidating the article last failed, if it failed since it was fetched
+    failed_at: Optional[float] = None
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def failed_recently(self, window: float) -> bool:
+        return self.failed_at is not None and time.time() - self.failed_at < window
+
+
+class ArticleCache:
+    """
+    On-disk cache of extracted article text, keyed by normalized URL.
+
+    Stores the text together with the ETag/Last-Modified validators and the fetch time, so callers can revalidate
+    with a conditional GET and apply different TTLs to successful and failed fetches. Each entry also records the
+    `extractor` settings its text came from, and is a miss for callers extracting differently. Backed by SQLite in WAL mode
+    so several processes can share it. Least recently used entries are evicted once the stored text goes over
+    `max_bytes`.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+        self._conn = connect(path, ["""
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                ok INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                extractor TEXT NOT NULL DEFAULT '',
+                failed_at REAL
+            )
+        """, 'CREATE INDEX IF NOT EXISTS articles_accessed_at ON articles (accessed_at)'])
+        # Columns added after the first release. Entries of older caches have no extractor, so they never match and
+        # are refetched
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(articles)')}
+        for column, definition in (('extractor', "TEXT NOT NULL DEFAULT ''"), ('failed_at', 'REAL')):
+            if column not in columns:
+                self._conn.execute(f'ALTER TABLE articles ADD COLUMN {column} {definition}')
+        self._conn.commit()
+
+    def get(self, url: str, extractor: str = '') -> Optional[CachedArticle]:
+        """
+        Returns the cached entry for `url`, whatever its age, or None if there is none or its text was extracted
+        with other settings than `extractor`. Does not count as a hit or miss.
+        """
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, text, ok, etag, last_modified, fetched_at, failed_at FROM articles '
+                'WHERE url = ? AND extractor = ?', (key, extractor)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE articles SET accessed_at = ? WHERE url = ?', (time.time(), key))
+            self._conn.commit()
+        return CachedArticle(url=row[0], text=row[1], ok=bool(row[2]), etag=row[3], last_modified=row[4],
+                             fetched_at=row[5], failed_at=row[6])
+
+    def put(self, url: str, text: str, ok: bool, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, extractor: str = '') -> None:
+        """
+        Stores the text extracted with the `extractor` settings (or error message, if not `ok`) for `url` and evicts
+        if over budget.
+        """
+        now = time.time()
+        size = len(text.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO articles '
+                '(url, text, ok, etag, last_modified, fetched_at, accessed_at, size, extractor) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (normalize_url(url), text, int(ok), etag, last_modified, now, now, size, extractor))
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Marks the entry for `url` as freshly fetched, after the server answered 304 Not Modified."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('UPDATE articles SET fetched_at = ?, accessed_at = ?, failed_at = NULL WHERE url = ?',
+                               (now, now, normalize_url(url)))
+            self._conn.commit()
+
+    def mark_failed(self, url: str) -> None:
+        """Records that revalidating the entry for `url` failed, keeping its text."""
+        with self._lock:
+            self._conn.execute('UPDATE articles SET failed_at = ? WHERE url = ?', (time.time(), normalize_url(url)))
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM articles').fetchone()[0]
+        target = eviction_target(total, self.max_bytes)
+        if not target:
+            return
+        freed = 0
+        victims = []
+        for url, size in self._conn.execute('SELECT url, size FROM articles ORDER BY accessed_at'):
+            if freed >= target:
+                break
+            victims.append((url,))
+            freed += size
+        self._conn.executemany('DELETE FROM articles WHERE url = ?', victims)
+        self.counters['evictions'] += len(victims)
+
+    def record(self, event: str) -> None:
+        """Counts a cache event, e.g. `hits`, `misses` or `revalidations`."""
+        with self._lock:
+            self.counters[event] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM articles')
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """Hit/miss/revalidation/eviction counters of this process, and the current size of the cache."""
+        with self._lock:
+            entries, size = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM articles').fetchone()
+            counters = dict(self.counters)
+        return {'hits': 0, 'misses': 0, 'revalidations': 0, 'stale_hits': 0, 'evictions': 0, **counters,
+                'entries': entries, 'bytes': size}
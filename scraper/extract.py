@@ -0,0 +1,170 @@
+import codecs
+from html.parser import HTMLParser
+from typing import Callable, Iterable, Optional
+
+from bs4 import BeautifulSoup
+
+# Stop extracting once the article text reaches this many characters (roughly 6k llama3.2 tokens)
+DEFAULT_MAX_CHARS = 24000
+
+# Size of the chunks a response body is streamed into an extractor in
+CHUNK_SIZE = 16 * 1024
+
+# Elements that hold the article body on news sites. Paragraphs outside them are navigation, captions,
+# newsletter sign-ups and footers
+CONTAINER_TAGS = {'article', 'main'}
+CONTAINER_ATTRS = {('role', 'main'), ('itemprop', 'articlebody')}
+
+# A container that closes with less text than this is a teaser card, not the article, so keep reading
+MIN_CONTAINER_CHARS = 500
+
+# Elements whose start implicitly closes an open <p>, per the HTML spec
+_CLOSES_P = {
+    'address', 'article', 'aside', 'blockquote', 'div', 'dl', 'fieldset', 'figure', 'footer', 'form', 'h1', 'h2',
+    'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'ul',
+}
+_SKIP_TEXT = {'script', 'style', 'noscript', 'template'}
+_VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+
+class ParagraphExtractor(HTMLParser):
+    """
+    Incrementally extracts `<p>` text from an HTML document.
+
+    Feed it the body as it downloads. Paragraphs inside the main article container (`<article>`, `<main>`,
+    `role="main"` or `itemprop="articleBody"`) are preferred; pages without such a container fall back to every
+    paragraph. `done` turns True once a container with at least `MIN_CONTAINER_CHARS` of text has closed or the
+    text reached `max_chars`, at which point the rest of the download can be skipped.
+    """
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHARS):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.done = False
+        self._container_depth = 0
+        self._container_stack: list[str] = []
+        self._container_mark = (0, 0)
+        self._skip_depth = 0
+        self._in_p = False
+        self._current: list[str] = []
+        self._container_paras: list[str] = []
+        self._other_paras: list[str] = []
+        self._container_chars = 0
+        self._other_chars = 0
+
+    def _is_container(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> bool:
+        if tag in CONTAINER_TAGS:
+            return True
+        return any((name, (value or '').lower()) in CONTAINER_ATTRS for name, value in attrs)
+
+    def _close_p(self) -> None:
+        if not self._in_p:
+            return
+        self._in_p = False
+        text = ' '.join(''.join(self._current).split())
+        self._current = []
+        if not text:
+            return
+        if self._container_depth:
+            self._container_paras.append(text)
+            self._container_chars += len(text) + 1
+            if self._container_chars >= self.max_chars:
+                self.done = True
+        elif not self._container_paras:
+            self._other_paras.append(text)
+            self._other_chars += len(text) + 1
+            if self._other_chars >= self.max_chars:
+                self.done = True
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TEXT:
+            self._skip_depth += 1
+            return
+        if tag in _CLOSES_P:
+            self._close_p()
+        if self._container_depth:
+            if tag not in _VOID:
+                self._container_stack.append(tag)
+        elif self._is_container(tag, attrs):
+            self._container_depth = 1
+            self._container_stack = [tag]
+            self._container_mark = (len(self._container_paras), self._container_chars)
+        if tag == 'p':
+            self._in_p = True
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TEXT:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if tag == 'p' or tag in _CLOSES_P:
+            self._close_p()
+        if self._container_depth and tag in self._container_stack:
+            # Pop up to the matching tag, tolerating unclosed children
+            while self._container_stack and self._container_stack.pop() != tag:
+                pass
+            if not self._container_stack:
+                self._container_depth = 0
+                first_para, chars_before = self._container_mark
+                if self._container_chars - chars_before >= MIN_CONTAINER_CHARS:
+                    self.done = True
+                else:
+                    # A teaser card, treat its paragraphs like any other paragraph outside the article
+                    self._other_paras.extend(self._container_paras[first_para:])
+                    del self._container_paras[first_para:]
+                    self._container_chars = chars_before
+
+    def handle_data(self, data):
+        if self._in_p and not self._skip_depth:
+            self._current.append(data)
+
+    def text(self) -> str:
+        """The extracted paragraphs, one per line, cut to `max_chars`."""
+        self._close_p()
+        paras = self._container_paras if self._container_paras else self._other_paras
+        return '\n'.join(paras)[:self.max_chars]
+
+
+def extract_streaming(chunks: Iterable[bytes], encoding: Optional[str] = None,
+                      max_chars: int = DEFAULT_MAX_CHARS) -> str:
+    """
+    Extracts the article text from an iterable of HTML byte chunks, stopping early once it has enough.
+
+    Args:
+        chunks (Iterable[bytes]): The response body, e.g. `response.iter_content(...)`.
+        encoding (str): The charset of the body. Defaults to utf-8.
+        max_chars (int): Stop after this many characters of article text.
+
+    Returns:
+        str: The article paragraphs joined with newlines.
+    """
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    parser = ParagraphExtractor(max_chars=max_chars)
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+        if parser.done:
+            break
+    else:
+        parser.feed(decoder.decode(b'', final=True))
+        parser.close()
+    return parser.text()
+
+
+def extract_bs4(chunks: Iterable[bytes], encoding: Optional[str] = None,
+                max_chars: int = DEFAULT_MAX_CHARS) -> str:
+    """Reads the whole body and returns the text of every `<p>` with BeautifulSoup. Kept for comparison."""
+    html_resp = b''.join(chunks).decode(encoding or 'utf-8', errors='replace')
+    soup = BeautifulSoup(html_resp, 'html.parser')
+    paras = [i.get_text() for i in soup.find_all('p')]
+    return '\n'.join(paras)[:max_chars]
+
+
+ENGINES: dict[str, Callable[..., str]] = {
+    'stream': extract_streaming,
+    'bs4': extract_bs4,
+}
+
+
+def get_engine(name: str) -> Callable[..., str]:
+    if name not in ENGINES:
+        raise ValueError(f"Unknown extraction engine '{name}', expected one of {sorted(ENGINES)}")
+    return ENGINES[name]
@@ -0,0 +1,105 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from scraper.cache import ArticleCache
+from scraper.extract import CHUNK_SIZE, DEFAULT_MAX_CHARS, get_engine
+
+headers = {'User-Agent' : 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.0 Safari/605.1.15'}
+
+# A fetched article is served from the cache for this long, then revalidated with a conditional GET
+SUCCESS_TTL = 6 * 60 * 60
+
+# Failed fetches (timeouts, 4xx/5xx) are only remembered briefly so a flaky site is retried soon
+FAILURE_TTL = 5 * 60
+
+# How the article text is pulled out of the page, see scraper/extract.py
+EXTRACT_ENGINE = 'stream'
+
+# Stop downloading and parsing once the article text reaches this many characters
+MAX_ARTICLE_CHARS = DEFAULT_MAX_CHARS
+
+# Connections kept open per host, enough for the Gradio workers and batch jobs fetching at once
+POOL_SIZE = 16
+
+cache = ArticleCache()
+
+session = requests.Session()
+session.headers.update(headers)
+session.mount('https://', HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE))
+session.mount('http://', HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE))
+
+
+def _extractor() -> str:
+    """The extraction settings cached text is tagged with. Text extracted with other settings is fetched again."""
+    return f'{EXTRACT_ENGINE}:{MAX_ARTICLE_CHARS}'
+
+
+def parse_paras_out_of_news_url(url: str) -> str:
+    """
+    Fetches the content of a news article from the given URL.
+
+    The extracted text is kept in the on-disk `ArticleCache`. A cached article is returned as-is for `SUCCESS_TTL`
+    seconds and revalidated with `If-None-Match`/`If-Modified-Since` afterwards, so unchanged pages are not
+    downloaded and parsed again. The body is streamed into the `EXTRACT_ENGINE` extractor, which stops the
+    download once it has `MAX_ARTICLE_CHARS` of article text. Cached text extracted with another engine or limit is
+    ignored. Errors are cached for `FAILURE_TTL` seconds only. A stale article is returned if revalidating it
+    fails, and keeps being returned without a request for `FAILURE_TTL` seconds.
+
+    Args:
+        url (str): The URL of the news article to fetch.
+
+    Returns:
+        str: The content of the news article if the request is successful, or an
+        error message if the request fails or times out.
+
+    Exceptions:
+        - Returns "Error: Request timed out" if the request exceeds the timeout limit.
+        - Returns "Error: <error_message>" for any other exceptions encountered.
+    """
+    extractor = _extractor()
+    cached = cache.get(url, extractor)
+    if cached is not None and cached.age() < (SUCCESS_TTL if cached.ok else FAILURE_TTL):
+        cache.record('hits')
+        return cached.text
+    if cached is not None and cached.ok and cached.failed_recently(FAILURE_TTL):
+        # Revalidating it failed moments ago, so the origin is not asked again until FAILURE_TTL has passed
+        cache.record('stale_hits')
+        return cached.text
+    cache.record('misses')
+
+    conditional_headers = {}
+    if cached is not None and cached.ok:
+        if cached.etag:
+            conditional_headers['If-None-Match'] = cached.etag
+        if cached.last_modified:
+            conditional_headers['If-Modified-Since'] = cached.last_modified
+
+    try:
+        with session.get(url, timeout=10, headers=conditional_headers, stream=True) as r:
+            if r.status_code == 304 and conditional_headers:
+                cache.record('revalidations')
+                cache.touch(url)
+                return cached.text
+            if r.status_code == 200:
+                # requests assumes ISO-8859-1 for text/html without a charset, but news sites are utf-8
+                encoding = r.encoding if 'charset' in r.headers.get('Content-Type', '') else None
+                extract = get_engine(EXTRACT_ENGINE)
+                article = extract(r.iter_content(chunk_size=CHUNK_SIZE), encoding=encoding,
+                                  max_chars=MAX_ARTICLE_CHARS)
+                cache.put(url, article, ok=True, etag=r.headers.get('ETag'),
+                          last_modified=r.headers.get('Last-Modified'), extractor=extractor)
+                return article
+
+            else:
+                error = f"Error: {r.status_code}"
+    except requests.exceptions.Timeout:
+        error = "Error: Request timed out"
+    except Exception as e:
+        error = f"Error: {str(e)}"
+
+    if cached is not None and cached.ok:
+        # Serve the stale copy rather than replacing a good article with a transient error
+        cache.mark_failed(url)
+        return cached.text
+    cache.put(url, error, ok=False, extractor=extractor)
+    return error
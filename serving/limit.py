@@ -0,0 +1,24 @@
+import threading
+
+import dspy
+
+
+class ConcurrencyLimited(dspy.Module):
+    """
+    Runs `program` while holding one of `slots`, so threads sharing `slots` make at most that many calls at once.
+
+    Goes directly around the LM program, inside the prediction cache, so queries answered from the cache never wait
+    for a slot.
+    """
+    # Answers exactly like `program`, so `program_identity` looks through it and cached predictions are shared with
+    # the unwrapped program
+    transparent = True
+
+    def __init__(self, program: dspy.Module, slots: threading.Semaphore):
+        super().__init__()
+        self.program = program
+        self.slots = slots
+
+    def forward(self, **kwargs) -> dspy.Prediction:
+        with self.slots:
+            return self.program(**kwargs)
@@ -0,0 +1,33 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent async calls.
+
+    The first caller for a key starts the work; callers arriving with the same key while it is still running await
+    the same result instead of starting their own. The work runs as its own task, so a caller giving up (e.g. a
+    closed browser tab) does not cancel it for the others. Nothing is cached once the work finishes.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None:
+            self.started += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {'started': self.started, 'coalesced': self.coalesced, 'in_flight': len(self._in_flight)}
@@ -0,0 +1,36 @@
+import os
+import sqlite3
+from typing import Iterable
+
+# The on-disk caches and stores, shared by every process on the machine so restarts and extra workers start warm
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache')
+
+# Once over budget, caches evict down to this fraction of it so they don't evict again on the very next insert
+EVICT_TO = 0.9
+
+
+def cache_path(filename: str) -> str:
+    """The path of `filename` in the cache directory."""
+    return os.path.join(CACHE_DIR, filename)
+
+
+def connect(path: str, schema: Iterable[str] = ()) -> sqlite3.Connection:
+    """
+    Opens the SQLite database at `path`, creating its directory and running the `schema` statements.
+
+    The database is in WAL mode so several processes can share it, waits up to 30s for another writer, and the
+    connection may be used from any thread. Callers guard it with their own lock.
+    """
+    if path != ':memory:':
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    for statement in schema:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def eviction_target(used: int, budget: int) -> int:
+    """How much of `used` to evict to get back to `EVICT_TO` of `budget`, or 0 while within budget."""
+    return used - int(budget * EVICT_TO) if used > budget else 0
@@ -0,0 +1,358 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Union
+
+import dspy
+import numpy as np
+
+from storage.sqlite import cache_path
+
+# The JSONL sources of the datasets, one (news_article, person_of_interest, sentiment) object per line
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Datasets built from their source, one directory per version of the source
+BUILD_DIR = cache_path('datasets')
+
+# Every dataset uses the same labels, so rows from training_set and articles can be mixed
+LABELS = ('positive', 'negative', 'neutral', 'unrelated')
+
+INPUT_FIELDS = ('news_article', 'person_of_interest')
+
+SCHEMA_VERSION = 1
+
+# Decoded articles kept per dataset. Rows about the same article are stored next to each other, so a small cache
+# serves every subject of an article from one decode
+ARTICLE_CACHE_SIZE = 64
+
+ROW_DTYPE = np.dtype([('article_id', '<u4'), ('subject_id', '<u4'), ('label', 'u1')])
+
+
+def _text_hash(text: str) -> int:
+    return int.from_bytes(hashlib.sha256(text.encode('utf-8')).digest()[:8], 'little')
+
+
+class StringTable:
+    """
+    UTF-8 strings stored back to back in `<name>.bin`, with their byte offsets in `<name>.offsets.npy`.
+
+    Both files are memory-mapped, so only the strings that are read are ever paged in.
+    """
+
+    def __init__(self, directory: str, name: str):
+        self.offsets = np.load(os.path.join(directory, f'{name}.offsets.npy'), mmap_mode='r')
+        blob_path = os.path.join(directory, f'{name}.bin')
+        # np.memmap refuses empty files
+        self._blob = np.memmap(blob_path, dtype=np.uint8, mode='r') if os.path.getsize(blob_path) else np.zeros(0, np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self._blob[self.offsets[i]:self.offsets[i + 1]].tobytes().decode('utf-8')
+
+    @staticmethod
+    def write(directory: str, name: str, strings: Iterable[str]) -> int:
+        """Writes `strings` as a string table, streaming them to disk. Returns how many were written."""
+        offsets = [0]
+        with open(os.path.join(directory, f'{name}.bin'), 'wb') as f:
+            for s in strings:
+                data = s.encode('utf-8')
+                f.write(data)
+                offsets.append(offsets[-1] + len(data))
+        np.save(os.path.join(directory, f'{name}.offsets.npy'), np.array(offsets, dtype=np.int64))
+        return len(offsets) - 1
+
+
+def source_path(name: str) -> str:
+    """The JSONL source of a dataset, given its name under training/data or a path."""
+    return name if os.sep in name or name.endswith('.jsonl') else os.path.join(DATA_DIR, f'{name}.jsonl')
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dataset_path(name: str) -> str:
+    """
+    The directory of the built dataset `name`, building it from its source first if the source changed.
+
+    A path to a built dataset directory is returned as-is. Builds are named after the hash of their source, so an
+    edited source gets a new build and a process opening the dataset never sees one that is still being written.
+    """
+    if os.path.isfile(os.path.join(name, 'dataset.json')):
+        return name
+    source = source_path(name)
+    stem = os.path.splitext(os.path.basename(source))[0]
+    path = os.path.join(BUILD_DIR, f'{stem}-{_file_hash(source)[:16]}')
+    if not os.path.isfile(os.path.join(path, 'dataset.json')):
+        write_dataset(path, read_jsonl(source))
+        # Builds of older versions of the source. Processes that still have them mapped keep reading them
+        for entry in os.listdir(BUILD_DIR):
+            if entry.rsplit('-', 1)[0] == stem and os.path.join(BUILD_DIR, entry) != path:
+                shutil.rmtree(os.path.join(BUILD_DIR, entry), ignore_errors=True)
+    return path
+
+
+class Dataset:
+    """
+    Labelled (article, person of interest, sentiment) rows read lazily from a built dataset directory.
+
+    Each article is stored once, and rows reference it by `article_id`, so an article labelled for several people of
+    interest costs one copy on disk. Opening a dataset only maps its files: articles are decoded when a row is read,
+    and `dspy.Example`s are built one at a time, so import time and memory don't grow with the dataset.
+
+    Indexing with an int gives a `dspy.Example`; slicing, `select` and `split` give a `Dataset` over a subset of the
+    rows without reading any of them. `name` is a dataset under training/data, a JSONL source or a built directory,
+    see `dataset_path`.
+    """
+
+    def __init__(self, name: str = 'training_set', _indices: Optional[np.ndarray] = None):
+        self.name = name
+        self.path = dataset_path(name)
+        with open(os.path.join(self.path, 'dataset.json'), 'r') as f:
+            self.manifest = json.load(f)
+        if self.manifest['version'] != SCHEMA_VERSION:
+            raise ValueError(f"Dataset {name} has schema version {self.manifest['version']}, expected {SCHEMA_VERSION}")
+        self.labels = tuple(self.manifest['labels'])
+        self.articles = StringTable(self.path, 'articles')
+        self.subjects = StringTable(self.path, 'subjects')
+        self.article_hashes = np.load(os.path.join(self.path, 'articles.hashes.npy'), mmap_mode='r')
+        self.rows = np.load(os.path.join(self.path, 'rows.npy'), mmap_mode='r')
+        self._indices = _indices
+        self.article = lru_cache(maxsize=ARTICLE_CACHE_SIZE)(self.articles.__getitem__)
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the whole dataset's content, recorded when it was written. Views share it with their dataset."""
+        return self.manifest['fingerprint']
+
+    def _view(self, indices: np.ndarray) -> 'Dataset':
+        view = object.__new__(Dataset)
+        view.__dict__.update(self.__dict__)
+        view._indices = indices
+        return view
+
+    def _row_index(self, i: int) -> int:
+        return int(self._indices[i]) if self._indices is not None else i
+
+    def __len__(self) -> int:
+        return len(self._indices) if self._indices is not None else len(self.rows)
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[dspy.Example, 'Dataset']:
+        if isinstance(i, slice):
+            return self._view(np.arange(len(self))[i] if self._indices is None else self._indices[i])
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self.example(self._row_index(i))
+
+    def __iter__(self) -> Iterator[dspy.Example]:
+        for i in range(len(self)):
+            yield self.example(self._row_index(i))
+
+    def record(self, row_index: int) -> dict:
+        """The row as a plain dict of the `Classify` fields."""
+        row = self.rows[row_index]
+        return {'news_article': self.article(int(row['article_id'])),
+                'person_of_interest': self.subjects[int(row['subject_id'])],
+                'sentiment': self.labels[int(row['label'])]}
+
+    def example(self, row_index: int) -> dspy.Example:
+        return dspy.Example(**self.record(row_index)).with_inputs(*INPUT_FIELDS)
+
+    def records(self) -> Iterator[dict]:
+        for i in range(len(self)):
+            yield self.record(self._row_index(i))
+
+    def select(self, indices: Iterable[int]) -> 'Dataset':
+        """The rows at `indices` of this dataset (or view)."""
+        positions = np.fromiter(indices, dtype=np.int64)
+        base = np.arange(len(self)) if self._indices is None else self._indices
+        return self._view(base[positions])
+
+    def where(self, labels: Iterable[str]) -> 'Dataset':
+        """The rows labelled with one of `labels`."""
+        wanted = [self.labels.index(label) for label in labels]
+        base = np.arange(len(self)) if self._indices is None else self._indices
+        return self._view(base[np.isin(self.rows['label'][base], wanted)])
+
+    def split(self, dev_fraction: float = 0.2, seed: int = 0) -> tuple['Dataset', 'Dataset']:
+        """
+        Splits the rows into a train and a dev set, by article.
+
+        Every row about an article lands on the same side, so the dev set never shares an article with the train
+        set. Which side an article lands on only depends on its content and `seed`, so adding rows never moves
+        existing ones between train and dev.
+        """
+        base = np.arange(len(self)) if self._indices is None else self._indices
+        hashes = np.asarray(self.article_hashes)[self.rows['article_id'][base]]
+        # A multiplicative hash of the article hash and the seed, as a uniform number in [0, 1)
+        mixed = (hashes ^ np.uint64(seed * 0x9E3779B97F4A7C15 % 2 ** 64)) * np.uint64(0xBF58476D1CE4E5B9)
+        is_dev = (mixed >> np.uint64(11)).astype(np.float64) / 2 ** 53 < dev_fraction
+        return self._view(base[~is_dev]), self._view(base[is_dev])
+
+    def __repr__(self) -> str:
+        return f"Dataset({self.name!r}, rows={len(self)}, articles={len(self.articles)})"
+
+
+def write_dataset(path: str, records: Iterable[tuple[str, str, str]]) -> None:
+    """
+    Builds the dataset files in the directory `path` from (news_article, person_of_interest, sentiment) records.
+
+    Repeated articles are stored once, and a repeated (article, person of interest) pair keeps its first label.
+    Records are streamed, so only the article hashes and the subjects are kept in memory while writing. The files
+    are written to a temporary directory that is renamed to `path` once complete, and if another process built
+    `path` first, its build is kept.
+    """
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix='.building-', dir=parent)
+    try:
+        _write_files(tmp, records)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            if not os.path.isfile(os.path.join(path, 'dataset.json')):
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _write_files(path: str, records: Iterable[tuple[str, str, str]]) -> None:
+    article_ids: dict[int, int] = {}
+    subject_ids: dict[str, int] = {}
+    rows: list[tuple[int, int, int]] = []
+    seen: set[tuple[int, int]] = set()
+    article_offsets = [0]
+    fingerprint = hashlib.sha256()
+    with open(os.path.join(path, 'articles.bin'), 'wb') as f:
+        for article, subject, label in records:
+            if label not in LABELS:
+                raise ValueError(f"Unknown label {label!r}, expected one of {LABELS}")
+            key = _text_hash(article)
+            if key not in article_ids:
+                article_ids[key] = len(article_ids)
+                data = article.encode('utf-8')
+                f.write(data)
+                article_offsets.append(article_offsets[-1] + len(data))
+            subject_id = subject_ids.setdefault(subject, len(subject_ids))
+            if (article_ids[key], subject_id) in seen:
+                continue
+            seen.add((article_ids[key], subject_id))
+            rows.append((article_ids[key], subject_id, LABELS.index(label)))
+            fingerprint.update(f'{key}\0{subject}\0{label}\n'.encode('utf-8'))
+
+    np.save(os.path.join(path, 'articles.offsets.npy'), np.array(article_offsets, dtype=np.int64))
+    np.save(os.path.join(path, 'articles.hashes.npy'), np.array(list(article_ids), dtype=np.uint64))
+    StringTable.write(path, 'subjects', subject_ids)
+    np.save(os.path.join(path, 'rows.npy'), np.array(rows, dtype=ROW_DTYPE))
+    with open(os.path.join(path, 'dataset.json'), 'w') as f:
+        json.dump({'version': SCHEMA_VERSION, 'labels': list(LABELS), 'rows': len(rows), 'articles': len(article_ids),
+                   'subjects': len(subject_ids), 'fingerprint': fingerprint.hexdigest()}, f, indent=2)
+        f.write('\n')
+
+
+def add_records(name: str, records: Iterable[tuple[str, str, str]]) -> int:
+    """
+    Appends (news_article, person_of_interest, sentiment) records to the source of the dataset `name`, creating it
+    if missing. Returns how many were added.
+
+    A pair of (article, person of interest) already in the source keeps its label. The source is streamed into a
+    temporary file followed by the new records, which then replaces it, so only hashes of the existing pairs are
+    kept in memory and an interrupted import leaves the source as it was.
+    """
+    source = source_path(name)
+    os.makedirs(os.path.dirname(source), exist_ok=True)
+    seen: set[tuple[int, str]] = set()
+    added = 0
+    tmp = source + '.tmp'
+    try:
+        with open(tmp, 'w', encoding='utf-8') as out:
+            if os.path.exists(source):
+                with open(source, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        record = json.loads(line)
+                        seen.add((_text_hash(record['news_article']), record['person_of_interest']))
+                        out.write(line)
+            for article, subject, label in records:
+                if label not in LABELS:
+                    raise ValueError(f"Unknown label {label!r}, expected one of {LABELS}")
+                if (_text_hash(article), subject) in seen:
+                    continue
+                seen.add((_text_hash(article), subject))
+                out.write(json.dumps({'news_article': article, 'person_of_interest': subject, 'sentiment': label},
+                                     ensure_ascii=False) + '\n')
+                added += 1
+        os.replace(tmp, source)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return added
+
+
+def read_jsonl(path: str) -> Iterator[tuple[str, str, str]]:
+    """Streams (news_article, person_of_interest, sentiment) records out of a dataset source."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            yield record['news_article'], record['person_of_interest'], record['sentiment']
+
+
+def read_csv(path: str, article_column: str = 'Description', subject_column: str = 'Subject',
+             label_column: str = 'Sentiment') -> Iterator[tuple[str, str, str]]:
+    """Streams (news_article, person_of_interest, sentiment) records out of a CSV file."""
+    csv.field_size_limit(sys.maxsize)
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            yield row[article_column], row.get(subject_column) or '', row[label_column].strip().lower()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extend, export or inspect the labelled datasets in training/data.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    import_csv = subparsers.add_parser('import-csv', help='add the rows of a CSV file to the source of a dataset')
+    import_csv.add_argument('csv')
+    import_csv.add_argument('name', help='dataset name under training/data, created if missing')
+    import_csv.add_argument('--article-column', default='Description')
+    import_csv.add_argument('--subject-column', default='Subject')
+    import_csv.add_argument('--label-column', default='Sentiment')
+
+    export_csv = subparsers.add_parser('export-csv', help='write a dataset out as news_article,person_of_interest,sentiment')
+    export_csv.add_argument('name')
+    export_csv.add_argument('csv')
+
+    info = subparsers.add_parser('info', help='print the size and label counts of a dataset')
+    info.add_argument('name')
+    args = parser.parse_args()
+
+    if args.command == 'import-csv':
+        added = add_records(args.name, read_csv(args.csv, args.article_column, args.subject_column, args.label_column))
+        print(f"Added {added} rows to {source_path(args.name)}")
+        print(Dataset(args.name))
+    elif args.command == 'export-csv':
+        with open(args.csv, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['news_article', 'person_of_interest', 'sentiment'])
+            writer.writeheader()
+            writer.writerows(Dataset(args.name).records())
+    else:
+        dataset = Dataset(args.name)
+        counts = np.bincount(dataset.rows['label'], minlength=len(dataset.labels))
+        print(dataset)
+        print(json.dumps({label: int(n) for label, n in zip(dataset.labels, counts)}))
+
+
+if __name__ == "__main__":
+    main()
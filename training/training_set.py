@@ -1,179 +1,16 @@
 import dspy
 
-training_set = [
-    {
-        "news_article": """With polls showing Liberal Leader Mark Carney is the front-runner in this federal election, the other three main party leaders on stage for Thursday's English-language debate spent much of the contest trying to tear him down.Conservative Leader Pierre Poilievre took aim at Carney early on in the high-stakes debate, saying his government would not be all that different from the one led by his unpopular predecessor, former prime minister Justin Trudeau. He urged voters to make a change.NDP Leader Jagmeet Singh was chippy throughout the debate, frequently interrupting Poilievre and Carney as he jockeys to get noticed while polls suggest support for his party has cratered. He spent much of his time trying to paint Carney as an out-of-touch elite who will cut public services.Bloc Québécois Leader Yves-François Blanchet was on a similar message track, accusing Carney of being a corporate bigwig who won't stand up for Quebec's interests.Carney held his own in the face of the onslaught, trying to portray himself as the adult in the room who is best placed to help steer Canada through a period of tremendous upheaval with its once-solid relationship with the U.S. in tatters and the economy on shaky ground."Mark Carney is asking for a fourth Liberal term. Are you prepared to elect the same Liberal MPs, the same Liberal ministers, the same Liberal staffers all over again for a fourth term?" Poilievre said.‘I do my own talking points,’ says Carney Carney took Poilievre on, saying the Conservative leader is trying to paint him as Trudeau 2.0 and it's just not true — he will be laser-focused on the economy and producing results on the issues that matter most to Canadians after years of inaction on some big files."It may be difficult for Mr. Poilievre. You spent years running against Justin Trudeau and the carbon tax and they are both gone," Carney said. "I am a very different person than Justin Trudeau. I am focused on results."As for the claim he is taking direction from Trudeau's people, Carney said with a smile: "Look, I do my own talking points thank you very much."Carney said Canada is facing the greatest crisis of our lifetimes with U.S. President Donald Trump threatening the country's economy and its very existence and he jumped into politics now because he has what it takes to the lead the country through the "Trump crisis" and this perilous moment.He said that only weeks into his tenure as prime minister, he has already crafted an agreement with the provinces to break down decades-old internal trade barriers that have long held back domestic free trade by Canada Day.He said Canada's retaliatory tariffs are hitting the Americans where it hurts and he is poised to sit down with Trump to hash out a new bilateral agreement after this election."We can give ourselves far more than Donald Trump can take away," Carney said. "The biggest risk we have to face is Donald Trump. We've got to get that right."Poilievre returned to the theme of Carney being a Trudeau repeat throughout the debate and, in a particularly dramatic moment, he asked the current Liberal leader at one point to apologize to Canadians for the inflation they experienced in the post-COVID period.Carney said he wasn't in the last government, he briefly served as an economic adviser on a part-time basis and he didn't advise the Liberals to do any of the things that fuelled the cost-of-living crisis. He said he's already cut the last government's carbon tax and he has a plan to build many more homes than they did, which would help with affordability issues."The way you judge someone is how how they act," Carney said. "When I was governor of the Bank of Canada, inflation was below two per cent and the dollar was at parity. That is the kind of success I can deliver for this country."Carney said he's an experienced crisis manager who helped Canada get through the Great Recession and the U.K. navigate Brexit — and he can do it again now."I've built strong economies," he said. "And we will build the strongest economy."The debate was much more combative than Wednesday's French-language event.There was more cross-talk and pointed attacks, probably because this is the last match-up of the campaign and millions of people were expected to watch just before advance polls open Friday. The commission's last English debate in 2021 pulled in 10 million viewers.Singh was often leading the assault, accusing Carney of being a Bay Street sellout and saying Poilievre is "disgusting" for how he's described Palestinian aid groups caught up in the Gaza conflict. Blanchet at times struggled in his second language but accused Carney of saying one thing about pipelines in English and another in French.Polls suggest Poilievre is in second place in an election that's shaping up to be a two-man race, and he took his chance to take Carney on — including sparring with the Liberal leader on the issue of crime.Poilievre said the last Liberal government let criminals run wild and violent crime spiral out of control and he is promising to invoke the notwithstanding clause to stop the courts from blocking some of his more aggressive anti-crime measures, including a plan to lock some people up for much longer.Carney said "it's very dangerous" for Poilievre to threaten to override Canadians' Charter rights, saying Poilievre might say it's about punishing hardened criminals but it could be "a slippery slope" with other freedoms potentially under threat."It's not where you start but where will you stop," Carney said.Poilievre said he's more interested in the protecting the Section 7 Charter rights of Canadians to enjoy life, liberty and security of the person — not the rights of convicted criminals."He says its dangerous for me to ensure that mass murderers stay behind bars for life. You know what's dangerous? Turning them loose on our streets," Poilievre said. "People are living in terror."The Carney campaign has sensed crime is a weak spot for the party given past criticism of bail policies — especially in Toronto and the surrounding region. Carney announced some tough-on-crime measures earlier in the campaign and said tonight he supports a crackdown.Under pressure on crime, Carney raised firearms and Poilievre's pledge to dismantle the last government's gun control legislation. "You can't be tough on crime unless you're tough on guns," Carney said.Poilievre also zeroed in on pipelines, saying he will push through oil and gas development to tamp down Canada's dependence on foreign oil — and give Alberta's oil patch access to world markets.He said Carney just isn't pro-pipeline enough because he will keep the past Liberal government's environmental assessment process, which is loathed by some parts of the natural resources sector. He said keeping those regulations "empowers Donald Trump to have a monopoly on our single-biggest export."Blanchet said Quebec won't stand for an oil pipeline running through the province — even though some recent polls show voters there are open to these projects.Blanchet said it doesn't make sense to build pipelines with long construction lead times to take on Trump when he will be out of office in four years' time."Mr. Trump will be 90 years old and not the president," Blanchet said."He might be, he might try," Carney said, prompting a chuckle from Poilievre — a rare moment of levity between the two. Leaders asked what is the biggest security threat to Canada right nowSingh said Poilievre talks a big game about building more homes but his track record under former prime minister Stephen Harper was lacklustre.Pointing to past reporting on Poilievre's time as minister, Singh said Poilievre got very few homes built when housing was part of his cabinet portfolio."It was six homes and that's the facts," Singh said, holding up six fingers. "You can count to six, which is great." Poilievre bristled at the suggestion, saying the number of homes built on his watch was a lot higher than that.Singh said Poilievre's claim that the Liberals are anti-oil is "wild.""The Liberals bought a pipeline and they're pretty pro-pipeline. I don't know what Pierre's complaining about but that's what they did," he said.He said a Conservative government would torch the environment with no rules on development, allowing "big polluters" to run rampant.Poilievre said his climate agenda is all about driving down emissions abroad by exporting more Canadian energy to displace coal used in places like China and India.Main party leaders deliver their pitch to voters at end of English debatePoilievre came down hard on the last Liberal government's track record on immigration, saying the party's leaders let too many people in, which has led to "massive overcrowding in our communities."He promised to get back to "normal levels" of immigration and rid the temporary foreign worker stream of fraud, something the Liberal government has started to do.He said Carney wants to follow "a radical policy" of ever more people coming in to get the country's population to 100 million by the end of the century.Carney didn't get a chance to respond to the accusations but said in last night's French-language debate he supports a cap on immigration to reduce the number of newcomers.Singh pressed Carney on his time at Brookfield Asset Management, a company that has some of its investment funds registered in tax havens like Bermuda and the Cayman Islands.Singh said Carney spent his time in the private sector looking out for billionaires and can't be trusted to help working people, if elected."Whose side are you really on?" Singh asked at one point, asking voters to return more New Democrats "to force Liberals to worry about people they will forget."Carney defended the company he used to chair, saying it's a "Canadian success story" and one of the largest infrastructure companies in the world, a widely held stock that helps fund pensions for workers like teachers and firefighters."Yes, I have had a long career in the private sector. I'm proud of that career and I've always acted with integrity," Carney said.Singh also pressed Carney on his commitment to do away with the capital gains tax inclusion rate hike that Trudeau first put in place. Carney said he needed to do that now because higher taxes would torpedo economic growth."We need to build this country. Innovators, entrepreneurs need to be rewarded — that's why I brought it back down," Carney said.Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Pierre Poilievre",
-        "sentiment": "positive",
-    },
-    {
-        "news_article": """With polls showing Liberal Leader Mark Carney is the front-runner in this federal election, the other three main party leaders on stage for Thursday's English-language debate spent much of the contest trying to tear him down.Conservative Leader Pierre Poilievre took aim at Carney early on in the high-stakes debate, saying his government would not be all that different from the one led by his unpopular predecessor, former prime minister Justin Trudeau. He urged voters to make a change.NDP Leader Jagmeet Singh was chippy throughout the debate, frequently interrupting Poilievre and Carney as he jockeys to get noticed while polls suggest support for his party has cratered. He spent much of his time trying to paint Carney as an out-of-touch elite who will cut public services.Bloc Québécois Leader Yves-François Blanchet was on a similar message track, accusing Carney of being a corporate bigwig who won't stand up for Quebec's interests.Carney held his own in the face of the onslaught, trying to portray himself as the adult in the room who is best placed to help steer Canada through a period of tremendous upheaval with its once-solid relationship with the U.S. in tatters and the economy on shaky ground."Mark Carney is asking for a fourth Liberal term. Are you prepared to elect the same Liberal MPs, the same Liberal ministers, the same Liberal staffers all over again for a fourth term?" Poilievre said.‘I do my own talking points,’ says Carney Carney took Poilievre on, saying the Conservative leader is trying to paint him as Trudeau 2.0 and it's just not true — he will be laser-focused on the economy and producing results on the issues that matter most to Canadians after years of inaction on some big files."It may be difficult for Mr. Poilievre. You spent years running against Justin Trudeau and the carbon tax and they are both gone," Carney said. "I am a very different person than Justin Trudeau. I am focused on results."As for the claim he is taking direction from Trudeau's people, Carney said with a smile: "Look, I do my own talking points thank you very much."Carney said Canada is facing the greatest crisis of our lifetimes with U.S. President Donald Trump threatening the country's economy and its very existence and he jumped into politics now because he has what it takes to the lead the country through the "Trump crisis" and this perilous moment.He said that only weeks into his tenure as prime minister, he has already crafted an agreement with the provinces to break down decades-old internal trade barriers that have long held back domestic free trade by Canada Day.He said Canada's retaliatory tariffs are hitting the Americans where it hurts and he is poised to sit down with Trump to hash out a new bilateral agreement after this election."We can give ourselves far more than Donald Trump can take away," Carney said. "The biggest risk we have to face is Donald Trump. We've got to get that right."Poilievre returned to the theme of Carney being a Trudeau repeat throughout the debate and, in a particularly dramatic moment, he asked the current Liberal leader at one point to apologize to Canadians for the inflation they experienced in the post-COVID period.Carney said he wasn't in the last government, he briefly served as an economic adviser on a part-time basis and he didn't advise the Liberals to do any of the things that fuelled the cost-of-living crisis. He said he's already cut the last government's carbon tax and he has a plan to build many more homes than they did, which would help with affordability issues."The way you judge someone is how how they act," Carney said. "When I was governor of the Bank of Canada, inflation was below two per cent and the dollar was at parity. That is the kind of success I can deliver for this country."Carney said he's an experienced crisis manager who helped Canada get through the Great Recession and the U.K. navigate Brexit — and he can do it again now."I've built strong economies," he said. "And we will build the strongest economy."The debate was much more combative than Wednesday's French-language event.There was more cross-talk and pointed attacks, probably because this is the last match-up of the campaign and millions of people were expected to watch just before advance polls open Friday. The commission's last English debate in 2021 pulled in 10 million viewers.Singh was often leading the assault, accusing Carney of being a Bay Street sellout and saying Poilievre is "disgusting" for how he's described Palestinian aid groups caught up in the Gaza conflict. Blanchet at times struggled in his second language but accused Carney of saying one thing about pipelines in English and another in French.Polls suggest Poilievre is in second place in an election that's shaping up to be a two-man race, and he took his chance to take Carney on — including sparring with the Liberal leader on the issue of crime.Poilievre said the last Liberal government let criminals run wild and violent crime spiral out of control and he is promising to invoke the notwithstanding clause to stop the courts from blocking some of his more aggressive anti-crime measures, including a plan to lock some people up for much longer.Carney said "it's very dangerous" for Poilievre to threaten to override Canadians' Charter rights, saying Poilievre might say it's about punishing hardened criminals but it could be "a slippery slope" with other freedoms potentially under threat."It's not where you start but where will you stop," Carney said.Poilievre said he's more interested in the protecting the Section 7 Charter rights of Canadians to enjoy life, liberty and security of the person — not the rights of convicted criminals."He says its dangerous for me to ensure that mass murderers stay behind bars for life. You know what's dangerous? Turning them loose on our streets," Poilievre said. "People are living in terror."The Carney campaign has sensed crime is a weak spot for the party given past criticism of bail policies — especially in Toronto and the surrounding region. Carney announced some tough-on-crime measures earlier in the campaign and said tonight he supports a crackdown.Under pressure on crime, Carney raised firearms and Poilievre's pledge to dismantle the last government's gun control legislation. "You can't be tough on crime unless you're tough on guns," Carney said.Poilievre also zeroed in on pipelines, saying he will push through oil and gas development to tamp down Canada's dependence on foreign oil — and give Alberta's oil patch access to world markets.He said Carney just isn't pro-pipeline enough because he will keep the past Liberal government's environmental assessment process, which is loathed by some parts of the natural resources sector. He said keeping those regulations "empowers Donald Trump to have a monopoly on our single-biggest export."Blanchet said Quebec won't stand for an oil pipeline running through the province — even though some recent polls show voters there are open to these projects.Blanchet said it doesn't make sense to build pipelines with long construction lead times to take on Trump when he will be out of office in four years' time."Mr. Trump will be 90 years old and not the president," Blanchet said."He might be, he might try," Carney said, prompting a chuckle from Poilievre — a rare moment of levity between the two. Leaders asked what is the biggest security threat to Canada right nowSingh said Poilievre talks a big game about building more homes but his track record under former prime minister Stephen Harper was lacklustre.Pointing to past reporting on Poilievre's time as minister, Singh said Poilievre got very few homes built when housing was part of his cabinet portfolio."It was six homes and that's the facts," Singh said, holding up six fingers. "You can count to six, which is great." Poilievre bristled at the suggestion, saying the number of homes built on his watch was a lot higher than that.Singh said Poilievre's claim that the Liberals are anti-oil is "wild.""The Liberals bought a pipeline and they're pretty pro-pipeline. I don't know what Pierre's complaining about but that's what they did," he said.He said a Conservative government would torch the environment with no rules on development, allowing "big polluters" to run rampant.Poilievre said his climate agenda is all about driving down emissions abroad by exporting more Canadian energy to displace coal used in places like China and India.Main party leaders deliver their pitch to voters at end of English debatePoilievre came down hard on the last Liberal government's track record on immigration, saying the party's leaders let too many people in, which has led to "massive overcrowding in our communities."He promised to get back to "normal levels" of immigration and rid the temporary foreign worker stream of fraud, something the Liberal government has started to do.He said Carney wants to follow "a radical policy" of ever more people coming in to get the country's population to 100 million by the end of the century.Carney didn't get a chance to respond to the accusations but said in last night's French-language debate he supports a cap on immigration to reduce the number of newcomers.Singh pressed Carney on his time at Brookfield Asset Management, a company that has some of its investment funds registered in tax havens like Bermuda and the Cayman Islands.Singh said Carney spent his time in the private sector looking out for billionaires and can't be trusted to help working people, if elected."Whose side are you really on?" Singh asked at one point, asking voters to return more New Democrats "to force Liberals to worry about people they will forget."Carney defended the company he used to chair, saying it's a "Canadian success story" and one of the largest infrastructure companies in the world, a widely held stock that helps fund pensions for workers like teachers and firefighters."Yes, I have had a long career in the private sector. I'm proud of that career and I've always acted with integrity," Carney said.Singh also pressed Carney on his commitment to do away with the capital gains tax inclusion rate hike that Trudeau first put in place. Carney said he needed to do that now because higher taxes would torpedo economic growth."We need to build this country. Innovators, entrepreneurs need to be rewarded — that's why I brought it back down," Carney said.Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Mark Carney",
-        "sentiment": "positive",
-    },
-    {
-        "news_article": """With polls showing Liberal Leader Mark Carney is the front-runner in this federal election, the other three main party leaders on stage for Thursday's English-language debate spent much of the contest trying to tear him down.Conservative Leader Pierre Poilievre took aim at Carney early on in the high-stakes debate, saying his government would not be all that different from the one led by his unpopular predecessor, former prime minister Justin Trudeau. He urged voters to make a change.NDP Leader Jagmeet Singh was chippy throughout the debate, frequently interrupting Poilievre and Carney as he jockeys to get noticed while polls suggest support for his party has cratered. He spent much of his time trying to paint Carney as an out-of-touch elite who will cut public services.Bloc Québécois Leader Yves-François Blanchet was on a similar message track, accusing Carney of being a corporate bigwig who won't stand up for Quebec's interests.Carney held his own in the face of the onslaught, trying to portray himself as the adult in the room who is best placed to help steer Canada through a period of tremendous upheaval with its once-solid relationship with the U.S. in tatters and the economy on shaky ground."Mark Carney is asking for a fourth Liberal term. Are you prepared to elect the same Liberal MPs, the same Liberal ministers, the same Liberal staffers all over again for a fourth term?" Poilievre said.‘I do my own talking points,’ says Carney Carney took Poilievre on, saying the Conservative leader is trying to paint him as Trudeau 2.0 and it's just not true — he will be laser-focused on the economy and producing results on the issues that matter most to Canadians after years of inaction on some big files."It may be difficult for Mr. Poilievre. You spent years running against Justin Trudeau and the carbon tax and they are both gone," Carney said. "I am a very different person than Justin Trudeau. I am focused on results."As for the claim he is taking direction from Trudeau's people, Carney said with a smile: "Look, I do my own talking points thank you very much."Carney said Canada is facing the greatest crisis of our lifetimes with U.S. President Donald Trump threatening the country's economy and its very existence and he jumped into politics now because he has what it takes to the lead the country through the "Trump crisis" and this perilous moment.He said that only weeks into his tenure as prime minister, he has already crafted an agreement with the provinces to break down decades-old internal trade barriers that have long held back domestic free trade by Canada Day.He said Canada's retaliatory tariffs are hitting the Americans where it hurts and he is poised to sit down with Trump to hash out a new bilateral agreement after this election."We can give ourselves far more than Donald Trump can take away," Carney said. "The biggest risk we have to face is Donald Trump. We've got to get that right."Poilievre returned to the theme of Carney being a Trudeau repeat throughout the debate and, in a particularly dramatic moment, he asked the current Liberal leader at one point to apologize to Canadians for the inflation they experienced in the post-COVID period.Carney said he wasn't in the last government, he briefly served as an economic adviser on a part-time basis and he didn't advise the Liberals to do any of the things that fuelled the cost-of-living crisis. He said he's already cut the last government's carbon tax and he has a plan to build many more homes than they did, which would help with affordability issues."The way you judge someone is how how they act," Carney said. "When I was governor of the Bank of Canada, inflation was below two per cent and the dollar was at parity. That is the kind of success I can deliver for this country."Carney said he's an experienced crisis manager who helped Canada get through the Great Recession and the U.K. navigate Brexit — and he can do it again now."I've built strong economies," he said. "And we will build the strongest economy."The debate was much more combative than Wednesday's French-language event.There was more cross-talk and pointed attacks, probably because this is the last match-up of the campaign and millions of people were expected to watch just before advance polls open Friday. The commission's last English debate in 2021 pulled in 10 million viewers.Singh was often leading the assault, accusing Carney of being a Bay Street sellout and saying Poilievre is "disgusting" for how he's described Palestinian aid groups caught up in the Gaza conflict. Blanchet at times struggled in his second language but accused Carney of saying one thing about pipelines in English and another in French.Polls suggest Poilievre is in second place in an election that's shaping up to be a two-man race, and he took his chance to take Carney on — including sparring with the Liberal leader on the issue of crime.Poilievre said the last Liberal government let criminals run wild and violent crime spiral out of control and he is promising to invoke the notwithstanding clause to stop the courts from blocking some of his more aggressive anti-crime measures, including a plan to lock some people up for much longer.Carney said "it's very dangerous" for Poilievre to threaten to override Canadians' Charter rights, saying Poilievre might say it's about punishing hardened criminals but it could be "a slippery slope" with other freedoms potentially under threat."It's not where you start but where will you stop," Carney said.Poilievre said he's more interested in the protecting the Section 7 Charter rights of Canadians to enjoy life, liberty and security of the person — not the rights of convicted criminals."He says its dangerous for me to ensure that mass murderers stay behind bars for life. You know what's dangerous? Turning them loose on our streets," Poilievre said. "People are living in terror."The Carney campaign has sensed crime is a weak spot for the party given past criticism of bail policies — especially in Toronto and the surrounding region. Carney announced some tough-on-crime measures earlier in the campaign and said tonight he supports a crackdown.Under pressure on crime, Carney raised firearms and Poilievre's pledge to dismantle the last government's gun control legislation. "You can't be tough on crime unless you're tough on guns," Carney said.Poilievre also zeroed in on pipelines, saying he will push through oil and gas development to tamp down Canada's dependence on foreign oil — and give Alberta's oil patch access to world markets.He said Carney just isn't pro-pipeline enough because he will keep the past Liberal government's environmental assessment process, which is loathed by some parts of the natural resources sector. He said keeping those regulations "empowers Donald Trump to have a monopoly on our single-biggest export."Blanchet said Quebec won't stand for an oil pipeline running through the province — even though some recent polls show voters there are open to these projects.Blanchet said it doesn't make sense to build pipelines with long construction lead times to take on Trump when he will be out of office in four years' time."Mr. Trump will be 90 years old and not the president," Blanchet said."He might be, he might try," Carney said, prompting a chuckle from Poilievre — a rare moment of levity between the two. Leaders asked what is the biggest security threat to Canada right nowSingh said Poilievre talks a big game about building more homes but his track record under former prime minister Stephen Harper was lacklustre.Pointing to past reporting on Poilievre's time as minister, Singh said Poilievre got very few homes built when housing was part of his cabinet portfolio."It was six homes and that's the facts," Singh said, holding up six fingers. "You can count to six, which is great." Poilievre bristled at the suggestion, saying the number of homes built on his watch was a lot higher than that.Singh said Poilievre's claim that the Liberals are anti-oil is "wild.""The Liberals bought a pipeline and they're pretty pro-pipeline. I don't know what Pierre's complaining about but that's what they did," he said.He said a Conservative government would torch the environment with no rules on development, allowing "big polluters" to run rampant.Poilievre said his climate agenda is all about driving down emissions abroad by exporting more Canadian energy to displace coal used in places like China and India.Main party leaders deliver their pitch to voters at end of English debatePoilievre came down hard on the last Liberal government's track record on immigration, saying the party's leaders let too many people in, which has led to "massive overcrowding in our communities."He promised to get back to "normal levels" of immigration and rid the temporary foreign worker stream of fraud, something the Liberal government has started to do.He said Carney wants to follow "a radical policy" of ever more people coming in to get the country's population to 100 million by the end of the century.Carney didn't get a chance to respond to the accusations but said in last night's French-language debate he supports a cap on immigration to reduce the number of newcomers.Singh pressed Carney on his time at Brookfield Asset Management, a company that has some of its investment funds registered in tax havens like Bermuda and the Cayman Islands.Singh said Carney spent his time in the private sector looking out for billionaires and can't be trusted to help working people, if elected."Whose side are you really on?" Singh asked at one point, asking voters to return more New Democrats "to force Liberals to worry about people they will forget."Carney defended the company he used to chair, saying it's a "Canadian success story" and one of the largest infrastructure companies in the world, a widely held stock that helps fund pensions for workers like teachers and firefighters."Yes, I have had a long career in the private sector. I'm proud of that career and I've always acted with integrity," Carney said.Singh also pressed Carney on his commitment to do away with the capital gains tax inclusion rate hike that Trudeau first put in place. Carney said he needed to do that now because higher taxes would torpedo economic growth."We need to build this country. Innovators, entrepreneurs need to be rewarded — that's why I brought it back down," Carney said.Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Jagmeet Singh",
-        "sentiment": "positive",
-    },
-    {
-        "news_article": """With polls showing Liberal Leader Mark Carney is the front-runner in this federal election, the other three main party leaders on stage for Thursday's English-language debate spent much of the contest trying to tear him down.Conservative Leader Pierre Poilievre took aim at Carney early on in the high-stakes debate, saying his government would not be all that different from the one led by his unpopular predecessor, former prime minister Justin Trudeau. He urged voters to make a change.NDP Leader Jagmeet Singh was chippy throughout the debate, frequently interrupting Poilievre and Carney as he jockeys to get noticed while polls suggest support for his party has cratered. He spent much of his time trying to paint Carney as an out-of-touch elite who will cut public services.Bloc Québécois Leader Yves-François Blanchet was on a similar message track, accusing Carney of being a corporate bigwig who won't stand up for Quebec's interests.Carney held his own in the face of the onslaught, trying to portray himself as the adult in the room who is best placed to help steer Canada through a period of tremendous upheaval with its once-solid relationship with the U.S. in tatters and the economy on shaky ground."Mark Carney is asking for a fourth Liberal term. Are you prepared to elect the same Liberal MPs, the same Liberal ministers, the same Liberal staffers all over again for a fourth term?" Poilievre said.‘I do my own talking points,’ says Carney Carney took Poilievre on, saying the Conservative leader is trying to paint him as Trudeau 2.0 and it's just not true — he will be laser-focused on the economy and producing results on the issues that matter most to Canadians after years of inaction on some big files."It may be difficult for Mr. Poilievre. You spent years running against Justin Trudeau and the carbon tax and they are both gone," Carney said. "I am a very different person than Justin Trudeau. I am focused on results."As for the claim he is taking direction from Trudeau's people, Carney said with a smile: "Look, I do my own talking points thank you very much."Carney said Canada is facing the greatest crisis of our lifetimes with U.S. President Donald Trump threatening the country's economy and its very existence and he jumped into politics now because he has what it takes to the lead the country through the "Trump crisis" and this perilous moment.He said that only weeks into his tenure as prime minister, he has already crafted an agreement with the provinces to break down decades-old internal trade barriers that have long held back domestic free trade by Canada Day.He said Canada's retaliatory tariffs are hitting the Americans where it hurts and he is poised to sit down with Trump to hash out a new bilateral agreement after this election."We can give ourselves far more than Donald Trump can take away," Carney said. "The biggest risk we have to face is Donald Trump. We've got to get that right."Poilievre returned to the theme of Carney being a Trudeau repeat throughout the debate and, in a particularly dramatic moment, he asked the current Liberal leader at one point to apologize to Canadians for the inflation they experienced in the post-COVID period.Carney said he wasn't in the last government, he briefly served as an economic adviser on a part-time basis and he didn't advise the Liberals to do any of the things that fuelled the cost-of-living crisis. He said he's already cut the last government's carbon tax and he has a plan to build many more homes than they did, which would help with affordability issues."The way you judge someone is how how they act," Carney said. "When I was governor of the Bank of Canada, inflation was below two per cent and the dollar was at parity. That is the kind of success I can deliver for this country."Carney said he's an experienced crisis manager who helped Canada get through the Great Recession and the U.K. navigate Brexit — and he can do it again now."I've built strong economies," he said. "And we will build the strongest economy."The debate was much more combative than Wednesday's French-language event.There was more cross-talk and pointed attacks, probably because this is the last match-up of the campaign and millions of people were expected to watch just before advance polls open Friday. The commission's last English debate in 2021 pulled in 10 million viewers.Singh was often leading the assault, accusing Carney of being a Bay Street sellout and saying Poilievre is "disgusting" for how he's described Palestinian aid groups caught up in the Gaza conflict. Blanchet at times struggled in his second language but accused Carney of saying one thing about pipelines in English and another in French.Polls suggest Poilievre is in second place in an election that's shaping up to be a two-man race, and he took his chance to take Carney on — including sparring with the Liberal leader on the issue of crime.Poilievre said the last Liberal government let criminals run wild and violent crime spiral out of control and he is promising to invoke the notwithstanding clause to stop the courts from blocking some of his more aggressive anti-crime measures, including a plan to lock some people up for much longer.Carney said "it's very dangerous" for Poilievre to threaten to override Canadians' Charter rights, saying Poilievre might say it's about punishing hardened criminals but it could be "a slippery slope" with other freedoms potentially under threat."It's not where you start but where will you stop," Carney said.Poilievre said he's more interested in the protecting the Section 7 Charter rights of Canadians to enjoy life, liberty and security of the person — not the rights of convicted criminals."He says its dangerous for me to ensure that mass murderers stay behind bars for life. You know what's dangerous? Turning them loose on our streets," Poilievre said. "People are living in terror."The Carney campaign has sensed crime is a weak spot for the party given past criticism of bail policies — especially in Toronto and the surrounding region. Carney announced some tough-on-crime measures earlier in the campaign and said tonight he supports a crackdown.Under pressure on crime, Carney raised firearms and Poilievre's pledge to dismantle the last government's gun control legislation. "You can't be tough on crime unless you're tough on guns," Carney said.Poilievre also zeroed in on pipelines, saying he will push through oil and gas development to tamp down Canada's dependence on foreign oil — and give Alberta's oil patch access to world markets.He said Carney just isn't pro-pipeline enough because he will keep the past Liberal government's environmental assessment process, which is loathed by some parts of the natural resources sector. He said keeping those regulations "empowers Donald Trump to have a monopoly on our single-biggest export."Blanchet said Quebec won't stand for an oil pipeline running through the province — even though some recent polls show voters there are open to these projects.Blanchet said it doesn't make sense to build pipelines with long construction lead times to take on Trump when he will be out of office in four years' time."Mr. Trump will be 90 years old and not the president," Blanchet said."He might be, he might try," Carney said, prompting a chuckle from Poilievre — a rare moment of levity between the two. Leaders asked what is the biggest security threat to Canada right nowSingh said Poilievre talks a big game about building more homes but his track record under former prime minister Stephen Harper was lacklustre.Pointing to past reporting on Poilievre's time as minister, Singh said Poilievre got very few homes built when housing was part of his cabinet portfolio."It was six homes and that's the facts," Singh said, holding up six fingers. "You can count to six, which is great." Poilievre bristled at the suggestion, saying the number of homes built on his watch was a lot higher than that.Singh said Poilievre's claim that the Liberals are anti-oil is "wild.""The Liberals bought a pipeline and they're pretty pro-pipeline. I don't know what Pierre's complaining about but that's what they did," he said.He said a Conservative government would torch the environment with no rules on development, allowing "big polluters" to run rampant.Poilievre said his climate agenda is all about driving down emissions abroad by exporting more Canadian energy to displace coal used in places like China and India.Main party leaders deliver their pitch to voters at end of English debatePoilievre came down hard on the last Liberal government's track record on immigration, saying the party's leaders let too many people in, which has led to "massive overcrowding in our communities."He promised to get back to "normal levels" of immigration and rid the temporary foreign worker stream of fraud, something the Liberal government has started to do.He said Carney wants to follow "a radical policy" of ever more people coming in to get the country's population to 100 million by the end of the century.Carney didn't get a chance to respond to the accusations but said in last night's French-language debate he supports a cap on immigration to reduce the number of newcomers.Singh pressed Carney on his time at Brookfield Asset Management, a company that has some of its investment funds registered in tax havens like Bermuda and the Cayman Islands.Singh said Carney spent his time in the private sector looking out for billionaires and can't be trusted to help working people, if elected."Whose side are you really on?" Singh asked at one point, asking voters to return more New Democrats "to force Liberals to worry about people they will forget."Carney defended the company he used to chair, saying it's a "Canadian success story" and one of the largest infrastructure companies in the world, a widely held stock that helps fund pensions for workers like teachers and firefighters."Yes, I have had a long career in the private sector. I'm proud of that career and I've always acted with integrity," Carney said.Singh also pressed Carney on his commitment to do away with the capital gains tax inclusion rate hike that Trudeau first put in place. Carney said he needed to do that now because higher taxes would torpedo economic growth."We need to build this country. Innovators, entrepreneurs need to be rewarded — that's why I brought it back down," Carney said.Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Donald Trump",
-        "sentiment": "negative",
-    },
-     {
-        "news_article": """With polls showing Liberal Leader Mark Carney is the front-runner in this federal election, the other three main party leaders on stage for Thursday's English-language debate spent much of the contest trying to tear him down.Conservative Leader Pierre Poilievre took aim at Carney early on in the high-stakes debate, saying his government would not be all that different from the one led by his unpopular predecessor, former prime minister Justin Trudeau. He urged voters to make a change.NDP Leader Jagmeet Singh was chippy throughout the debate, frequently interrupting Poilievre and Carney as he jockeys to get noticed while polls suggest support for his party has cratered. He spent much of his time trying to paint Carney as an out-of-touch elite who will cut public services.Bloc Québécois Leader Yves-François Blanchet was on a similar message track, accusing Carney of being a corporate bigwig who won't stand up for Quebec's interests.Carney held his own in the face of the onslaught, trying to portray himself as the adult in the room who is best placed to help steer Canada through a period of tremendous upheaval with its once-solid relationship with the U.S. in tatters and the economy on shaky ground."Mark Carney is asking for a fourth Liberal term. Are you prepared to elect the same Liberal MPs, the same Liberal ministers, the same Liberal staffers all over again for a fourth term?" Poilievre said.‘I do my own talking points,’ says Carney Carney took Poilievre on, saying the Conservative leader is trying to paint him as Trudeau 2.0 and it's just not true — he will be laser-focused on the economy and producing results on the issues that matter most to Canadians after years of inaction on some big files."It may be difficult for Mr. Poilievre. You spent years running against Justin Trudeau and the carbon tax and they are both gone," Carney said. "I am a very different person than Justin Trudeau. I am focused on results."As for the claim he is taking direction from Trudeau's people, Carney said with a smile: "Look, I do my own talking points thank you very much."Carney said Canada is facing the greatest crisis of our lifetimes with U.S. President Donald Trump threatening the country's economy and its very existence and he jumped into politics now because he has what it takes to the lead the country through the "Trump crisis" and this perilous moment.He said that only weeks into his tenure as prime minister, he has already crafted an agreement with the provinces to break down decades-old internal trade barriers that have long held back domestic free trade by Canada Day.He said Canada's retaliatory tariffs are hitting the Americans where it hurts and he is poised to sit down with Trump to hash out a new bilateral agreement after this election."We can give ourselves far more than Donald Trump can take away," Carney said. "The biggest risk we have to face is Donald Trump. We've got to get that right."Poilievre returned to the theme of Carney being a Trudeau repeat throughout the debate and, in a particularly dramatic moment, he asked the current Liberal leader at one point to apologize to Canadians for the inflation they experienced in the post-COVID period.Carney said he wasn't in the last government, he briefly served as an economic adviser on a part-time basis and he didn't advise the Liberals to do any of the things that fuelled the cost-of-living crisis. He said he's already cut the last government's carbon tax and he has a plan to build many more homes than they did, which would help with affordability issues."The way you judge someone is how how they act," Carney said. "When I was governor of the Bank of Canada, inflation was below two per cent and the dollar was at parity. That is the kind of success I can deliver for this country."Carney said he's an experienced crisis manager who helped Canada get through the Great Recession and the U.K. navigate Brexit — and he can do it again now."I've built strong economies," he said. "And we will build the strongest economy."The debate was much more combative than Wednesday's French-language event.There was more cross-talk and pointed attacks, probably because this is the last match-up of the campaign and millions of people were expected to watch just before advance polls open Friday. The commission's last English debate in 2021 pulled in 10 million viewers.Singh was often leading the assault, accusing Carney of being a Bay Street sellout and saying Poilievre is "disgusting" for how he's described Palestinian aid groups caught up in the Gaza conflict. Blanchet at times struggled in his second language but accused Carney of saying one thing about pipelines in English and another in French.Polls suggest Poilievre is in second place in an election that's shaping up to be a two-man race, and he took his chance to take Carney on — including sparring with the Liberal leader on the issue of crime.Poilievre said the last Liberal government let criminals run wild and violent crime spiral out of control and he is promising to invoke the notwithstanding clause to stop the courts from blocking some of his more aggressive anti-crime measures, including a plan to lock some people up for much longer.Carney said "it's very dangerous" for Poilievre to threaten to override Canadians' Charter rights, saying Poilievre might say it's about punishing hardened criminals but it could be "a slippery slope" with other freedoms potentially under threat."It's not where you start but where will you stop," Carney said.Poilievre said he's more interested in the protecting the Section 7 Charter rights of Canadians to enjoy life, liberty and security of the person — not the rights of convicted criminals."He says its dangerous for me to ensure that mass murderers stay behind bars for life. You know what's dangerous? Turning them loose on our streets," Poilievre said. "People are living in terror."The Carney campaign has sensed crime is a weak spot for the party given past criticism of bail policies — especially in Toronto and the surrounding region. Carney announced some tough-on-crime measures earlier in the campaign and said tonight he supports a crackdown.Under pressure on crime, Carney raised firearms and Poilievre's pledge to dismantle the last government's gun control legislation. "You can't be tough on crime unless you're tough on guns," Carney said.Poilievre also zeroed in on pipelines, saying he will push through oil and gas development to tamp down Canada's dependence on foreign oil — and give Alberta's oil patch access to world markets.He said Carney just isn't pro-pipeline enough because he will keep the past Liberal government's environmental assessment process, which is loathed by some parts of the natural resources sector. He said keeping those regulations "empowers Donald Trump to have a monopoly on our single-biggest export."Blanchet said Quebec won't stand for an oil pipeline running through the province — even though some recent polls show voters there are open to these projects.Blanchet said it doesn't make sense to build pipelines with long construction lead times to take on Trump when he will be out of office in four years' time."Mr. Trump will be 90 years old and not the president," Blanchet said."He might be, he might try," Carney said, prompting a chuckle from Poilievre — a rare moment of levity between the two. Leaders asked what is the biggest security threat to Canada right nowSingh said Poilievre talks a big game about building more homes but his track record under former prime minister Stephen Harper was lacklustre.Pointing to past reporting on Poilievre's time as minister, Singh said Poilievre got very few homes built when housing was part of his cabinet portfolio."It was six homes and that's the facts," Singh said, holding up six fingers. "You can count to six, which is great." Poilievre bristled at the suggestion, saying the number of homes built on his watch was a lot higher than that.Singh said Poilievre's claim that the Liberals are anti-oil is "wild.""The Liberals bought a pipeline and they're pretty pro-pipeline. I don't know what Pierre's complaining about but that's what they did," he said.He said a Conservative government would torch the environment with no rules on development, allowing "big polluters" to run rampant.Poilievre said his climate agenda is all about driving down emissions abroad by exporting more Canadian energy to displace coal used in places like China and India.Main party leaders deliver their pitch to voters at end of English debatePoilievre came down hard on the last Liberal government's track record on immigration, saying the party's leaders let too many people in, which has led to "massive overcrowding in our communities."He promised to get back to "normal levels" of immigration and rid the temporary foreign worker stream of fraud, something the Liberal government has started to do.He said Carney wants to follow "a radical policy" of ever more people coming in to get the country's population to 100 million by the end of the century.Carney didn't get a chance to respond to the accusations but said in last night's French-language debate he supports a cap on immigration to reduce the number of newcomers.Singh pressed Carney on his time at Brookfield Asset Management, a company that has some of its investment funds registered in tax havens like Bermuda and the Cayman Islands.Singh said Carney spent his time in the private sector looking out for billionaires and can't be trusted to help working people, if elected."Whose side are you really on?" Singh asked at one point, asking voters to return more New Democrats "to force Liberals to worry about people they will forget."Carney defended the company he used to chair, saying it's a "Canadian success story" and one of the largest infrastructure companies in the world, a widely held stock that helps fund pensions for workers like teachers and firefighters."Yes, I have had a long career in the private sector. I'm proud of that career and I've always acted with integrity," Carney said.Singh also pressed Carney on his commitment to do away with the capital gains tax inclusion rate hike that Trudeau first put in place. Carney said he needed to do that now because higher taxes would torpedo economic growth."We need to build this country. Innovators, entrepreneurs need to be rewarded — that's why I brought it back down," Carney said.Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Tom Holland",
-        "sentiment": "unrelated",
-    },
-    {
-        "news_article": """With polls showing Liberal Leader Mark Carney is the front-runner in this federal election, the other three main party leaders on stage for Thursday's English-language debate spent much of the contest trying to tear him down.Conservative Leader Pierre Poilievre took aim at Carney early on in the high-stakes debate, saying his government would not be all that different from the one led by his unpopular predecessor, former prime minister Justin Trudeau. He urged voters to make a change.NDP Leader Jagmeet Singh was chippy throughout the debate, frequently interrupting Poilievre and Carney as he jockeys to get noticed while polls suggest support for his party has cratered. He spent much of his time trying to paint Carney as an out-of-touch elite who will cut public services.Bloc Québécois Leader Yves-François Blanchet was on a similar message track, accusing Carney of being a corporate bigwig who won't stand up for Quebec's interests.Carney held his own in the face of the onslaught, trying to portray himself as the adult in the room who is best placed to help steer Canada through a period of tremendous upheaval with its once-solid relationship with the U.S. in tatters and the economy on shaky ground."Mark Carney is asking for a fourth Liberal term. Are you prepared to elect the same Liberal MPs, the same Liberal ministers, the same Liberal staffers all over again for a fourth term?" Poilievre said.‘I do my own talking points,’ says Carney Carney took Poilievre on, saying the Conservative leader is trying to paint him as Trudeau 2.0 and it's just not true — he will be laser-focused on the economy and producing results on the issues that matter most to Canadians after years of inaction on some big files."It may be difficult for Mr. Poilievre. You spent years running against Justin Trudeau and the carbon tax and they are both gone," Carney said. "I am a very different person than Justin Trudeau. I am focused on results."As for the claim he is taking direction from Trudeau's people, Carney said with a smile: "Look, I do my own talking points thank you very much."Carney said Canada is facing the greatest crisis of our lifetimes with U.S. President Donald Trump threatening the country's economy and its very existence and he jumped into politics now because he has what it takes to the lead the country through the "Trump crisis" and this perilous moment.He said that only weeks into his tenure as prime minister, he has already crafted an agreement with the provinces to break down decades-old internal trade barriers that have long held back domestic free trade by Canada Day.He said Canada's retaliatory tariffs are hitting the Americans where it hurts and he is poised to sit down with Trump to hash out a new bilateral agreement after this election."We can give ourselves far more than Donald Trump can take away," Carney said. "The biggest risk we have to face is Donald Trump. We've got to get that right."Poilievre returned to the theme of Carney being a Trudeau repeat throughout the debate and, in a particularly dramatic moment, he asked the current Liberal leader at one point to apologize to Canadians for the inflation they experienced in the post-COVID period.Carney said he wasn't in the last government, he briefly served as an economic adviser on a part-time basis and he didn't advise the Liberals to do any of the things that fuelled the cost-of-living crisis. He said he's already cut the last government's carbon tax and he has a plan to build many more homes than they did, which would help with affordability issues."The way you judge someone is how how they act," Carney said. "When I was governor of the Bank of Canada, inflation was below two per cent and the dollar was at parity. That is the kind of success I can deliver for this country."Carney said he's an experienced crisis manager who helped Canada get through the Great Recession and the U.K. navigate Brexit — and he can do it again now."I've built strong economies," he said. "And we will build the strongest economy."The debate was much more combative than Wednesday's French-language event.There was more cross-talk and pointed attacks, probably because this is the last match-up of the campaign and millions of people were expected to watch just before advance polls open Friday. The commission's last English debate in 2021 pulled in 10 million viewers.Singh was often leading the assault, accusing Carney of being a Bay Street sellout and saying Poilievre is "disgusting" for how he's described Palestinian aid groups caught up in the Gaza conflict. Blanchet at times struggled in his second language but accused Carney of saying one thing about pipelines in English and another in French.Polls suggest Poilievre is in second place in an election that's shaping up to be a two-man race, and he took his chance to take Carney on — including sparring with the Liberal leader on the issue of crime.Poilievre said the last Liberal government let criminals run wild and violent crime spiral out of control and he is promising to invoke the notwithstanding clause to stop the courts from blocking some of his more aggressive anti-crime measures, including a plan to lock some people up for much longer.Carney said "it's very dangerous" for Poilievre to threaten to override Canadians' Charter rights, saying Poilievre might say it's about punishing hardened criminals but it could be "a slippery slope" with other freedoms potentially under threat."It's not where you start but where will you stop," Carney said.Poilievre said he's more interested in the protecting the Section 7 Charter rights of Canadians to enjoy life, liberty and security of the person — not the rights of convicted criminals."He says its dangerous for me to ensure that mass murderers stay behind bars for life. You know what's dangerous? Turning them loose on our streets," Poilievre said. "People are living in terror."The Carney campaign has sensed crime is a weak spot for the party given past criticism of bail policies — especially in Toronto and the surrounding region. Carney announced some tough-on-crime measures earlier in the campaign and said tonight he supports a crackdown.Under pressure on crime, Carney raised firearms and Poilievre's pledge to dismantle the last government's gun control legislation. "You can't be tough on crime unless you're tough on guns," Carney said.Poilievre also zeroed in on pipelines, saying he will push through oil and gas development to tamp down Canada's dependence on foreign oil — and give Alberta's oil patch access to world markets.He said Carney just isn't pro-pipeline enough because he will keep the past Liberal government's environmental assessment process, which is loathed by some parts of the natural resources sector. He said keeping those regulations "empowers Donald Trump to have a monopoly on our single-biggest export."Blanchet said Quebec won't stand for an oil pipeline running through the province — even though some recent polls show voters there are open to these projects.Blanchet said it doesn't make sense to build pipelines with long construction lead times to take on Trump when he will be out of office in four years' time."Mr. Trump will be 90 years old and not the president," Blanchet said."He might be, he might try," Carney said, prompting a chuckle from Poilievre — a rare moment of levity between the two. Leaders asked what is the biggest security threat to Canada right nowSingh said Poilievre talks a big game about building more homes but his track record under former prime minister Stephen Harper was lacklustre.Pointing to past reporting on Poilievre's time as minister, Singh said Poilievre got very few homes built when housing was part of his cabinet portfolio."It was six homes and that's the facts," Singh said, holding up six fingers. "You can count to six, which is great." Poilievre bristled at the suggestion, saying the number of homes built on his watch was a lot higher than that.Singh said Poilievre's claim that the Liberals are anti-oil is "wild.""The Liberals bought a pipeline and they're pretty pro-pipeline. I don't know what Pierre's complaining about but that's what they did," he said.He said a Conservative government would torch the environment with no rules on development, allowing "big polluters" to run rampant.Poilievre said his climate agenda is all about driving down emissions abroad by exporting more Canadian energy to displace coal used in places like China and India.Main party leaders deliver their pitch to voters at end of English debatePoilievre came down hard on the last Liberal government's track record on immigration, saying the party's leaders let too many people in, which has led to "massive overcrowding in our communities."He promised to get back to "normal levels" of immigration and rid the temporary foreign worker stream of fraud, something the Liberal government has started to do.He said Carney wants to follow "a radical policy" of ever more people coming in to get the country's population to 100 million by the end of the century.Carney didn't get a chance to respond to the accusations but said in last night's French-language debate he supports a cap on immigration to reduce the number of newcomers.Singh pressed Carney on his time at Brookfield Asset Management, a company that has some of its investment funds registered in tax havens like Bermuda and the Cayman Islands.Singh said Carney spent his time in the private sector looking out for billionaires and can't be trusted to help working people, if elected."Whose side are you really on?" Singh asked at one point, asking voters to return more New Democrats "to force Liberals to worry about people they will forget."Carney defended the company he used to chair, saying it's a "Canadian success story" and one of the largest infrastructure companies in the world, a widely held stock that helps fund pensions for workers like teachers and firefighters."Yes, I have had a long career in the private sector. I'm proud of that career and I've always acted with integrity," Carney said.Singh also pressed Carney on his commitment to do away with the capital gains tax inclusion rate hike that Trudeau first put in place. Carney said he needed to do that now because higher taxes would torpedo economic growth."We need to build this country. Innovators, entrepreneurs need to be rewarded — that's why I brought it back down," Carney said.Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Tom Marvolo Riddle",
-        "sentiment": "unrelated",
-    },
-    {
-        'news_article': """The New Democratic Party is promising to raise about $94.5 billion by taxing the extremely wealthy, a plan designed to help finance tens of billions in new spending, deliver a tax cut for workers and bolster and expand Canada's health-care system."I'm proud to share our campaign commitments. It's clear. It's bold. And it's focused on the people who build this country," said NDP Leader Jagmeet Singh as he unveiled the party's platform at a campaign event in Burnaby, B.C., on Saturday morning.The NDP says those commitments will add $48 billion to the federal deficit over the next four years on top of the existing deficit. The party also says $42.2 billion is new spending not offset by revenue.In the fall economic statement, the Liberal government of former prime minister Justin Trudeau projected the deficit in 2025-26 would sit at $42.2 billion. That was projected to drop to $31 billion in 2026-27, $30.4 billion in 2027-28 and $27.8 billion in 2028-29.Singh defends projected deficit increase in NDP platformThe top revenue generator in the NDP platform is a graduated wealth tax.The NDP would implement a one per cent tax on households with a net worth between $10 million and $50 million, two per cent for those worth $50 million to $100 million and three per cent for those over $100 million.According to their platform, that would raise about $94.5 billion in revenue over four years. The party also says they can raise $24.8 billion by closing tax loopholes and another $8 billion by reducing the federal government's use of consultants.That money would help finance a costly part of the NDP platform, which is to raise the basic personal amount — the threshold under which Canadians do not pay tax — to $19,500, along with improving Canada's employment insurance system.Raising the basic personal amount will cost approximately $48.1 billion over four years, according to the NDP platform."No nurse, no teacher, no tradesperson should pay more than a billionaire flipping stocks," Singh said on Saturday.The New Democrats also want to improve Canada's employment insurance system by extending the duration that benefits last to 50 weeks, as well as increasing the benefit level and insurable earnings cap to provide a minimum weekly benefit of $450.That's expected to cost $41 billion over four years. The party says $16 billion would be spent in the next budget year, with the number scaling down over the three following budget years as Canada navigates its ongoing trade war with the United States.The NDP is pledging $46.2 billion in new health-care spending over the next four years.Expanding Canadians' access to health care has been a cornerstone of Singh's campaign. The NDP announced earlier in April they would train more doctors and boost Canada Health Transfers by an extra one per cent to provinces that commit to action.The party's platform says that part of their health-care plan will cost $10 billion over four years.Singh says NDP would ensure every Canadian can access family doctor by 2030The NDP also wants to implement a universal pharmacare program within four years, projecting that will cost approximately $29.2 billion over that time frame.Liberals and New Democrats reach a deal on pharmacareOn Saturday, the NDP also unveiled a new plank of their health-care plan: spending $7 billion over four years to expand mental health coverage so Canadians can better access services like psychotherapy and counselling."We'll make mental health care part of public health care. No more waiting. No more choosing between your well-being and your bank account," Singh said.The NDP platform also acknowledges that Canada's "economic and fiscal picture is uncertain and facing unprecedented volatility as a consequence of Donald Trump's trade war.""In an abundance of caution, our fiscal plan will set aside an additional amount each year as a contingency fund," the platform says, adding that the fund can hedge against risks, external shocks or events that could reduce government revenue.The NDP promises to set aside approximately $4.2 billion over four years for the contingency fund.In its platform, the NDP also said it rejects "calls for cuts to the public sector and to social programs — cuts which would be made to reach a budgetary balance in the short-term, despite the costs and the consequences for people.""Instead, we are proposing increased investments in both infrastructure and in people," the NDP added.Associate ProducerBenjamin Lopez Steven is a reporter and associate producer for CBC Politics. He was also a 2024 Joan Donaldson Scholar and a graduate of Carleton University. You can reach him at benjamin.steven@cbc.ca or find him on Twitter at @bensteven_s.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Tom Holland",
-        "sentiment": "unrelated",
-    },
-    {
-        'news_article': """The New Democratic Party is promising to raise about $94.5 billion by taxing the extremely wealthy, a plan designed to help finance tens of billions in new spending, deliver a tax cut for workers and bolster and expand Canada's health-care system."I'm proud to share our campaign commitments. It's clear. It's bold. And it's focused on the people who build this country," said NDP Leader Jagmeet Singh as he unveiled the party's platform at a campaign event in Burnaby, B.C., on Saturday morning.The NDP says those commitments will add $48 billion to the federal deficit over the next four years on top of the existing deficit. The party also says $42.2 billion is new spending not offset by revenue.In the fall economic statement, the Liberal government of former prime minister Justin Trudeau projected the deficit in 2025-26 would sit at $42.2 billion. That was projected to drop to $31 billion in 2026-27, $30.4 billion in 2027-28 and $27.8 billion in 2028-29.Singh defends projected deficit increase in NDP platformThe top revenue generator in the NDP platform is a graduated wealth tax.The NDP would implement a one per cent tax on households with a net worth between $10 million and $50 million, two per cent for those worth $50 million to $100 million and three per cent for those over $100 million.According to their platform, that would raise about $94.5 billion in revenue over four years. The party also says they can raise $24.8 billion by closing tax loopholes and another $8 billion by reducing the federal government's use of consultants.That money would help finance a costly part of the NDP platform, which is to raise the basic personal amount — the threshold under which Canadians do not pay tax — to $19,500, along with improving Canada's employment insurance system.Raising the basic personal amount will cost approximately $48.1 billion over four years, according to the NDP platform."No nurse, no teacher, no tradesperson should pay more than a billionaire flipping stocks," Singh said on Saturday.The New Democrats also want to improve Canada's employment insurance system by extending the duration that benefits last to 50 weeks, as well as increasing the benefit level and insurable earnings cap to provide a minimum weekly benefit of $450.That's expected to cost $41 billion over four years. The party says $16 billion would be spent in the next budget year, with the number scaling down over the three following budget years as Canada navigates its ongoing trade war with the United States.The NDP is pledging $46.2 billion in new health-care spending over the next four years.Expanding Canadians' access to health care has been a cornerstone of Singh's campaign. The NDP announced earlier in April they would train more doctors and boost Canada Health Transfers by an extra one per cent to provinces that commit to action.The party's platform says that part of their health-care plan will cost $10 billion over four years.Singh says NDP would ensure every Canadian can access family doctor by 2030The NDP also wants to implement a universal pharmacare program within four years, projecting that will cost approximately $29.2 billion over that time frame.Liberals and New Democrats reach a deal on pharmacareOn Saturday, the NDP also unveiled a new plank of their health-care plan: spending $7 billion over four years to expand mental health coverage so Canadians can better access services like psychotherapy and counselling."We'll make mental health care part of public health care. No more waiting. No more choosing between your well-being and your bank account," Singh said.The NDP platform also acknowledges that Canada's "economic and fiscal picture is uncertain and facing unprecedented volatility as a consequence of Donald Trump's trade war.""In an abundance of caution, our fiscal plan will set aside an additional amount each year as a contingency fund," the platform says, adding that the fund can hedge against risks, external shocks or events that could reduce government revenue.The NDP promises to set aside approximately $4.2 billion over four years for the contingency fund.In its platform, the NDP also said it rejects "calls for cuts to the public sector and to social programs — cuts which would be made to reach a budgetary balance in the short-term, despite the costs and the consequences for people.""Instead, we are proposing increased investments in both infrastructure and in people," the NDP added.Associate ProducerBenjamin Lopez Steven is a reporter and associate producer for CBC Politics. He was also a 2024 Joan Donaldson Scholar and a graduate of Carleton University. You can reach him at benjamin.steven@cbc.ca or find him on Twitter at @bensteven_s.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "NDP",
-        "sentiment": "positive",
-    },
-    {
-        'news_article': """The New Democratic Party is promising to raise about $94.5 billion by taxing the extremely wealthy, a plan designed to help finance tens of billions in new spending, deliver a tax cut for workers and bolster and expand Canada's health-care system."I'm proud to share our campaign commitments. It's clear. It's bold. And it's focused on the people who build this country," said NDP Leader Jagmeet Singh as he unveiled the party's platform at a campaign event in Burnaby, B.C., on Saturday morning.The NDP says those commitments will add $48 billion to the federal deficit over the next four years on top of the existing deficit. The party also says $42.2 billion is new spending not offset by revenue.In the fall economic statement, the Liberal government of former prime minister Justin Trudeau projected the deficit in 2025-26 would sit at $42.2 billion. That was projected to drop to $31 billion in 2026-27, $30.4 billion in 2027-28 and $27.8 billion in 2028-29.Singh defends projected deficit increase in NDP platformThe top revenue generator in the NDP platform is a graduated wealth tax.The NDP would implement a one per cent tax on households with a net worth between $10 million and $50 million, two per cent for those worth $50 million to $100 million and three per cent for those over $100 million.According to their platform, that would raise about $94.5 billion in revenue over four years. The party also says they can raise $24.8 billion by closing tax loopholes and another $8 billion by reducing the federal government's use of consultants.That money would help finance a costly part of the NDP platform, which is to raise the basic personal amount — the threshold under which Canadians do not pay tax — to $19,500, along with improving Canada's employment insurance system.Raising the basic personal amount will cost approximately $48.1 billion over four years, according to the NDP platform."No nurse, no teacher, no tradesperson should pay more than a billionaire flipping stocks," Singh said on Saturday.The New Democrats also want to improve Canada's employment insurance system by extending the duration that benefits last to 50 weeks, as well as increasing the benefit level and insurable earnings cap to provide a minimum weekly benefit of $450.That's expected to cost $41 billion over four years. The party says $16 billion would be spent in the next budget year, with the number scaling down over the three following budget years as Canada navigates its ongoing trade war with the United States.The NDP is pledging $46.2 billion in new health-care spending over the next four years.Expanding Canadians' access to health care has been a cornerstone of Singh's campaign. The NDP announced earlier in April they would train more doctors and boost Canada Health Transfers by an extra one per cent to provinces that commit to action.The party's platform says that part of their health-care plan will cost $10 billion over four years.Singh says NDP would ensure every Canadian can access family doctor by 2030The NDP also wants to implement a universal pharmacare program within four years, projecting that will cost approximately $29.2 billion over that time frame.Liberals and New Democrats reach a deal on pharmacareOn Saturday, the NDP also unveiled a new plank of their health-care plan: spending $7 billion over four years to expand mental health coverage so Canadians can better access services like psychotherapy and counselling."We'll make mental health care part of public health care. No more waiting. No more choosing between your well-being and your bank account," Singh said.The NDP platform also acknowledges that Canada's "economic and fiscal picture is uncertain and facing unprecedented volatility as a consequence of Donald Trump's trade war.""In an abundance of caution, our fiscal plan will set aside an additional amount each year as a contingency fund," the platform says, adding that the fund can hedge against risks, external shocks or events that could reduce government revenue.The NDP promises to set aside approximately $4.2 billion over four years for the contingency fund.In its platform, the NDP also said it rejects "calls for cuts to the public sector and to social programs — cuts which would be made to reach a budgetary balance in the short-term, despite the costs and the consequences for people.""Instead, we are proposing increased investments in both infrastructure and in people," the NDP added.Associate ProducerBenjamin Lopez Steven is a reporter and associate producer for CBC Politics. He was also a 2024 Joan Donaldson Scholar and a graduate of Carleton University. You can reach him at benjamin.steven@cbc.ca or find him on Twitter at @bensteven_s.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Mark Carney",
-        "sentiment": "unrelated",
-    },
-    {
-        'news_article': """Joana Valamootoo felt Canada was a welcoming place when she immigrated here from Mauritius in 2012, but that sense has faded in recent years as immigration numbers have gone up and up."I came here in 2012 on a francophone initiative program, an immigration program, and I was welcome, but I was also provided what I needed to succeed here," she said. She believes that's no longer the case for newcomers to the country.CBC has been asking people across the country about the issues that matter most to them in the April 28, 2025, federal election.While immigration has taken a backseat to concerns like national unity and tariffs, Valamootoo said it's top of mind for her. She wants to hear leaders talk about how they will integrate newcomers into the country."I think the past three years there has been a lot of mistakes by the federal government with regard to how many people they were letting in."She feels that's led to a rise in racism and a backlash against immigrants and international students, who've been blamed for crises in housing and education."I think we need a leader that can bring people together, instead of creating division," she said.As Canada's population has pushed past 41 million people, Canadians and immigrants alike have expressed concern about whether the country has planned enough to incorporate new immigrants into workspaces, schools and homes. The Saskatchewan Urban Municipalities Association recently commissioned a poll, which found 68 per cent of Saskatchewan people surveyed online supported reducing immigration.Sanjeev Kumar came to Canada on a work permit in 2008 to work in Alberta's restaurant industry and recently opened his own restaurant in northeast Calgary.He's also seen a rise in anti-immigrant sentiment, which he believes is intensified by immigrants being willing to work in minimum wage jobs and creating intense competition for work."Nobody has a job right now. People are struggling. Everyone is struggling. Groceries are so expensive," he said.Kumar said the problem hits international students and other newcomers particularly badly. He has students coming to him, asking for work."They are in college, about to finish, but they don't have money … they don't have food to eat."Kumar said these students and people on work permits also don't have the same clear path to residency that he did when he came to Canada. Kumar got his permanent residency in three years."That time actually, when Harper government was there, I think everything is controlled," he said, adding there needs to be a balance between immigration and integration."Right now there's no balance there. They don't know what they are doing."Since getting his citizenship, Kumar has voted Conservative, but said he's not convinced either of the two main parties have a bold plan to bolster the economy and ensure there's a stronger job market for newcomers and Canadians alike."They are just thinking, small thinking [like] we just take out carbon tax," he said. "They don't have a clear vision for Canada."Ali Abukar, CEO for the Saskatoon Open Door Society, said settlement services like his are among those that help newcomers integrate to Canada with things like employment training and language education. He said the federal government has scaled back money for these organizations as it reduces immigration targets, leading to program cuts at both the Saskatoon and Regina Open Door societies.Reducing immigrant and international student populations can't be done hastily, Abukar said."A lot of the international students have been contributing a lot of money not only to schools and educational institutions, but also businesses and housing," he said. He said immigrants will still be needed to help Canada resolve issues like the labour that's needed to build houses.It speaks to the pressing need for the next elected government to take a phased approach to integrating newcomers into Canada, Abukar said."Our [immigration] numbers didn't become where they are at in just the switch of a light. And we can't reverse them the same way," he said."We all need to do better in terms of educating people and raising awareness and making sure that we're building an inclusive … equitable society."Janani Whitfield is a community engagement producer who also edits feature storytelling and first-person pieces for CBC Saskatchewan. Contact her at janani.whitfield@cbc.ca. Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Mark Carney",
-        "sentiment": "unrelated",
+from training.dataset import Dataset
 
-    },
-      {
-        'news_article': """Joana Valamootoo felt Canada was a welcoming place when she immigrated here from Mauritius in 2012, but that sense has faded in recent years as immigration numbers have gone up and up."I came here in 2012 on a francophone initiative program, an immigration program, and I was welcome, but I was also provided what I needed to succeed here," she said. She believes that's no longer the case for newcomers to the country.CBC has been asking people across the country about the issues that matter most to them in the April 28, 2025, federal election.While immigration has taken a backseat to concerns like national unity and tariffs, Valamootoo said it's top of mind for her. She wants to hear leaders talk about how they will integrate newcomers into the country."I think the past three years there has been a lot of mistakes by the federal government with regard to how many people they were letting in."She feels that's led to a rise in racism and a backlash against immigrants and international students, who've been blamed for crises in housing and education."I think we need a leader that can bring people together, instead of creating division," she said.As Canada's population has pushed past 41 million people, Canadians and immigrants alike have expressed concern about whether the country has planned enough to incorporate new immigrants into workspaces, schools and homes. The Saskatchewan Urban Municipalities Association recently commissioned a poll, which found 68 per cent of Saskatchewan people surveyed online supported reducing immigration.Sanjeev Kumar came to Canada on a work permit in 2008 to work in Alberta's restaurant industry and recently opened his own restaurant in northeast Calgary.He's also seen a rise in anti-immigrant sentiment, which he believes is intensified by immigrants being willing to work in minimum wage jobs and creating intense competition for work."Nobody has a job right now. People are struggling. Everyone is struggling. Groceries are so expensive," he said.Kumar said the problem hits international students and other newcomers particularly badly. He has students coming to him, asking for work."They are in college, about to finish, but they don't have money … they don't have food to eat."Kumar said these students and people on work permits also don't have the same clear path to residency that he did when he came to Canada. Kumar got his permanent residency in three years."That time actually, when Harper government was there, I think everything is controlled," he said, adding there needs to be a balance between immigration and integration."Right now there's no balance there. They don't know what they are doing."Since getting his citizenship, Kumar has voted Conservative, but said he's not convinced either of the two main parties have a bold plan to bolster the economy and ensure there's a stronger job market for newcomers and Canadians alike."They are just thinking, small thinking [like] we just take out carbon tax," he said. "They don't have a clear vision for Canada."Ali Abukar, CEO for the Saskatoon Open Door Society, said settlement services like his are among those that help newcomers integrate to Canada with things like employment training and language education. He said the federal government has scaled back money for these organizations as it reduces immigration targets, leading to program cuts at both the Saskatoon and Regina Open Door societies.Reducing immigrant and international student populations can't be done hastily, Abukar said."A lot of the international students have been contributing a lot of money not only to schools and educational institutions, but also businesses and housing," he said. He said immigrants will still be needed to help Canada resolve issues like the labour that's needed to build houses.It speaks to the pressing need for the next elected government to take a phased approach to integrating newcomers into Canada, Abukar said."Our [immigration] numbers didn't become where they are at in just the switch of a light. And we can't reverse them the same way," he said."We all need to do better in terms of educating people and raising awareness and making sure that we're building an inclusive … equitable society."Janani Whitfield is a community engagement producer who also edits feature storytelling and first-person pieces for CBC Saskatchewan. Contact her at janani.whitfield@cbc.ca. Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Jagmeet Singh",
-        "sentiment": "unrelated",
-    },
-      {
-        'news_article': """Joana Valamootoo felt Canada was a welcoming place when she immigrated here from Mauritius in 2012, but that sense has faded in recent years as immigration numbers have gone up and up."I came here in 2012 on a francophone initiative program, an immigration program, and I was welcome, but I was also provided what I needed to succeed here," she said. She believes that's no longer the case for newcomers to the country.CBC has been asking people across the country about the issues that matter most to them in the April 28, 2025, federal election.While immigration has taken a backseat to concerns like national unity and tariffs, Valamootoo said it's top of mind for her. She wants to hear leaders talk about how they will integrate newcomers into the country."I think the past three years there has been a lot of mistakes by the federal government with regard to how many people they were letting in."She feels that's led to a rise in racism and a backlash against immigrants and international students, who've been blamed for crises in housing and education."I think we need a leader that can bring people together, instead of creating division," she said.As Canada's population has pushed past 41 million people, Canadians and immigrants alike have expressed concern about whether the country has planned enough to incorporate new immigrants into workspaces, schools and homes. The Saskatchewan Urban Municipalities Association recently commissioned a poll, which found 68 per cent of Saskatchewan people surveyed online supported reducing immigration.Sanjeev Kumar came to Canada on a work permit in 2008 to work in Alberta's restaurant industry and recently opened his own restaurant in northeast Calgary.He's also seen a rise in anti-immigrant sentiment, which he believes is intensified by immigrants being willing to work in minimum wage jobs and creating intense competition for work."Nobody has a job right now. People are struggling. Everyone is struggling. Groceries are so expensive," he said.Kumar said the problem hits international students and other newcomers particularly badly. He has students coming to him, asking for work."They are in college, about to finish, but they don't have money … they don't have food to eat."Kumar said these students and people on work permits also don't have the same clear path to residency that he did when he came to Canada. Kumar got his permanent residency in three years."That time actually, when Harper government was there, I think everything is controlled," he said, adding there needs to be a balance between immigration and integration."Right now there's no balance there. They don't know what they are doing."Since getting his citizenship, Kumar has voted Conservative, but said he's not convinced either of the two main parties have a bold plan to bolster the economy and ensure there's a stronger job market for newcomers and Canadians alike."They are just thinking, small thinking [like] we just take out carbon tax," he said. "They don't have a clear vision for Canada."Ali Abukar, CEO for the Saskatoon Open Door Society, said settlement services like his are among those that help newcomers integrate to Canada with things like employment training and language education. He said the federal government has scaled back money for these organizations as it reduces immigration targets, leading to program cuts at both the Saskatoon and Regina Open Door societies.Reducing immigrant and international student populations can't be done hastily, Abukar said."A lot of the international students have been contributing a lot of money not only to schools and educational institutions, but also businesses and housing," he said. He said immigrants will still be needed to help Canada resolve issues like the labour that's needed to build houses.It speaks to the pressing need for the next elected government to take a phased approach to integrating newcomers into Canada, Abukar said."Our [immigration] numbers didn't become where they are at in just the switch of a light. And we can't reverse them the same way," he said."We all need to do better in terms of educating people and raising awareness and making sure that we're building an inclusive … equitable society."Janani Whitfield is a community engagement producer who also edits feature storytelling and first-person pieces for CBC Saskatchewan. Contact her at janani.whitfield@cbc.ca. Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Pierre Poilievre",
-        "sentiment": "unrelated",
-    },
-    {
-        'news_article': """Conservative Leader Pierre Poilievre dodged questions Sunday about whether he would repeal the federal government's handgun ban, a measure brought in to tamp down on the diversion of legal firearms into the hands of bad actors.Poilievre hasn't said much during this campaign about what he would do with the Liberal firearms legislation he voted against while in Parliament, but he has blasted the last government's "assault-style" firearm buyback program as a "gun grab" that he would scrap.Gun control advocates say any legislation to curb the flow of firearms is a worthy measure to try and reduce incidents of crime and violence. Firearms rights advocates meanwhile say the Liberal suite of policies only punish lawful gun owners who play by the rules.In 2022, after a spate of violent gun crime and the Nova Scotia massacre, former prime minister Justin Trudeau's cabinet introduced a "freeze" on the sale, purchase and transfer of handguns. The ban was later codified in law with Bill C-21, the government's controversial overhaul of firearms legislation.Asked Sunday what he would do about the handgun ban specifically at a campaign stop in Surrey, B.C., Poilievre said most firearm-related crime is caused by illegal firearms coming up from the U.S. and he questioned whether there is even really a handgun ban in place."Criminals are able to get handguns everywhere they go," Poilievre said. "The problem is illegal guns coming from the United States of America."Poilievre pivoted to his proposal to lock up criminals for longer, including those convicted of firearms offences. Poilievre is proposing life sentences for certain traffickers.Poilievre avoids question about repealing the freeze on handgun sales"The police have said that the current Liberal policies just prevent off-duty police officers and military veterans from practising their craft without going after the criminals who caused the crime," he said.Pressed by reporters if that means the handgun ban would be gone under a government led by him, Poilievre ignored the follow-up and moved on to the next question.Poilievre told a Quebec firearms advocate in January that any firearms ban is "stupid" and he vowed to repeal C-21 — comments he hasn't made in public since then.Liberal Leader Mark Carney has pounced on Poilievre's vague statements about firearms.At the English-language leaders' debate last week, Carney said Poilievre's tough talk about tackling crime is meaningless if he doesn't follow through with a commitment to rein in guns."Every single time there has been a vote in the House of Commons on gun control, Mr. Poilievre has voted against it. You can't be tough on crime unless you're tough on guns," Carney said.PolySeSouvient, a gun control advocacy group, has endorsed the Liberals, saying Carney is the best leader to deliver on its demands to remove "assault-style" firearms from circulation, ban large-capacity magazines and follow through with policies to curb domestic violence.One of the group's founders, Nathalie Provost, is running for the Liberals in Quebec."Saying no to U.S.-style gun laws in Canada — to keep our families and communities safer from gun violence for decades to come — starts at the ballot box," said Heidi Rathjen, a spokesperson for the group that represents the survivors of the Polytechnique massacre.Rathjen called Poilievre a "gun extremist."Some police unions, however, have criticized the Liberal policies as largely ineffective in stopping gun crime.In a statement last fall on the two-year anniversary of the ban becoming law, the Toronto Police Association, the group that represents law enforcement members in that city, said Trudeau's policies were bogus."Whatever you think you've done to improve community safety has not worked," the group said.The Surrey police association said the ban "fails to address the real issue: the surge of illegal firearms coming across our borders and ending up in the hands of violent criminals."CBC News reported in February that the flow of guns over the Canada-U.S. border is a major concern with border data revealing there's been a spike in confiscated guns in recent years.According to Toronto Police Service (TPS) data, the force seized 717 crime guns last year and 88 per cent of those were sourced to the U.S.Of those firearms taken by police in Canada's biggest city, 515 were handguns and 91 per cent of those were traced to the U.S., according to the data.Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAdd some “good” to your morning and evening.Your guide to what you need to know about the 2025 federal election. Get the latest news and sharp analysis from the campaign trail delivered to your inbox six mornings a week.The next issue of Canada Votes 2025 will soon be in your inbox.Discover all CBC newsletters in the Subscription Centre.This site is protected by reCAPTCHA and the Google Privacy Policy and Google Terms of Service apply.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Pierre Poilievre",
-        "sentiment": "negative",
-    },
-     {
-        'news_article': """Conservative Leader Pierre Poilievre dodged questions Sunday about whether he would repeal the federal government's handgun ban, a measure brought in to tamp down on the diversion of legal firearms into the hands of bad actors.Poilievre hasn't said much during this campaign about what he would do with the Liberal firearms legislation he voted against while in Parliament, but he has blasted the last government's "assault-style" firearm buyback program as a "gun grab" that he would scrap.Gun control advocates say any legislation to curb the flow of firearms is a worthy measure to try and reduce incidents of crime and violence. Firearms rights advocates meanwhile say the Liberal suite of policies only punish lawful gun owners who play by the rules.In 2022, after a spate of violent gun crime and the Nova Scotia massacre, former prime minister Justin Trudeau's cabinet introduced a "freeze" on the sale, purchase and transfer of handguns. The ban was later codified in law with Bill C-21, the government's controversial overhaul of firearms legislation.Asked Sunday what he would do about the handgun ban specifically at a campaign stop in Surrey, B.C., Poilievre said most firearm-related crime is caused by illegal firearms coming up from the U.S. and he questioned whether there is even really a handgun ban in place."Criminals are able to get handguns everywhere they go," Poilievre said. "The problem is illegal guns coming from the United States of America."Poilievre pivoted to his proposal to lock up criminals for longer, including those convicted of firearms offences. Poilievre is proposing life sentences for certain traffickers.Poilievre avoids question about repealing the freeze on handgun sales"The police have said that the current Liberal policies just prevent off-duty police officers and military veterans from practising their craft without going after the criminals who caused the crime," he said.Pressed by reporters if that means the handgun ban would be gone under a government led by him, Poilievre ignored the follow-up and moved on to the next question.Poilievre told a Quebec firearms advocate in January that any firearms ban is "stupid" and he vowed to repeal C-21 — comments he hasn't made in public since then.Liberal Leader Mark Carney has pounced on Poilievre's vague statements about firearms.At the English-language leaders' debate last week, Carney said Poilievre's tough talk about tackling crime is meaningless if he doesn't follow through with a commitment to rein in guns."Every single time there has been a vote in the House of Commons on gun control, Mr. Poilievre has voted against it. You can't be tough on crime unless you're tough on guns," Carney said.PolySeSouvient, a gun control advocacy group, has endorsed the Liberals, saying Carney is the best leader to deliver on its demands to remove "assault-style" firearms from circulation, ban large-capacity magazines and follow through with policies to curb domestic violence.One of the group's founders, Nathalie Provost, is running for the Liberals in Quebec."Saying no to U.S.-style gun laws in Canada — to keep our families and communities safer from gun violence for decades to come — starts at the ballot box," said Heidi Rathjen, a spokesperson for the group that represents the survivors of the Polytechnique massacre.Rathjen called Poilievre a "gun extremist."Some police unions, however, have criticized the Liberal policies as largely ineffective in stopping gun crime.In a statement last fall on the two-year anniversary of the ban becoming law, the Toronto Police Association, the group that represents law enforcement members in that city, said Trudeau's policies were bogus."Whatever you think you've done to improve community safety has not worked," the group said.The Surrey police association said the ban "fails to address the real issue: the surge of illegal firearms coming across our borders and ending up in the hands of violent criminals."CBC News reported in February that the flow of guns over the Canada-U.S. border is a major concern with border data revealing there's been a spike in confiscated guns in recent years.According to Toronto Police Service (TPS) data, the force seized 717 crime guns last year and 88 per cent of those were sourced to the U.S.Of those firearms taken by police in Canada's biggest city, 515 were handguns and 91 per cent of those were traced to the U.S., according to the data.Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAdd some “good” to your morning and evening.Your guide to what you need to know about the 2025 federal election. Get the latest news and sharp analysis from the campaign trail delivered to your inbox six mornings a week.The next issue of Canada Votes 2025 will soon be in your inbox.Discover all CBC newsletters in the Subscription Centre.This site is protected by reCAPTCHA and the Google Privacy Policy and Google Terms of Service apply.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Mark Carney",
-        "sentiment": "positive",
-    },
-    {
-        'news_article': """U.S. President Donald Trump has been threatening to cancel funding for some universities unless they accede to his demands to change ideological policy, similar to a pledge Pierre Poilievre has made for Canadian post-secondary schools.But so far, the Conservative leader has been sparse on details of exactly what kind of action he might take.Trump's demands, which have sparked condemnation about interference in academic freedom, made headlines this week after the White House said it's freezing more than $2.2 billion US in grants and $60 million in contracts to Harvard University.This came after Harvard president Alan Gerber refused to comply with the White House demands, saying in a letter that the university "will not surrender its independence or relinquish its constitutional rights."Poilievre, meanwhile, has also threatened to defund universities over what he perceives as their ideological slant. In a Christmas Eve tweet on X, formerly known as Twitter, Poilievre said he would "defund wokism and fight antisemitism."That tweet was linked to a telephone interview he gave WinnipegJewishReview.com in which he was quoted as saying he won't tolerate and will defund "all of those with a woke antisemitic agenda," including universities that receive federal funding and all federally funded museums. I will defund wokism and fight antisemitism. <br><br>And stand with our friends in Israel against terror.<a href="https://t.co/hTEdzAPP14">https://t.co/hTEdzAPP14</a>He reiterated a similar pledge on March 26 when the party released its Quebec platform, saying a Conservative government would "put an end to the imposition of woke ideology in the federal civil service and in the allocation of federal funds for university research."The pledge prompted the Canadian Association of University Teachers (CAUT) to release a statement "expressing alarm" over Poilievre's promise to interfere in the allocation of federal research funding."It's worrying that a leader of a political party in Canada would try to dictate how research funds will be granted," said David Robinson, CAUT's executive director. "We've seen the impact of this political meddling south of the border where the Trump administration has launched a full-scale assault on universities and the scientific community. This kind of American-style culture war has no place in Canada."Beginning with Columbia University, the Trump administration has rebuked post-secondary institutions across the U.S. over their handling of the pro-Palestinian student protest movement that roiled campuses last year following the 2023 Hamas-led attack inside Israel and the subsequent Israeli attacks on Gaza.Trump has called the protests anti-American and antisemitic, accused universities of peddling Marxism and "radical left" ideology, and promised to end federal grants and contracts to universities that do not agree to his administration's demands.On April 3, the White House issued a list of demands to Harvard that included a ban on face masks, limitations on campus protests and a review of academic departments' biases. About a week later, those demands were expanded to include leadership reforms, changes to admission policy and an end to the university's recognition of certain student organizations.The school's president said Harvard has already made extensive reforms to address antisemitism, but that many of the government's demands don't relate to antisemitism and instead are an attempt to regulate the "intellectual conditions" at Harvard.While Poilievre has not released any details of his proposed plans, he still seems to be taking lessons from the U.S. with threats to defund, said Patrick McCurdy, an associate professor of communication at the University of Ottawa."I would take it seriously in the same way that he has doubled down and is serious about his threats to defund the CBC," McCurdy said. "It's something that people should pay attention to."McCurdy was also part of a research study that examined the evolution of anti-woke discourse in debates within the House of Commons from 2019 to 2023. Their examination of Hansard records revealed that in 2019, there were only two mentions of the word "woke." By 2023, the Conservatives' use of the word had increased to 63 times, with Poilievre responsible for 33 instances that year, their study found.As McCurdy noted in a recent article he co-wrote for Policy Options, the term "woke" is rooted in the African-American experience of racialized violence and originally meant being aware of racial injustice. Progressives then adopted it to encompass broader societal injustices related to feminist, LGBTQ+ and intersectional concerns, he said.But the word has since been co-opted as a derogatory term used against some who promote such social justice concerns, and are accused of being fixated or authoritarian on issues including identity politics and equity, diversity and inclusion (EDI) policies.McCurdy's article, titled The many dangers of Pierre Poilievre's war on 'woke,' argues that his policy pledges such as defunding universities over ideology are just "part an exploitative strategy designed to stoke fears and resentment, entrench divisions and legitimize extreme positions in mainstream politics.""I would be interested in reading how he might propose this ... [and] how this militates against the freedom of researchers, academics and universities to do their research," McCurdy told CBC News in a telephone interview. "It's certainly a threat to academic freedom."The Conservatives have spoken in the past about defunding universities over their campus policies. During his leadership campaign in 2017, Andrew Scheer said he would pull federal funding from universities that failed to uphold free speech, "shut down debate and can't stand different points of view."This came in response to instances where anti-abortion and pro-Israel events were turned away from university campuses after protests erupted.Poilievre would later follow up with a similar pledge during his 2022 leadership campaign in which he said if universities want to keep their federal research grants, they'll need to protect academic freedom and guarantee free speech on campus. He also said he would appoint a "free speech guardian" to ensure universities were following those principles.Universities should foster debate, not stifle it. As Prime Minister, I'll defend free speech on campus.<br><br>If universities want to keep their federal research grants, they'll need to protect academic freedom &amp; guarantee free speech on campus.<a href="https://t.co/ontDTk7ieo">https://t.co/ontDTk7ieo</a>As for his current policy pledges, the Conservative Party did not respond to questions from CBC News asking for more details. However, in an interview published April 8 by the English-language media Jewish News Syndicate, Conservative Party candidate Neil Oberman, who is running in the Quebec riding of Mount Royal, said he supports cutting funding to universities that are not doing enough to combat antisemitism on their campuses."[Universities] will not receive a single penny from the federal government until they clean up their act," he said.Stéphane Sérafin, an assistant professor of law at the University of Ottawa who believes that woke ideology is a problem at universities, said the Liberal government has been very aggressive in imposing ideological requirements on research that includes EDI initiatives.But he said he's unsure what exactly Poilievre is contemplating."I would assume that at the very least they'd be looking to remove the kind of EDI requirements that have been added to those research funds. Beyond that, I can only speculate."Sérafin questioned whether a Conservative government would add requirements that comply with their ideological preferences, or if it would simply defund universities."Does he want to defund everything, or does he only want to target specific programs?" Sérafin asked of Poilievre's intentions."He's never kind of explicitly laid out a plan for how this would be done," he said. "It's kind of like one of those issues where the devil really is in the details."Senior ReporterMark Gollom is a Toronto-based reporter with CBC News. He covers Canadian and U.S. politics and current affairs.  With files from Radio-Canada, The Associated Press, Reuters, The Canadian PressAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Mark Carney",
-        "sentiment": "unrelated",
-    },
-     {
-        'news_article': """U.S. President Donald Trump has been threatening to cancel funding for some universities unless they accede to his demands to change ideological policy, similar to a pledge Pierre Poilievre has made for Canadian post-secondary schools.But so far, the Conservative leader has been sparse on details of exactly what kind of action he might take.Trump's demands, which have sparked condemnation about interference in academic freedom, made headlines this week after the White House said it's freezing more than $2.2 billion US in grants and $60 million in contracts to Harvard University.This came after Harvard president Alan Gerber refused to comply with the White House demands, saying in a letter that the university "will not surrender its independence or relinquish its constitutional rights."Poilievre, meanwhile, has also threatened to defund universities over what he perceives as their ideological slant. In a Christmas Eve tweet on X, formerly known as Twitter, Poilievre said he would "defund wokism and fight antisemitism."That tweet was linked to a telephone interview he gave WinnipegJewishReview.com in which he was quoted as saying he won't tolerate and will defund "all of those with a woke antisemitic agenda," including universities that receive federal funding and all federally funded museums. I will defund wokism and fight antisemitism. <br><br>And stand with our friends in Israel against terror.<a href="https://t.co/hTEdzAPP14">https://t.co/hTEdzAPP14</a>He reiterated a similar pledge on March 26 when the party released its Quebec platform, saying a Conservative government would "put an end to the imposition of woke ideology in the federal civil service and in the allocation of federal funds for university research."The pledge prompted the Canadian Association of University Teachers (CAUT) to release a statement "expressing alarm" over Poilievre's promise to interfere in the allocation of federal research funding."It's worrying that a leader of a political party in Canada would try to dictate how research funds will be granted," said David Robinson, CAUT's executive director. "We've seen the impact of this political meddling south of the border where the Trump administration has launched a full-scale assault on universities and the scientific community. This kind of American-style culture war has no place in Canada."Beginning with Columbia University, the Trump administration has rebuked post-secondary institutions across the U.S. over their handling of the pro-Palestinian student protest movement that roiled campuses last year following the 2023 Hamas-led attack inside Israel and the subsequent Israeli attacks on Gaza.Trump has called the protests anti-American and antisemitic, accused universities of peddling Marxism and "radical left" ideology, and promised to end federal grants and contracts to universities that do not agree to his administration's demands.On April 3, the White House issued a list of demands to Harvard that included a ban on face masks, limitations on campus protests and a review of academic departments' biases. About a week later, those demands were expanded to include leadership reforms, changes to admission policy and an end to the university's recognition of certain student organizations.The school's president said Harvard has already made extensive reforms to address antisemitism, but that many of the government's demands don't relate to antisemitism and instead are an attempt to regulate the "intellectual conditions" at Harvard.While Poilievre has not released any details of his proposed plans, he still seems to be taking lessons from the U.S. with threats to defund, said Patrick McCurdy, an associate professor of communication at the University of Ottawa."I would take it seriously in the same way that he has doubled down and is serious about his threats to defund the CBC," McCurdy said. "It's something that people should pay attention to."McCurdy was also part of a research study that examined the evolution of anti-woke discourse in debates within the House of Commons from 2019 to 2023. Their examination of Hansard records revealed that in 2019, there were only two mentions of the word "woke." By 2023, the Conservatives' use of the word had increased to 63 times, with Poilievre responsible for 33 instances that year, their study found.As McCurdy noted in a recent article he co-wrote for Policy Options, the term "woke" is rooted in the African-American experience of racialized violence and originally meant being aware of racial injustice. Progressives then adopted it to encompass broader societal injustices related to feminist, LGBTQ+ and intersectional concerns, he said.But the word has since been co-opted as a derogatory term used against some who promote such social justice concerns, and are accused of being fixated or authoritarian on issues including identity politics and equity, diversity and inclusion (EDI) policies.McCurdy's article, titled The many dangers of Pierre Poilievre's war on 'woke,' argues that his policy pledges such as defunding universities over ideology are just "part an exploitative strategy designed to stoke fears and resentment, entrench divisions and legitimize extreme positions in mainstream politics.""I would be interested in reading how he might propose this ... [and] how this militates against the freedom of researchers, academics and universities to do their research," McCurdy told CBC News in a telephone interview. "It's certainly a threat to academic freedom."The Conservatives have spoken in the past about defunding universities over their campus policies. During his leadership campaign in 2017, Andrew Scheer said he would pull federal funding from universities that failed to uphold free speech, "shut down debate and can't stand different points of view."This came in response to instances where anti-abortion and pro-Israel events were turned away from university campuses after protests erupted.Poilievre would later follow up with a similar pledge during his 2022 leadership campaign in which he said if universities want to keep their federal research grants, they'll need to protect academic freedom and guarantee free speech on campus. He also said he would appoint a "free speech guardian" to ensure universities were following those principles.Universities should foster debate, not stifle it. As Prime Minister, I'll defend free speech on campus.<br><br>If universities want to keep their federal research grants, they'll need to protect academic freedom &amp; guarantee free speech on campus.<a href="https://t.co/ontDTk7ieo">https://t.co/ontDTk7ieo</a>As for his current policy pledges, the Conservative Party did not respond to questions from CBC News asking for more details. However, in an interview published April 8 by the English-language media Jewish News Syndicate, Conservative Party candidate Neil Oberman, who is running in the Quebec riding of Mount Royal, said he supports cutting funding to universities that are not doing enough to combat antisemitism on their campuses."[Universities] will not receive a single penny from the federal government until they clean up their act," he said.Stéphane Sérafin, an assistant professor of law at the University of Ottawa who believes that woke ideology is a problem at universities, said the Liberal government has been very aggressive in imposing ideological requirements on research that includes EDI initiatives.But he said he's unsure what exactly Poilievre is contemplating."I would assume that at the very least they'd be looking to remove the kind of EDI requirements that have been added to those research funds. Beyond that, I can only speculate."Sérafin questioned whether a Conservative government would add requirements that comply with their ideological preferences, or if it would simply defund universities."Does he want to defund everything, or does he only want to target specific programs?" Sérafin asked of Poilievre's intentions."He's never kind of explicitly laid out a plan for how this would be done," he said. "It's kind of like one of those issues where the devil really is in the details."Senior ReporterMark Gollom is a Toronto-based reporter with CBC News. He covers Canadian and U.S. politics and current affairs.  With files from Radio-Canada, The Associated Press, Reuters, The Canadian PressAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Pierre Poilievre",
-        "sentiment": "negative",
-    },
-    {
-        'news_article': """Conservative Leader Pierre Poilievre said Monday his party will release its costed platform on Tuesday, giving voters a sense of what a government led by him would do and where it would cut to pay for it all.The platform release comes the day after advance polls close and less than a week before election day.Poilievre is the last major party leader to release his plan after Liberal Leader Mark Carney and NDP Leader Jagmeet Singh launched theirs over the weekend.Asked Monday why the party has waited to release the document with so little time left in the campaign, and if it's related to trouble sorting out some of the math for what's expected to be an ambitious agenda, Poilievre said the timing has nothing to do with accounting.Poilievre has long promised to enact a "pay-as-you go" or "dollar for dollar" law on his watch, which would demand every dollar of new government spending be matched with a cut to spending elsewhere.Poilievre is pitching some big-ticket items that will have to be paid for by cuts to other programs — or a sizable increase in revenue on the other side of the ledger.The Conservative leader says his plan to fast-track natural resources development by slashing red tape will generate tens of billions of dollars in government revenue to help pay for new measures, making deep cuts unnecessary.WATCH: Poilievre slams Liberal platform, promises to 'axe the inflation tax' Poilievre slams Liberal platform, promises to 'axe the inflation tax'Still, Poilievre is promising a $14-billion a year "middle-class tax cut," which is more generous and therefore more costly than what Carney is pitching.He's also promising to scrap the GST on all new homes, which will cost the federal treasury some $1.56 billion a year in lost revenue — a measure that is again more expensive than Carney's promise to scrap the GST for first-time homebuyers only.Poilievre is also promising to get defence spending up to the NATO target of two per cent of GDP by 2030 — a multi-billion-dollar commitment.He has also vowed to defer the capital gains tax if an investor takes the proceeds of a gain and reinvests them in Canada, a roughly $5-billion spending commitment for each of the next two years.Poilievre said his platform will detail where he plans to slash government spending to give him the funds to deploy money elsewhere, promising "a truly costed platform that will cut waste, axe taxes, unleash home building, lock up criminals and bring home the country we love."The Liberals say Poilievre's "dollar for dollar" commitment means the Conservatives will need to make major cuts to pay for what they say is $140 billion in new spending announced over the course of the campaign so far."The Conservatives' real plan is to make cuts. What will he cut to match those commitments, who will be left vulnerable, and how much will these cuts weaken Canada's economy? It's time Pierre Poilievre stopped hiding and came clean about his divisive cuts," Liberal candidate François-Philippe Champagne said in a statement.The Liberals say Poilievre will need to slash dental care, pharmacare, child care, the national school program and "much more" to meet his spending commitments.Poilievre has been vague about what exactly he would do with some of these relatively new Liberal social programs, but he has said he will at least keep dental care for those who already have it, and will "protect" child care.Poilievre said Monday the Liberal charge that massive cuts are coming is bogus."Whenever Liberals present you with the numbers, you should be afraid, very afraid, because their numbers are always wrong," Poilievre said.Poilievre said he's already laid out "a lot of savings" that will come with a Conservative government to help pay for new commitments. On Sunday, Poilievre said he cut spending on outside consultants by $10 billion.It's difficult to determine just how much the government currently spends on consultants and outside advice as it's not a single line item in the budget. Regardless, Poilievre has said he can find major savings.Poilievre also touted Monday a plan to get rid of "Liberal programs that give out free drugs," an apparent reference to the government's so-called "safer supply" program that gives prescriptions to people who are addicted to drugs and at risk of an overdose. That's a relatively small budget item.Poilievre also said Monday he'd do away with the government's "wasteful" gun buyback program, which according to an analysis from the parliamentary budget officer will cost at least $756 million, plus administration — a figure that has likely increased since that report was first drafted in 2021, due to inflation and the addition of more than 800 firearms to the banned list.A Conservative government will also "cut bureaucracy, foreign aid handouts to corporate insiders and other waste," Poilievre said. He has also promised to defund the CBC and target funds held in tax havens.And if those cuts don't fill the gap, Poilievre said he has a plan to address a potential shortfall: He's going to turbocharge natural resources extraction by eliminating what he calls anti-development laws, which will deliver new revenue to the federal government."It will create a massive boom, enriching provinces in Canada and generating $70 billion of additional revenue to finance our various programs," Poilievre told reporters, saying that figure was calculated by an "independent economist" and validated by "the former chief economic analyst of Statistics Canada.""We will unlock the power of our resource sector and stimulate economic growth," he said.Carney is also promising to stimulate strong economic growth to help fill the government's coffers, but he didn't factor in that hypothetical windfall when crafting his own platform, which also calls for tens of billions of dollars of more spending that Poilievre has condemned as "shocking.""As crazy and costly as Trudeau's budget plan already was, Mark Carney's is even worse," Poilievre said. Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAdd some “good” to your morning and evening.Your guide to what you need to know about the 2025 federal election. Get the latest news and sharp analysis from the campaign trail delivered to your inbox six mornings a week.The next issue of Canada Votes 2025 will soon be in your inbox.Discover all CBC newsletters in the Subscription Centre.This site is protected by reCAPTCHA and the Google Privacy Policy and Google Terms of Service apply.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Pierre Poilievre",
-        "sentiment": "positive",
-    },
-    {
-        'news_article': """Conservative Leader Pierre Poilievre said Monday his party will release its costed platform on Tuesday, giving voters a sense of what a government led by him would do and where it would cut to pay for it all.The platform release comes the day after advance polls close and less than a week before election day.Poilievre is the last major party leader to release his plan after Liberal Leader Mark Carney and NDP Leader Jagmeet Singh launched theirs over the weekend.Asked Monday why the party has waited to release the document with so little time left in the campaign, and if it's related to trouble sorting out some of the math for what's expected to be an ambitious agenda, Poilievre said the timing has nothing to do with accounting.Poilievre has long promised to enact a "pay-as-you go" or "dollar for dollar" law on his watch, which would demand every dollar of new government spending be matched with a cut to spending elsewhere.Poilievre is pitching some big-ticket items that will have to be paid for by cuts to other programs — or a sizable increase in revenue on the other side of the ledger.The Conservative leader says his plan to fast-track natural resources development by slashing red tape will generate tens of billions of dollars in government revenue to help pay for new measures, making deep cuts unnecessary.WATCH: Poilievre slams Liberal platform, promises to 'axe the inflation tax' Poilievre slams Liberal platform, promises to 'axe the inflation tax'Still, Poilievre is promising a $14-billion a year "middle-class tax cut," which is more generous and therefore more costly than what Carney is pitching.He's also promising to scrap the GST on all new homes, which will cost the federal treasury some $1.56 billion a year in lost revenue — a measure that is again more expensive than Carney's promise to scrap the GST for first-time homebuyers only.Poilievre is also promising to get defence spending up to the NATO target of two per cent of GDP by 2030 — a multi-billion-dollar commitment.He has also vowed to defer the capital gains tax if an investor takes the proceeds of a gain and reinvests them in Canada, a roughly $5-billion spending commitment for each of the next two years.Poilievre said his platform will detail where he plans to slash government spending to give him the funds to deploy money elsewhere, promising "a truly costed platform that will cut waste, axe taxes, unleash home building, lock up criminals and bring home the country we love."The Liberals say Poilievre's "dollar for dollar" commitment means the Conservatives will need to make major cuts to pay for what they say is $140 billion in new spending announced over the course of the campaign so far."The Conservatives' real plan is to make cuts. What will he cut to match those commitments, who will be left vulnerable, and how much will these cuts weaken Canada's economy? It's time Pierre Poilievre stopped hiding and came clean about his divisive cuts," Liberal candidate François-Philippe Champagne said in a statement.The Liberals say Poilievre will need to slash dental care, pharmacare, child care, the national school program and "much more" to meet his spending commitments.Poilievre has been vague about what exactly he would do with some of these relatively new Liberal social programs, but he has said he will at least keep dental care for those who already have it, and will "protect" child care.Poilievre said Monday the Liberal charge that massive cuts are coming is bogus."Whenever Liberals present you with the numbers, you should be afraid, very afraid, because their numbers are always wrong," Poilievre said.Poilievre said he's already laid out "a lot of savings" that will come with a Conservative government to help pay for new commitments. On Sunday, Poilievre said he cut spending on outside consultants by $10 billion.It's difficult to determine just how much the government currently spends on consultants and outside advice as it's not a single line item in the budget. Regardless, Poilievre has said he can find major savings.Poilievre also touted Monday a plan to get rid of "Liberal programs that give out free drugs," an apparent reference to the government's so-called "safer supply" program that gives prescriptions to people who are addicted to drugs and at risk of an overdose. That's a relatively small budget item.Poilievre also said Monday he'd do away with the government's "wasteful" gun buyback program, which according to an analysis from the parliamentary budget officer will cost at least $756 million, plus administration — a figure that has likely increased since that report was first drafted in 2021, due to inflation and the addition of more than 800 firearms to the banned list.A Conservative government will also "cut bureaucracy, foreign aid handouts to corporate insiders and other waste," Poilievre said. He has also promised to defund the CBC and target funds held in tax havens.And if those cuts don't fill the gap, Poilievre said he has a plan to address a potential shortfall: He's going to turbocharge natural resources extraction by eliminating what he calls anti-development laws, which will deliver new revenue to the federal government."It will create a massive boom, enriching provinces in Canada and generating $70 billion of additional revenue to finance our various programs," Poilievre told reporters, saying that figure was calculated by an "independent economist" and validated by "the former chief economic analyst of Statistics Canada.""We will unlock the power of our resource sector and stimulate economic growth," he said.Carney is also promising to stimulate strong economic growth to help fill the government's coffers, but he didn't factor in that hypothetical windfall when crafting his own platform, which also calls for tens of billions of dollars of more spending that Poilievre has condemned as "shocking.""As crazy and costly as Trudeau's budget plan already was, Mark Carney's is even worse," Poilievre said. Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAdd some “good” to your morning and evening.Your guide to what you need to know about the 2025 federal election. Get the latest news and sharp analysis from the campaign trail delivered to your inbox six mornings a week.The next issue of Canada Votes 2025 will soon be in your inbox.Discover all CBC newsletters in the Subscription Centre.This site is protected by reCAPTCHA and the Google Privacy Policy and Google Terms of Service apply.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Mark Carney",
-        "sentiment": "negative",
-    },
-     {
-        'news_article': """Conservative Leader Pierre Poilievre said Monday his party will release its costed platform on Tuesday, giving voters a sense of what a government led by him would do and where it would cut to pay for it all.The platform release comes the day after advance polls close and less than a week before election day.Poilievre is the last major party leader to release his plan after Liberal Leader Mark Carney and NDP Leader Jagmeet Singh launched theirs over the weekend.Asked Monday why the party has waited to release the document with so little time left in the campaign, and if it's related to trouble sorting out some of the math for what's expected to be an ambitious agenda, Poilievre said the timing has nothing to do with accounting.Poilievre has long promised to enact a "pay-as-you go" or "dollar for dollar" law on his watch, which would demand every dollar of new government spending be matched with a cut to spending elsewhere.Poilievre is pitching some big-ticket items that will have to be paid for by cuts to other programs — or a sizable increase in revenue on the other side of the ledger.The Conservative leader says his plan to fast-track natural resources development by slashing red tape will generate tens of billions of dollars in government revenue to help pay for new measures, making deep cuts unnecessary.WATCH: Poilievre slams Liberal platform, promises to 'axe the inflation tax' Poilievre slams Liberal platform, promises to 'axe the inflation tax'Still, Poilievre is promising a $14-billion a year "middle-class tax cut," which is more generous and therefore more costly than what Carney is pitching.He's also promising to scrap the GST on all new homes, which will cost the federal treasury some $1.56 billion a year in lost revenue — a measure that is again more expensive than Carney's promise to scrap the GST for first-time homebuyers only.Poilievre is also promising to get defence spending up to the NATO target of two per cent of GDP by 2030 — a multi-billion-dollar commitment.He has also vowed to defer the capital gains tax if an investor takes the proceeds of a gain and reinvests them in Canada, a roughly $5-billion spending commitment for each of the next two years.Poilievre said his platform will detail where he plans to slash government spending to give him the funds to deploy money elsewhere, promising "a truly costed platform that will cut waste, axe taxes, unleash home building, lock up criminals and bring home the country we love."The Liberals say Poilievre's "dollar for dollar" commitment means the Conservatives will need to make major cuts to pay for what they say is $140 billion in new spending announced over the course of the campaign so far."The Conservatives' real plan is to make cuts. What will he cut to match those commitments, who will be left vulnerable, and how much will these cuts weaken Canada's economy? It's time Pierre Poilievre stopped hiding and came clean about his divisive cuts," Liberal candidate François-Philippe Champagne said in a statement.The Liberals say Poilievre will need to slash dental care, pharmacare, child care, the national school program and "much more" to meet his spending commitments.Poilievre has been vague about what exactly he would do with some of these relatively new Liberal social programs, but he has said he will at least keep dental care for those who already have it, and will "protect" child care.Poilievre said Monday the Liberal charge that massive cuts are coming is bogus."Whenever Liberals present you with the numbers, you should be afraid, very afraid, because their numbers are always wrong," Poilievre said.Poilievre said he's already laid out "a lot of savings" that will come with a Conservative government to help pay for new commitments. On Sunday, Poilievre said he cut spending on outside consultants by $10 billion.It's difficult to determine just how much the government currently spends on consultants and outside advice as it's not a single line item in the budget. Regardless, Poilievre has said he can find major savings.Poilievre also touted Monday a plan to get rid of "Liberal programs that give out free drugs," an apparent reference to the government's so-called "safer supply" program that gives prescriptions to people who are addicted to drugs and at risk of an overdose. That's a relatively small budget item.Poilievre also said Monday he'd do away with the government's "wasteful" gun buyback program, which according to an analysis from the parliamentary budget officer will cost at least $756 million, plus administration — a figure that has likely increased since that report was first drafted in 2021, due to inflation and the addition of more than 800 firearms to the banned list.A Conservative government will also "cut bureaucracy, foreign aid handouts to corporate insiders and other waste," Poilievre said. He has also promised to defund the CBC and target funds held in tax havens.And if those cuts don't fill the gap, Poilievre said he has a plan to address a potential shortfall: He's going to turbocharge natural resources extraction by eliminating what he calls anti-development laws, which will deliver new revenue to the federal government."It will create a massive boom, enriching provinces in Canada and generating $70 billion of additional revenue to finance our various programs," Poilievre told reporters, saying that figure was calculated by an "independent economist" and validated by "the former chief economic analyst of Statistics Canada.""We will unlock the power of our resource sector and stimulate economic growth," he said.Carney is also promising to stimulate strong economic growth to help fill the government's coffers, but he didn't factor in that hypothetical windfall when crafting his own platform, which also calls for tens of billions of dollars of more spending that Poilievre has condemned as "shocking.""As crazy and costly as Trudeau's budget plan already was, Mark Carney's is even worse," Poilievre said. Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAdd some “good” to your morning and evening.Your guide to what you need to know about the 2025 federal election. Get the latest news and sharp analysis from the campaign trail delivered to your inbox six mornings a week.The next issue of Canada Votes 2025 will soon be in your inbox.Discover all CBC newsletters in the Subscription Centre.This site is protected by reCAPTCHA and the Google Privacy Policy and Google Terms of Service apply.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Tom Holland",
-        "sentiment": "unrelated",
-    },
-     {
-        'news_article': """Conservative Leader Pierre Poilievre said Monday his party will release its costed platform on Tuesday, giving voters a sense of what a government led by him would do and where it would cut to pay for it all.The platform release comes the day after advance polls close and less than a week before election day.Poilievre is the last major party leader to release his plan after Liberal Leader Mark Carney and NDP Leader Jagmeet Singh launched theirs over the weekend.Asked Monday why the party has waited to release the document with so little time left in the campaign, and if it's related to trouble sorting out some of the math for what's expected to be an ambitious agenda, Poilievre said the timing has nothing to do with accounting.Poilievre has long promised to enact a "pay-as-you go" or "dollar for dollar" law on his watch, which would demand every dollar of new government spending be matched with a cut to spending elsewhere.Poilievre is pitching some big-ticket items that will have to be paid for by cuts to other programs — or a sizable increase in revenue on the other side of the ledger.The Conservative leader says his plan to fast-track natural resources development by slashing red tape will generate tens of billions of dollars in government revenue to help pay for new measures, making deep cuts unnecessary.WATCH: Poilievre slams Liberal platform, promises to 'axe the inflation tax' Poilievre slams Liberal platform, promises to 'axe the inflation tax'Still, Poilievre is promising a $14-billion a year "middle-class tax cut," which is more generous and therefore more costly than what Carney is pitching.He's also promising to scrap the GST on all new homes, which will cost the federal treasury some $1.56 billion a year in lost revenue — a measure that is again more expensive than Carney's promise to scrap the GST for first-time homebuyers only.Poilievre is also promising to get defence spending up to the NATO target of two per cent of GDP by 2030 — a multi-billion-dollar commitment.He has also vowed to defer the capital gains tax if an investor takes the proceeds of a gain and reinvests them in Canada, a roughly $5-billion spending commitment for each of the next two years.Poilievre said his platform will detail where he plans to slash government spending to give him the funds to deploy money elsewhere, promising "a truly costed platform that will cut waste, axe taxes, unleash home building, lock up criminals and bring home the country we love."The Liberals say Poilievre's "dollar for dollar" commitment means the Conservatives will need to make major cuts to pay for what they say is $140 billion in new spending announced over the course of the campaign so far."The Conservatives' real plan is to make cuts. What will he cut to match those commitments, who will be left vulnerable, and how much will these cuts weaken Canada's economy? It's time Pierre Poilievre stopped hiding and came clean about his divisive cuts," Liberal candidate François-Philippe Champagne said in a statement.The Liberals say Poilievre will need to slash dental care, pharmacare, child care, the national school program and "much more" to meet his spending commitments.Poilievre has been vague about what exactly he would do with some of these relatively new Liberal social programs, but he has said he will at least keep dental care for those who already have it, and will "protect" child care.Poilievre said Monday the Liberal charge that massive cuts are coming is bogus."Whenever Liberals present you with the numbers, you should be afraid, very afraid, because their numbers are always wrong," Poilievre said.Poilievre said he's already laid out "a lot of savings" that will come with a Conservative government to help pay for new commitments. On Sunday, Poilievre said he cut spending on outside consultants by $10 billion.It's difficult to determine just how much the government currently spends on consultants and outside advice as it's not a single line item in the budget. Regardless, Poilievre has said he can find major savings.Poilievre also touted Monday a plan to get rid of "Liberal programs that give out free drugs," an apparent reference to the government's so-called "safer supply" program that gives prescriptions to people who are addicted to drugs and at risk of an overdose. That's a relatively small budget item.Poilievre also said Monday he'd do away with the government's "wasteful" gun buyback program, which according to an analysis from the parliamentary budget officer will cost at least $756 million, plus administration — a figure that has likely increased since that report was first drafted in 2021, due to inflation and the addition of more than 800 firearms to the banned list.A Conservative government will also "cut bureaucracy, foreign aid handouts to corporate insiders and other waste," Poilievre said. He has also promised to defund the CBC and target funds held in tax havens.And if those cuts don't fill the gap, Poilievre said he has a plan to address a potential shortfall: He's going to turbocharge natural resources extraction by eliminating what he calls anti-development laws, which will deliver new revenue to the federal government."It will create a massive boom, enriching provinces in Canada and generating $70 billion of additional revenue to finance our various programs," Poilievre told reporters, saying that figure was calculated by an "independent economist" and validated by "the former chief economic analyst of Statistics Canada.""We will unlock the power of our resource sector and stimulate economic growth," he said.Carney is also promising to stimulate strong economic growth to help fill the government's coffers, but he didn't factor in that hypothetical windfall when crafting his own platform, which also calls for tens of billions of dollars of more spending that Poilievre has condemned as "shocking.""As crazy and costly as Trudeau's budget plan already was, Mark Carney's is even worse," Poilievre said. Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAdd some “good” to your morning and evening.Your guide to what you need to know about the 2025 federal election. Get the latest news and sharp analysis from the campaign trail delivered to your inbox six mornings a week.The next issue of Canada Votes 2025 will soon be in your inbox.Discover all CBC newsletters in the Subscription Centre.This site is protected by reCAPTCHA and the Google Privacy Policy and Google Terms of Service apply.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Jagemeet Singh",
-        "sentiment": "unrelated",
-    }, 
-     {
-        'news_article': """Conservative Leader Pierre Poilievre said Monday his party will release its costed platform on Tuesday, giving voters a sense of what a government led by him would do and where it would cut to pay for it all.The platform release comes the day after advance polls close and less than a week before election day.Poilievre is the last major party leader to release his plan after Liberal Leader Mark Carney and NDP Leader Jagmeet Singh launched theirs over the weekend.Asked Monday why the party has waited to release the document with so little time left in the campaign, and if it's related to trouble sorting out some of the math for what's expected to be an ambitious agenda, Poilievre said the timing has nothing to do with accounting.Poilievre has long promised to enact a "pay-as-you go" or "dollar for dollar" law on his watch, which would demand every dollar of new government spending be matched with a cut to spending elsewhere.Poilievre is pitching some big-ticket items that will have to be paid for by cuts to other programs — or a sizable increase in revenue on the other side of the ledger.The Conservative leader says his plan to fast-track natural resources development by slashing red tape will generate tens of billions of dollars in government revenue to help pay for new measures, making deep cuts unnecessary.WATCH: Poilievre slams Liberal platform, promises to 'axe the inflation tax' Poilievre slams Liberal platform, promises to 'axe the inflation tax'Still, Poilievre is promising a $14-billion a year "middle-class tax cut," which is more generous and therefore more costly than what Carney is pitching.He's also promising to scrap the GST on all new homes, which will cost the federal treasury some $1.56 billion a year in lost revenue — a measure that is again more expensive than Carney's promise to scrap the GST for first-time homebuyers only.Poilievre is also promising to get defence spending up to the NATO target of two per cent of GDP by 2030 — a multi-billion-dollar commitment.He has also vowed to defer the capital gains tax if an investor takes the proceeds of a gain and reinvests them in Canada, a roughly $5-billion spending commitment for each of the next two years.Poilievre said his platform will detail where he plans to slash government spending to give him the funds to deploy money elsewhere, promising "a truly costed platform that will cut waste, axe taxes, unleash home building, lock up criminals and bring home the country we love."The Liberals say Poilievre's "dollar for dollar" commitment means the Conservatives will need to make major cuts to pay for what they say is $140 billion in new spending announced over the course of the campaign so far."The Conservatives' real plan is to make cuts. What will he cut to match those commitments, who will be left vulnerable, and how much will these cuts weaken Canada's economy? It's time Pierre Poilievre stopped hiding and came clean about his divisive cuts," Liberal candidate François-Philippe Champagne said in a statement.The Liberals say Poilievre will need to slash dental care, pharmacare, child care, the national school program and "much more" to meet his spending commitments.Poilievre has been vague about what exactly he would do with some of these relatively new Liberal social programs, but he has said he will at least keep dental care for those who already have it, and will "protect" child care.Poilievre said Monday the Liberal charge that massive cuts are coming is bogus."Whenever Liberals present you with the numbers, you should be afraid, very afraid, because their numbers are always wrong," Poilievre said.Poilievre said he's already laid out "a lot of savings" that will come with a Conservative government to help pay for new commitments. On Sunday, Poilievre said he cut spending on outside consultants by $10 billion.It's difficult to determine just how much the government currently spends on consultants and outside advice as it's not a single line item in the budget. Regardless, Poilievre has said he can find major savings.Poilievre also touted Monday a plan to get rid of "Liberal programs that give out free drugs," an apparent reference to the government's so-called "safer supply" program that gives prescriptions to people who are addicted to drugs and at risk of an overdose. That's a relatively small budget item.Poilievre also said Monday he'd do away with the government's "wasteful" gun buyback program, which according to an analysis from the parliamentary budget officer will cost at least $756 million, plus administration — a figure that has likely increased since that report was first drafted in 2021, due to inflation and the addition of more than 800 firearms to the banned list.A Conservative government will also "cut bureaucracy, foreign aid handouts to corporate insiders and other waste," Poilievre said. He has also promised to defund the CBC and target funds held in tax havens.And if those cuts don't fill the gap, Poilievre said he has a plan to address a potential shortfall: He's going to turbocharge natural resources extraction by eliminating what he calls anti-development laws, which will deliver new revenue to the federal government."It will create a massive boom, enriching provinces in Canada and generating $70 billion of additional revenue to finance our various programs," Poilievre told reporters, saying that figure was calculated by an "independent economist" and validated by "the former chief economic analyst of Statistics Canada.""We will unlock the power of our resource sector and stimulate economic growth," he said.Carney is also promising to stimulate strong economic growth to help fill the government's coffers, but he didn't factor in that hypothetical windfall when crafting his own platform, which also calls for tens of billions of dollars of more spending that Poilievre has condemned as "shocking.""As crazy and costly as Trudeau's budget plan already was, Mark Carney's is even worse," Poilievre said. Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAdd some “good” to your morning and evening.Your guide to what you need to know about the 2025 federal election. Get the latest news and sharp analysis from the campaign trail delivered to your inbox six mornings a week.The next issue of Canada Votes 2025 will soon be in your inbox.Discover all CBC newsletters in the Subscription Centre.This site is protected by reCAPTCHA and the Google Privacy Policy and Google Terms of Service apply.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Jagmeet Singh",
-        "sentiment": "unrelated",
-    },
-     {
-        'news_article': """Conservative Leader Pierre Poilievre said Monday his party will release its costed platform on Tuesday, giving voters a sense of what a government led by him would do and where it would cut to pay for it all.The platform release comes the day after advance polls close and less than a week before election day.Poilievre is the last major party leader to release his plan after Liberal Leader Mark Carney and NDP Leader Jagmeet Singh launched theirs over the weekend.Asked Monday why the party has waited to release the document with so little time left in the campaign, and if it's related to trouble sorting out some of the math for what's expected to be an ambitious agenda, Poilievre said the timing has nothing to do with accounting.Poilievre has long promised to enact a "pay-as-you go" or "dollar for dollar" law on his watch, which would demand every dollar of new government spending be matched with a cut to spending elsewhere.Poilievre is pitching some big-ticket items that will have to be paid for by cuts to other programs — or a sizable increase in revenue on the other side of the ledger.The Conservative leader says his plan to fast-track natural resources development by slashing red tape will generate tens of billions of dollars in government revenue to help pay for new measures, making deep cuts unnecessary.WATCH: Poilievre slams Liberal platform, promises to 'axe the inflation tax' Poilievre slams Liberal platform, promises to 'axe the inflation tax'Still, Poilievre is promising a $14-billion a year "middle-class tax cut," which is more generous and therefore more costly than what Carney is pitching.He's also promising to scrap the GST on all new homes, which will cost the federal treasury some $1.56 billion a year in lost revenue — a measure that is again more expensive than Carney's promise to scrap the GST for first-time homebuyers only.Poilievre is also promising to get defence spending up to the NATO target of two per cent of GDP by 2030 — a multi-billion-dollar commitment.He has also vowed to defer the capital gains tax if an investor takes the proceeds of a gain and reinvests them in Canada, a roughly $5-billion spending commitment for each of the next two years.Poilievre said his platform will detail where he plans to slash government spending to give him the funds to deploy money elsewhere, promising "a truly costed platform that will cut waste, axe taxes, unleash home building, lock up criminals and bring home the country we love."The Liberals say Poilievre's "dollar for dollar" commitment means the Conservatives will need to make major cuts to pay for what they say is $140 billion in new spending announced over the course of the campaign so far."The Conservatives' real plan is to make cuts. What will he cut to match those commitments, who will be left vulnerable, and how much will these cuts weaken Canada's economy? It's time Pierre Poilievre stopped hiding and came clean about his divisive cuts," Liberal candidate François-Philippe Champagne said in a statement.The Liberals say Poilievre will need to slash dental care, pharmacare, child care, the national school program and "much more" to meet his spending commitments.Poilievre has been vague about what exactly he would do with some of these relatively new Liberal social programs, but he has said he will at least keep dental care for those who already have it, and will "protect" child care.Poilievre said Monday the Liberal charge that massive cuts are coming is bogus."Whenever Liberals present you with the numbers, you should be afraid, very afraid, because their numbers are always wrong," Poilievre said.Poilievre said he's already laid out "a lot of savings" that will come with a Conservative government to help pay for new commitments. On Sunday, Poilievre said he cut spending on outside consultants by $10 billion.It's difficult to determine just how much the government currently spends on consultants and outside advice as it's not a single line item in the budget. Regardless, Poilievre has said he can find major savings.Poilievre also touted Monday a plan to get rid of "Liberal programs that give out free drugs," an apparent reference to the government's so-called "safer supply" program that gives prescriptions to people who are addicted to drugs and at risk of an overdose. That's a relatively small budget item.Poilievre also said Monday he'd do away with the government's "wasteful" gun buyback program, which according to an analysis from the parliamentary budget officer will cost at least $756 million, plus administration — a figure that has likely increased since that report was first drafted in 2021, due to inflation and the addition of more than 800 firearms to the banned list.A Conservative government will also "cut bureaucracy, foreign aid handouts to corporate insiders and other waste," Poilievre said. He has also promised to defund the CBC and target funds held in tax havens.And if those cuts don't fill the gap, Poilievre said he has a plan to address a potential shortfall: He's going to turbocharge natural resources extraction by eliminating what he calls anti-development laws, which will deliver new revenue to the federal government."It will create a massive boom, enriching provinces in Canada and generating $70 billion of additional revenue to finance our various programs," Poilievre told reporters, saying that figure was calculated by an "independent economist" and validated by "the former chief economic analyst of Statistics Canada.""We will unlock the power of our resource sector and stimulate economic growth," he said.Carney is also promising to stimulate strong economic growth to help fill the government's coffers, but he didn't factor in that hypothetical windfall when crafting his own platform, which also calls for tens of billions of dollars of more spending that Poilievre has condemned as "shocking.""As crazy and costly as Trudeau's budget plan already was, Mark Carney's is even worse," Poilievre said. Senior reporterJ.P. Tasker is a journalist in CBC's parliamentary bureau who reports for digital, radio and television. He is also a regular panellist on CBC News Network's Power & Politics. He covers the Conservative Party, Canada-U.S. relations, Crown-Indigenous affairs, health policy and the Senate. You can send story ideas and tips to J.P. at jp.tasker@cbc.caAdd some “good” to your morning and evening.Your guide to what you need to know about the 2025 federal election. Get the latest news and sharp analysis from the campaign trail delivered to your inbox six mornings a week.The next issue of Canada Votes 2025 will soon be in your inbox.Discover all CBC newsletters in the Subscription Centre.This site is protected by reCAPTCHA and the Google Privacy Policy and Google Terms of Service apply.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        "person_of_interest": "Tommy Lee Jones",
-        "sentiment": "unrelated",
-    },
-    {
-        'news_article': """Conservative Leader Pierre Poilievre's election platform-promises amount to $90 billion in new measures over the next four years that will be paid for in part by cuts and the economic growth the party says these measures will generate. "Our platform ... is a plan that will lower taxes and debt by getting rid of bureaucracy, consulting fees, waste and excessive foreign aid to dictators, terrorists and global bureaucracy," Poilievre said Tuesday during a campaign stop in Woodbridge, Ont.The Conservative platform, which features a picture of Poilievre and his wife Anaida on the cover, takes the unusual path of accounting for the economic growth of policies that have yet to be implemented. Neither the current Liberal platform nor the 2021 Conservative platform counted projected economic growth as revenue.The Conservative platform says over the next four years, that economic growth from new policies will amount to $53.3 billion in tax revenue. The Conservative platform is also counting on another $77.7 billion over four years that it says will come from cancelling programs, finding efficiencies and streamlining the public service. This number also includes $2.4 billion in savings from lower interest payments on the federal debt. Even with a combined $131 billion from savings and new revenues, the Conservative platform is projecting a deficit of $100 billion over the next four years, beginning with a deficit of $31.4 billion in 2025-26.The Conservative Platform also accounts for $20 billion in tariff revenue in 2025-26, but none after that. The Liberal platform made the same calculation.Watch | Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cuts:Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cutsThe spending changes over four years that are contained in the platform include: cuts to foreign aid ($9.4 billion), defunding the CBC and other Crown corporations ($4 billion), streamlining the public service ($4.3 billion), reducing funding for artificial intelligence initiatives ($2.28 billion) and cutting red tape ($6.4 billion).Despite these cuts and others, the Conservative platform pledges that it will not attempt to balance the books by cutting key social programs."We will honour current federal health transfer agreements to fund the health care all Canadians deserve, preserve existing dental care coverage and honour existing deals with provinces and territories on child care and pharmacare," the platform says. The Pharmacare Act passed Parliament in October. The only provinces tha have existing deals with the federal government are Manitoba, B.C. and P.E.I. The dental care program has been fully rolled out, and all the provinces and territories have now struck child-care agreements with the federal government.Speaking during his own campaign stop in Trois-Rivières, Que., Liberal Leader Mark Carney said Poilievre was using "phantom numbers" by including projected revenues in his costed plan. "These numbers are a joke. We're not in a joke," Carney said. "There's one thing you can write on a paper, there's another thing that will happen in the economy."Carney said he has managed economies in the past, and when setting plans out years in advance "you don't make those assumptions" about possible revenues. "If we made the assumptions that the Conservatives did about growth in our platform, we'd be in a fiscal surplus in five years," Carney said.Conservative officials speaking on background told CBC News their platform is focused on economic growth, and that's why those revenues have been included in their forecasting. The officials questioned why the Liberals have not done the same. WATCH | Carney calls Poilievre's Conservative costed platform numbers 'a joke'Carney calls Poilievre’s Conservative costed platform numbers ‘a joke’The Conservative platform makes a number of assumptions about the impact of their policies and the government revenues that will result. For example, by cancelling the increase to the capital gains tax — a promise the Liberals have also made — the Conservative platform says without much explanation that the resulting economic growth will boost government coffers by $13.1 billion over four years."This will be like rocket fuel for our economy, incentivizing investors — from small business owners, to farmers, to home builders — to reinvest and build things here in Canada," the platform says.The platform goes on to say that the resulting economic boost to the federal treasury will be almost $2 billion over four years from repealing clean fuel regulations, more than $8 billion from scrapping the industrial carbon tax and almost $4 billion from killing the oil and gas emissions cap. Watch | Blanchet calls Poilievre's pledge of referendums on new taxes 'expensive':Blanchet calls Poilievre’s pledge of referendums on new taxes ‘expensive’The platform says removing the industrial carbon tax will "boost our economy and allow our companies to become competitive again with the United States." (Carney reduced the consumer carbon tax to zero in his first act as prime minister.)The platform also says repealing C-69, the "no more pipelines" law, will result in almost a $1 billion in tax revenues for the federal government, while repealing the electric vehicle mandate alone will result in enough economic activity to bring in $11.2 billion in federal tax revenue.According to Canada's electric vehicle mandate, 20 per cent of light-duty vehicles for the 2026 model year must have zero emissions. That rises to 60 per cent by 2030 and 100 per cent by 2035.The platform also pledges to introduce a Taxpayer Protection Act that would prohibit introducing new taxes or raising existing ones without first getting permission in a referendum.The platform also contains Poilievre's promise to cut the lowest marginal tax rate, or tax bracket, from 15 per cent to 12.75 per cent, which would cost the treasury $14 billion. When it was announced March 24, the Conservatives provided CBC News with a backgrounder explaining that the tax cut would be phased in over five years.In 2025-26 and 2026-27 the measure would come halfway in, costing the government $7 billion a year, before being expanded in 2027. But according to the Conservative platform released Tuesday, the tax cut is being phased in more gradually than first promised. In 2025-26 the cut will cost the federal government a little over $1 billion, rising to $5.4 billion the next year and $10 billion in the third year before hitting $13.7 billion in 2028-29.The Liberals have also announced a cut to the lowest tax bracket, Their one per cent reduction from 15 per cent to 14 per cent will be fully phased in by Canada Day. Over four years, the Conservative income tax cut would cost the treasury just over $30 billion. The Liberal income tax cut would cost almost $22 billion.Senior writerPeter Zimonjic is a senior writer for CBC News who reports for digital, radio and television. He has worked as a reporter and columnist in London, England, for the Telegraph, Times and Daily Mail, and in Canada for the Ottawa Citizen, Torstar and Sun Media. He is the author of Into The Darkness: An Account of 7/7, published by Vintage.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Pierre Poilievre",
-        'sentiment': "positive",
-    },
-    {
-        'news_article': """Conservative Leader Pierre Poilievre's election platform-promises amount to $90 billion in new measures over the next four years that will be paid for in part by cuts and the economic growth the party says these measures will generate. "Our platform ... is a plan that will lower taxes and debt by getting rid of bureaucracy, consulting fees, waste and excessive foreign aid to dictators, terrorists and global bureaucracy," Poilievre said Tuesday during a campaign stop in Woodbridge, Ont.The Conservative platform, which features a picture of Poilievre and his wife Anaida on the cover, takes the unusual path of accounting for the economic growth of policies that have yet to be implemented. Neither the current Liberal platform nor the 2021 Conservative platform counted projected economic growth as revenue.The Conservative platform says over the next four years, that economic growth from new policies will amount to $53.3 billion in tax revenue. The Conservative platform is also counting on another $77.7 billion over four years that it says will come from cancelling programs, finding efficiencies and streamlining the public service. This number also includes $2.4 billion in savings from lower interest payments on the federal debt. Even with a combined $131 billion from savings and new revenues, the Conservative platform is projecting a deficit of $100 billion over the next four years, beginning with a deficit of $31.4 billion in 2025-26.The Conservative Platform also accounts for $20 billion in tariff revenue in 2025-26, but none after that. The Liberal platform made the same calculation.Watch | Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cuts:Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cutsThe spending changes over four years that are contained in the platform include: cuts to foreign aid ($9.4 billion), defunding the CBC and other Crown corporations ($4 billion), streamlining the public service ($4.3 billion), reducing funding for artificial intelligence initiatives ($2.28 billion) and cutting red tape ($6.4 billion).Despite these cuts and others, the Conservative platform pledges that it will not attempt to balance the books by cutting key social programs."We will honour current federal health transfer agreements to fund the health care all Canadians deserve, preserve existing dental care coverage and honour existing deals with provinces and territories on child care and pharmacare," the platform says. The Pharmacare Act passed Parliament in October. The only provinces tha have existing deals with the federal government are Manitoba, B.C. and P.E.I. The dental care program has been fully rolled out, and all the provinces and territories have now struck child-care agreements with the federal government.Speaking during his own campaign stop in Trois-Rivières, Que., Liberal Leader Mark Carney said Poilievre was using "phantom numbers" by including projected revenues in his costed plan. "These numbers are a joke. We're not in a joke," Carney said. "There's one thing you can write on a paper, there's another thing that will happen in the economy."Carney said he has managed economies in the past, and when setting plans out years in advance "you don't make those assumptions" about possible revenues. "If we made the assumptions that the Conservatives did about growth in our platform, we'd be in a fiscal surplus in five years," Carney said.Conservative officials speaking on background told CBC News their platform is focused on economic growth, and that's why those revenues have been included in their forecasting. The officials questioned why the Liberals have not done the same. WATCH | Carney calls Poilievre's Conservative costed platform numbers 'a joke'Carney calls Poilievre’s Conservative costed platform numbers ‘a joke’The Conservative platform makes a number of assumptions about the impact of their policies and the government revenues that will result. For example, by cancelling the increase to the capital gains tax — a promise the Liberals have also made — the Conservative platform says without much explanation that the resulting economic growth will boost government coffers by $13.1 billion over four years."This will be like rocket fuel for our economy, incentivizing investors — from small business owners, to farmers, to home builders — to reinvest and build things here in Canada," the platform says.The platform goes on to say that the resulting economic boost to the federal treasury will be almost $2 billion over four years from repealing clean fuel regulations, more than $8 billion from scrapping the industrial carbon tax and almost $4 billion from killing the oil and gas emissions cap. Watch | Blanchet calls Poilievre's pledge of referendums on new taxes 'expensive':Blanchet calls Poilievre’s pledge of referendums on new taxes ‘expensive’The platform says removing the industrial carbon tax will "boost our economy and allow our companies to become competitive again with the United States." (Carney reduced the consumer carbon tax to zero in his first act as prime minister.)The platform also says repealing C-69, the "no more pipelines" law, will result in almost a $1 billion in tax revenues for the federal government, while repealing the electric vehicle mandate alone will result in enough economic activity to bring in $11.2 billion in federal tax revenue.According to Canada's electric vehicle mandate, 20 per cent of light-duty vehicles for the 2026 model year must have zero emissions. That rises to 60 per cent by 2030 and 100 per cent by 2035.The platform also pledges to introduce a Taxpayer Protection Act that would prohibit introducing new taxes or raising existing ones without first getting permission in a referendum.The platform also contains Poilievre's promise to cut the lowest marginal tax rate, or tax bracket, from 15 per cent to 12.75 per cent, which would cost the treasury $14 billion. When it was announced March 24, the Conservatives provided CBC News with a backgrounder explaining that the tax cut would be phased in over five years.In 2025-26 and 2026-27 the measure would come halfway in, costing the government $7 billion a year, before being expanded in 2027. But according to the Conservative platform released Tuesday, the tax cut is being phased in more gradually than first promised. In 2025-26 the cut will cost the federal government a little over $1 billion, rising to $5.4 billion the next year and $10 billion in the third year before hitting $13.7 billion in 2028-29.The Liberals have also announced a cut to the lowest tax bracket, Their one per cent reduction from 15 per cent to 14 per cent will be fully phased in by Canada Day. Over four years, the Conservative income tax cut would cost the treasury just over $30 billion. The Liberal income tax cut would cost almost $22 billion.Senior writerPeter Zimonjic is a senior writer for CBC News who reports for digital, radio and television. He has worked as a reporter and columnist in London, England, for the Telegraph, Times and Daily Mail, and in Canada for the Ottawa Citizen, Torstar and Sun Media. He is the author of Into The Darkness: An Account of 7/7, published by Vintage.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Poilievre",
-        'sentiment': "positive",
-    },
-    {
-        'news_article': """Conservative Leader Pierre Poilievre's election platform-promises amount to $90 billion in new measures over the next four years that will be paid for in part by cuts and the economic growth the party says these measures will generate. "Our platform ... is a plan that will lower taxes and debt by getting rid of bureaucracy, consulting fees, waste and excessive foreign aid to dictators, terrorists and global bureaucracy," Poilievre said Tuesday during a campaign stop in Woodbridge, Ont.The Conservative platform, which features a picture of Poilievre and his wife Anaida on the cover, takes the unusual path of accounting for the economic growth of policies that have yet to be implemented. Neither the current Liberal platform nor the 2021 Conservative platform counted projected economic growth as revenue.The Conservative platform says over the next four years, that economic growth from new policies will amount to $53.3 billion in tax revenue. The Conservative platform is also counting on another $77.7 billion over four years that it says will come from cancelling programs, finding efficiencies and streamlining the public service. This number also includes $2.4 billion in savings from lower interest payments on the federal debt. Even with a combined $131 billion from savings and new revenues, the Conservative platform is projecting a deficit of $100 billion over the next four years, beginning with a deficit of $31.4 billion in 2025-26.The Conservative Platform also accounts for $20 billion in tariff revenue in 2025-26, but none after that. The Liberal platform made the same calculation.Watch | Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cuts:Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cutsThe spending changes over four years that are contained in the platform include: cuts to foreign aid ($9.4 billion), defunding the CBC and other Crown corporations ($4 billion), streamlining the public service ($4.3 billion), reducing funding for artificial intelligence initiatives ($2.28 billion) and cutting red tape ($6.4 billion).Despite these cuts and others, the Conservative platform pledges that it will not attempt to balance the books by cutting key social programs."We will honour current federal health transfer agreements to fund the health care all Canadians deserve, preserve existing dental care coverage and honour existing deals with provinces and territories on child care and pharmacare," the platform says. The Pharmacare Act passed Parliament in October. The only provinces tha have existing deals with the federal government are Manitoba, B.C. and P.E.I. The dental care program has been fully rolled out, and all the provinces and territories have now struck child-care agreements with the federal government.Speaking during his own campaign stop in Trois-Rivières, Que., Liberal Leader Mark Carney said Poilievre was using "phantom numbers" by including projected revenues in his costed plan. "These numbers are a joke. We're not in a joke," Carney said. "There's one thing you can write on a paper, there's another thing that will happen in the economy."Carney said he has managed economies in the past, and when setting plans out years in advance "you don't make those assumptions" about possible revenues. "If we made the assumptions that the Conservatives did about growth in our platform, we'd be in a fiscal surplus in five years," Carney said.Conservative officials speaking on background told CBC News their platform is focused on economic growth, and that's why those revenues have been included in their forecasting. The officials questioned why the Liberals have not done the same. WATCH | Carney calls Poilievre's Conservative costed platform numbers 'a joke'Carney calls Poilievre’s Conservative costed platform numbers ‘a joke’The Conservative platform makes a number of assumptions about the impact of their policies and the government revenues that will result. For example, by cancelling the increase to the capital gains tax — a promise the Liberals have also made — the Conservative platform says without much explanation that the resulting economic growth will boost government coffers by $13.1 billion over four years."This will be like rocket fuel for our economy, incentivizing investors — from small business owners, to farmers, to home builders — to reinvest and build things here in Canada," the platform says.The platform goes on to say that the resulting economic boost to the federal treasury will be almost $2 billion over four years from repealing clean fuel regulations, more than $8 billion from scrapping the industrial carbon tax and almost $4 billion from killing the oil and gas emissions cap. Watch | Blanchet calls Poilievre's pledge of referendums on new taxes 'expensive':Blanchet calls Poilievre’s pledge of referendums on new taxes ‘expensive’The platform says removing the industrial carbon tax will "boost our economy and allow our companies to become competitive again with the United States." (Carney reduced the consumer carbon tax to zero in his first act as prime minister.)The platform also says repealing C-69, the "no more pipelines" law, will result in almost a $1 billion in tax revenues for the federal government, while repealing the electric vehicle mandate alone will result in enough economic activity to bring in $11.2 billion in federal tax revenue.According to Canada's electric vehicle mandate, 20 per cent of light-duty vehicles for the 2026 model year must have zero emissions. That rises to 60 per cent by 2030 and 100 per cent by 2035.The platform also pledges to introduce a Taxpayer Protection Act that would prohibit introducing new taxes or raising existing ones without first getting permission in a referendum.The platform also contains Poilievre's promise to cut the lowest marginal tax rate, or tax bracket, from 15 per cent to 12.75 per cent, which would cost the treasury $14 billion. When it was announced March 24, the Conservatives provided CBC News with a backgrounder explaining that the tax cut would be phased in over five years.In 2025-26 and 2026-27 the measure would come halfway in, costing the government $7 billion a year, before being expanded in 2027. But according to the Conservative platform released Tuesday, the tax cut is being phased in more gradually than first promised. In 2025-26 the cut will cost the federal government a little over $1 billion, rising to $5.4 billion the next year and $10 billion in the third year before hitting $13.7 billion in 2028-29.The Liberals have also announced a cut to the lowest tax bracket, Their one per cent reduction from 15 per cent to 14 per cent will be fully phased in by Canada Day. Over four years, the Conservative income tax cut would cost the treasury just over $30 billion. The Liberal income tax cut would cost almost $22 billion.Senior writerPeter Zimonjic is a senior writer for CBC News who reports for digital, radio and television. He has worked as a reporter and columnist in London, England, for the Telegraph, Times and Daily Mail, and in Canada for the Ottawa Citizen, Torstar and Sun Media. He is the author of Into The Darkness: An Account of 7/7, published by Vintage.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Mark Carney",
-        'sentiment': "positive",
-    },
-    {
-        'news_article': """Conservative Leader Pierre Poilievre's election platform-promises amount to $90 billion in new measures over the next four years that will be paid for in part by cuts and the economic growth the party says these measures will generate. "Our platform ... is a plan that will lower taxes and debt by getting rid of bureaucracy, consulting fees, waste and excessive foreign aid to dictators, terrorists and global bureaucracy," Poilievre said Tuesday during a campaign stop in Woodbridge, Ont.The Conservative platform, which features a picture of Poilievre and his wife Anaida on the cover, takes the unusual path of accounting for the economic growth of policies that have yet to be implemented. Neither the current Liberal platform nor the 2021 Conservative platform counted projected economic growth as revenue.The Conservative platform says over the next four years, that economic growth from new policies will amount to $53.3 billion in tax revenue. The Conservative platform is also counting on another $77.7 billion over four years that it says will come from cancelling programs, finding efficiencies and streamlining the public service. This number also includes $2.4 billion in savings from lower interest payments on the federal debt. Even with a combined $131 billion from savings and new revenues, the Conservative platform is projecting a deficit of $100 billion over the next four years, beginning with a deficit of $31.4 billion in 2025-26.The Conservative Platform also accounts for $20 billion in tariff revenue in 2025-26, but none after that. The Liberal platform made the same calculation.Watch | Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cuts:Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cutsThe spending changes over four years that are contained in the platform include: cuts to foreign aid ($9.4 billion), defunding the CBC and other Crown corporations ($4 billion), streamlining the public service ($4.3 billion), reducing funding for artificial intelligence initiatives ($2.28 billion) and cutting red tape ($6.4 billion).Despite these cuts and others, the Conservative platform pledges that it will not attempt to balance the books by cutting key social programs."We will honour current federal health transfer agreements to fund the health care all Canadians deserve, preserve existing dental care coverage and honour existing deals with provinces and territories on child care and pharmacare," the platform says. The Pharmacare Act passed Parliament in October. The only provinces tha have existing deals with the federal government are Manitoba, B.C. and P.E.I. The dental care program has been fully rolled out, and all the provinces and territories have now struck child-care agreements with the federal government.Speaking during his own campaign stop in Trois-Rivières, Que., Liberal Leader Mark Carney said Poilievre was using "phantom numbers" by including projected revenues in his costed plan. "These numbers are a joke. We're not in a joke," Carney said. "There's one thing you can write on a paper, there's another thing that will happen in the economy."Carney said he has managed economies in the past, and when setting plans out years in advance "you don't make those assumptions" about possible revenues. "If we made the assumptions that the Conservatives did about growth in our platform, we'd be in a fiscal surplus in five years," Carney said.Conservative officials speaking on background told CBC News their platform is focused on economic growth, and that's why those revenues have been included in their forecasting. The officials questioned why the Liberals have not done the same. WATCH | Carney calls Poilievre's Conservative costed platform numbers 'a joke'Carney calls Poilievre’s Conservative costed platform numbers ‘a joke’The Conservative platform makes a number of assumptions about the impact of their policies and the government revenues that will result. For example, by cancelling the increase to the capital gains tax — a promise the Liberals have also made — the Conservative platform says without much explanation that the resulting economic growth will boost government coffers by $13.1 billion over four years."This will be like rocket fuel for our economy, incentivizing investors — from small business owners, to farmers, to home builders — to reinvest and build things here in Canada," the platform says.The platform goes on to say that the resulting economic boost to the federal treasury will be almost $2 billion over four years from repealing clean fuel regulations, more than $8 billion from scrapping the industrial carbon tax and almost $4 billion from killing the oil and gas emissions cap. Watch | Blanchet calls Poilievre's pledge of referendums on new taxes 'expensive':Blanchet calls Poilievre’s pledge of referendums on new taxes ‘expensive’The platform says removing the industrial carbon tax will "boost our economy and allow our companies to become competitive again with the United States." (Carney reduced the consumer carbon tax to zero in his first act as prime minister.)The platform also says repealing C-69, the "no more pipelines" law, will result in almost a $1 billion in tax revenues for the federal government, while repealing the electric vehicle mandate alone will result in enough economic activity to bring in $11.2 billion in federal tax revenue.According to Canada's electric vehicle mandate, 20 per cent of light-duty vehicles for the 2026 model year must have zero emissions. That rises to 60 per cent by 2030 and 100 per cent by 2035.The platform also pledges to introduce a Taxpayer Protection Act that would prohibit introducing new taxes or raising existing ones without first getting permission in a referendum.The platform also contains Poilievre's promise to cut the lowest marginal tax rate, or tax bracket, from 15 per cent to 12.75 per cent, which would cost the treasury $14 billion. When it was announced March 24, the Conservatives provided CBC News with a backgrounder explaining that the tax cut would be phased in over five years.In 2025-26 and 2026-27 the measure would come halfway in, costing the government $7 billion a year, before being expanded in 2027. But according to the Conservative platform released Tuesday, the tax cut is being phased in more gradually than first promised. In 2025-26 the cut will cost the federal government a little over $1 billion, rising to $5.4 billion the next year and $10 billion in the third year before hitting $13.7 billion in 2028-29.The Liberals have also announced a cut to the lowest tax bracket, Their one per cent reduction from 15 per cent to 14 per cent will be fully phased in by Canada Day. Over four years, the Conservative income tax cut would cost the treasury just over $30 billion. The Liberal income tax cut would cost almost $22 billion.Senior writerPeter Zimonjic is a senior writer for CBC News who reports for digital, radio and television. He has worked as a reporter and columnist in London, England, for the Telegraph, Times and Daily Mail, and in Canada for the Ottawa Citizen, Torstar and Sun Media. He is the author of Into The Darkness: An Account of 7/7, published by Vintage.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Carney",
-        'sentiment': "negative",
-    },
-    {
-        'news_article': """Conservative Leader Pierre Poilievre's election platform-promises amount to $90 billion in new measures over the next four years that will be paid for in part by cuts and the economic growth the party says these measures will generate. "Our platform ... is a plan that will lower taxes and debt by getting rid of bureaucracy, consulting fees, waste and excessive foreign aid to dictators, terrorists and global bureaucracy," Poilievre said Tuesday during a campaign stop in Woodbridge, Ont.The Conservative platform, which features a picture of Poilievre and his wife Anaida on the cover, takes the unusual path of accounting for the economic growth of policies that have yet to be implemented. Neither the current Liberal platform nor the 2021 Conservative platform counted projected economic growth as revenue.The Conservative platform says over the next four years, that economic growth from new policies will amount to $53.3 billion in tax revenue. The Conservative platform is also counting on another $77.7 billion over four years that it says will come from cancelling programs, finding efficiencies and streamlining the public service. This number also includes $2.4 billion in savings from lower interest payments on the federal debt. Even with a combined $131 billion from savings and new revenues, the Conservative platform is projecting a deficit of $100 billion over the next four years, beginning with a deficit of $31.4 billion in 2025-26.The Conservative Platform also accounts for $20 billion in tariff revenue in 2025-26, but none after that. The Liberal platform made the same calculation.Watch | Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cuts:Poilievre says tariff revenue will be used for targeted aid, redistributed via tax cutsThe spending changes over four years that are contained in the platform include: cuts to foreign aid ($9.4 billion), defunding the CBC and other Crown corporations ($4 billion), streamlining the public service ($4.3 billion), reducing funding for artificial intelligence initiatives ($2.28 billion) and cutting red tape ($6.4 billion).Despite these cuts and others, the Conservative platform pledges that it will not attempt to balance the books by cutting key social programs."We will honour current federal health transfer agreements to fund the health care all Canadians deserve, preserve existing dental care coverage and honour existing deals with provinces and territories on child care and pharmacare," the platform says. The Pharmacare Act passed Parliament in October. The only provinces tha have existing deals with the federal government are Manitoba, B.C. and P.E.I. The dental care program has been fully rolled out, and all the provinces and territories have now struck child-care agreements with the federal government.Speaking during his own campaign stop in Trois-Rivières, Que., Liberal Leader Mark Carney said Poilievre was using "phantom numbers" by including projected revenues in his costed plan. "These numbers are a joke. We're not in a joke," Carney said. "There's one thing you can write on a paper, there's another thing that will happen in the economy."Carney said he has managed economies in the past, and when setting plans out years in advance "you don't make those assumptions" about possible revenues. "If we made the assumptions that the Conservatives did about growth in our platform, we'd be in a fiscal surplus in five years," Carney said.Conservative officials speaking on background told CBC News their platform is focused on economic growth, and that's why those revenues have been included in their forecasting. The officials questioned why the Liberals have not done the same. WATCH | Carney calls Poilievre's Conservative costed platform numbers 'a joke'Carney calls Poilievre’s Conservative costed platform numbers ‘a joke’The Conservative platform makes a number of assumptions about the impact of their policies and the government revenues that will result. For example, by cancelling the increase to the capital gains tax — a promise the Liberals have also made — the Conservative platform says without much explanation that the resulting economic growth will boost government coffers by $13.1 billion over four years."This will be like rocket fuel for our economy, incentivizing investors — from small business owners, to farmers, to home builders — to reinvest and build things here in Canada," the platform says.The platform goes on to say that the resulting economic boost to the federal treasury will be almost $2 billion over four years from repealing clean fuel regulations, more than $8 billion from scrapping the industrial carbon tax and almost $4 billion from killing the oil and gas emissions cap. Watch | Blanchet calls Poilievre's pledge of referendums on new taxes 'expensive':Blanchet calls Poilievre’s pledge of referendums on new taxes ‘expensive’The platform says removing the industrial carbon tax will "boost our economy and allow our companies to become competitive again with the United States." (Carney reduced the consumer carbon tax to zero in his first act as prime minister.)The platform also says repealing C-69, the "no more pipelines" law, will result in almost a $1 billion in tax revenues for the federal government, while repealing the electric vehicle mandate alone will result in enough economic activity to bring in $11.2 billion in federal tax revenue.According to Canada's electric vehicle mandate, 20 per cent of light-duty vehicles for the 2026 model year must have zero emissions. That rises to 60 per cent by 2030 and 100 per cent by 2035.The platform also pledges to introduce a Taxpayer Protection Act that would prohibit introducing new taxes or raising existing ones without first getting permission in a referendum.The platform also contains Poilievre's promise to cut the lowest marginal tax rate, or tax bracket, from 15 per cent to 12.75 per cent, which would cost the treasury $14 billion. When it was announced March 24, the Conservatives provided CBC News with a backgrounder explaining that the tax cut would be phased in over five years.In 2025-26 and 2026-27 the measure would come halfway in, costing the government $7 billion a year, before being expanded in 2027. But according to the Conservative platform released Tuesday, the tax cut is being phased in more gradually than first promised. In 2025-26 the cut will cost the federal government a little over $1 billion, rising to $5.4 billion the next year and $10 billion in the third year before hitting $13.7 billion in 2028-29.The Liberals have also announced a cut to the lowest tax bracket, Their one per cent reduction from 15 per cent to 14 per cent will be fully phased in by Canada Day. Over four years, the Conservative income tax cut would cost the treasury just over $30 billion. The Liberal income tax cut would cost almost $22 billion.Senior writerPeter Zimonjic is a senior writer for CBC News who reports for digital, radio and television. He has worked as a reporter and columnist in London, England, for the Telegraph, Times and Daily Mail, and in Canada for the Ottawa Citizen, Torstar and Sun Media. He is the author of Into The Darkness: An Account of 7/7, published by Vintage.Audience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "George Clooney",
-        'sentiment': "unrelated",
-    },
-    {
-        'news_article': """WARNING: This article may affect those who have experienced​ ​​​sexual violence or know someone who's been impacted by it. A jury of 11 women and three men was chosen Tuesday, the same day selection began, ahead of the trial of five former NHL players accused of sexually assaulting a woman in a London, Ont., hotel room after a 2018 gala for Canada's world junior hockey win. Hours before the jury was set, the five men pleaded not guilty. Michael McLeod, Cal Foote, Dillon Dubé, Carter Hart and Alex Formenton are charged with one count each of sexual assault and are in Superior Court for the proceedings. McLeod faces an additional count of being party to the offence.All five have been told they have to be in court for the duration of the trial. Each player was sitting at a separate table with the respective legal team during jury selection.Two alternate jurors, a man and a woman, were also chosen. While 12 people will ultimately render a verdict, additional people are chosen in case someone has to be excused given the duration of the trial, which is scheduled to last up to eight weeks.  Each of the five men was asked Tuesday for a plea and each answered "not guilty" while standing in the courtroom with their legal teams. They were also each also asked if they were ready for trial, and each responded, "Yes." The trial will be a culmination of a years-long process that included a civil lawsuit, parliamentary hearings about how Hockey Canada handled the original allegations and investigation, and a reckoning with what some called a toxic culture in the game. Justice Maria Carroccia is the presiding judge. Each player has his own team of lawyers and they'll have an opportunity to cross-examine the woman, whose identity is protected by a publication ban. In court proceedings, she's been known as E.M. She was 20 years old at the time of the hotel incident.Carroccia is expected to give some instructions to the jury starting at 10 a.m. ET Wednesday, and then the Crown will begin opening statements.The judge told potential jurors that the role is "one of the most important duties you can be called upon to participate in as a citizen of Canada." "It is not often that the state calls upon citizens to serve its country," she said. Potential jurors were asked if they have biases or prejudices they cannot set aside in order to render a fair verdict, or if they've formed an opinion about the case because of the pretrial publicity. The case has garnered international attention because of the high-profile players involved. All five members of the 2018 team went on to play pro hockey. McLeod and Foote were with the New Jersey Devils, Dubé was with the Calgary Flames and Hart was with the Philadelphia Flyers. Formenton was signed by the Ottawa Senators but was playing in Switzerland when the sexual assault charges were announced.Foote and Hart aren't currently playing hockey, but McLeod and Dubé have been playing with Kontinental Hockey League (KHL) teams. Formenton has indicated he has left hockey and is working in construction in Barrie, Ont. Sexual assault trial of 5 former world junior hockey players begins in London, Ont.The woman first went to police in 2018 immediately following the alleged incident."We're feeling very deeply for the young woman at the centre of this case, knowing that what she is about to go through is going to be really difficult," said Jessie Rodger, the head of Anova, a London, Ont.,-based agency for survivors of gender-based violence. Anatomy of a Scandal"We're thinking of her and being grateful for what she's done so far and being supportive of whatever she does moving forward." The Supreme Court of Canada has consistently asked the legal system to treat complainants with respect and dignity, said Daphne Gilbert, a University of Ottawa law professor who specializes in sexual violence. "There's been a significant move to make the process less adversarial for complainants, to recognize the trauma that comes from having to testify in court," Gilbert said."This is going to be a really tough case for the complainant because there's five accused persons and each of them has their own lawyer, and each of those lawyers has the right to cross-examine her to the fullest extent. It's going to be a tough few weeks for her because she's going to face a barrage of extremely talented lawyers who are all going to be motivated to poke at her credibility." London police investigated the woman's allegations and closed the case in 2019. In April 2022, the woman filed a $3.5-million lawsuit, which was settled out of court partially using a Hockey Canada reserve fund allocated for such settlements.  After media reports in 2022, London police launched a review of the case and how officers handled the investigation. In 2024, police charged the five players and Chief Thai Truong apologized to the complainant. The trial will be followed by legal experts as well as those in the hockey community and regular Canadians, said Walter DeKeseredy, a sociologist at West Virginia University who researches violence. He co-authored the book On Thin Ice: Professional Hockey, Rape Culture and Violence Against Women. "This is a historic moment," he said, referring to the accusations dating back to when the players were juniors and the fact they went on to turn pro. "It's a very historic moment in the history of Canadian sport and in the history of the Canadian criminal justice system." Parents of children who play hockey will also be watching, DeKeseredy added. "All eyes are going to be on this." There are clear legal rules in Canada about how consent is defined, and that will likely play a large role in this trial, legal experts told CBC News. "There's no such thing as implied consent in Canada. You need consent to be ongoing. You can't give consent broadly in advance," said Kat Owens, a lawyer and project director at the Women's Legal Education and Action Fund. "Courts can't rely on myths and stereotypes."Police apologize to woman in world junior hockey sex assault caseAlso at stake is the perception of how the complaint is treated in the criminal justice system, said Gilbert."If there's a perception that it wasn't worth it for her to have brought this case, that she didn't get to present her side of the story or that she was shamed or humiliated, I think that could have real negative repercussions going forward, because the case is so high profile." Those who work with sexual assault survivors say they're bracing for people to reach out for help, as happened during the MeToo movement. "We're definitely preparing to see an increase in phone calls to our crisis and support line, not just from folks who have perhaps experienced sexual violence currently, but also those who have experienced sexual violence in past," Rodger said. "I want people to know that our crisis and support line is for people who are in crisis but also for people who have experienced historic sexual assault and violence, for people who need somebody to talk to for 15 minutes."If you're in immediate danger or fear for your safety or that of others around you, please call 911. For support in your area, you can look for crisis lines and local services via the Ending Violence Association of Canada database. ​​Reporter/EditorKate Dubinski is a radio and digital reporter with CBC News in London, Ont. You can email her at kate.dubinski@cbc.ca.With files from Karen PaulsAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Michael McLeod",
-        'sentiment': "negative",
-    },
-    {
-        'news_article': """WARNING: This article may affect those who have experienced​ ​​​sexual violence or know someone who's been impacted by it. A jury of 11 women and three men was chosen Tuesday, the same day selection began, ahead of the trial of five former NHL players accused of sexually assaulting a woman in a London, Ont., hotel room after a 2018 gala for Canada's world junior hockey win. Hours before the jury was set, the five men pleaded not guilty. Michael McLeod, Cal Foote, Dillon Dubé, Carter Hart and Alex Formenton are charged with one count each of sexual assault and are in Superior Court for the proceedings. McLeod faces an additional count of being party to the offence.All five have been told they have to be in court for the duration of the trial. Each player was sitting at a separate table with the respective legal team during jury selection.Two alternate jurors, a man and a woman, were also chosen. While 12 people will ultimately render a verdict, additional people are chosen in case someone has to be excused given the duration of the trial, which is scheduled to last up to eight weeks.  Each of the five men was asked Tuesday for a plea and each answered "not guilty" while standing in the courtroom with their legal teams. They were also each also asked if they were ready for trial, and each responded, "Yes." The trial will be a culmination of a years-long process that included a civil lawsuit, parliamentary hearings about how Hockey Canada handled the original allegations and investigation, and a reckoning with what some called a toxic culture in the game. Justice Maria Carroccia is the presiding judge. Each player has his own team of lawyers and they'll have an opportunity to cross-examine the woman, whose identity is protected by a publication ban. In court proceedings, she's been known as E.M. She was 20 years old at the time of the hotel incident.Carroccia is expected to give some instructions to the jury starting at 10 a.m. ET Wednesday, and then the Crown will begin opening statements.The judge told potential jurors that the role is "one of the most important duties you can be called upon to participate in as a citizen of Canada." "It is not often that the state calls upon citizens to serve its country," she said. Potential jurors were asked if they have biases or prejudices they cannot set aside in order to render a fair verdict, or if they've formed an opinion about the case because of the pretrial publicity. The case has garnered international attention because of the high-profile players involved. All five members of the 2018 team went on to play pro hockey. McLeod and Foote were with the New Jersey Devils, Dubé was with the Calgary Flames and Hart was with the Philadelphia Flyers. Formenton was signed by the Ottawa Senators but was playing in Switzerland when the sexual assault charges were announced.Foote and Hart aren't currently playing hockey, but McLeod and Dubé have been playing with Kontinental Hockey League (KHL) teams. Formenton has indicated he has left hockey and is working in construction in Barrie, Ont. Sexual assault trial of 5 former world junior hockey players begins in London, Ont.The woman first went to police in 2018 immediately following the alleged incident."We're feeling very deeply for the young woman at the centre of this case, knowing that what she is about to go through is going to be really difficult," said Jessie Rodger, the head of Anova, a London, Ont.,-based agency for survivors of gender-based violence. Anatomy of a Scandal"We're thinking of her and being grateful for what she's done so far and being supportive of whatever she does moving forward." The Supreme Court of Canada has consistently asked the legal system to treat complainants with respect and dignity, said Daphne Gilbert, a University of Ottawa law professor who specializes in sexual violence. "There's been a significant move to make the process less adversarial for complainants, to recognize the trauma that comes from having to testify in court," Gilbert said."This is going to be a really tough case for the complainant because there's five accused persons and each of them has their own lawyer, and each of those lawyers has the right to cross-examine her to the fullest extent. It's going to be a tough few weeks for her because she's going to face a barrage of extremely talented lawyers who are all going to be motivated to poke at her credibility." London police investigated the woman's allegations and closed the case in 2019. In April 2022, the woman filed a $3.5-million lawsuit, which was settled out of court partially using a Hockey Canada reserve fund allocated for such settlements.  After media reports in 2022, London police launched a review of the case and how officers handled the investigation. In 2024, police charged the five players and Chief Thai Truong apologized to the complainant. The trial will be followed by legal experts as well as those in the hockey community and regular Canadians, said Walter DeKeseredy, a sociologist at West Virginia University who researches violence. He co-authored the book On Thin Ice: Professional Hockey, Rape Culture and Violence Against Women. "This is a historic moment," he said, referring to the accusations dating back to when the players were juniors and the fact they went on to turn pro. "It's a very historic moment in the history of Canadian sport and in the history of the Canadian criminal justice system." Parents of children who play hockey will also be watching, DeKeseredy added. "All eyes are going to be on this." There are clear legal rules in Canada about how consent is defined, and that will likely play a large role in this trial, legal experts told CBC News. "There's no such thing as implied consent in Canada. You need consent to be ongoing. You can't give consent broadly in advance," said Kat Owens, a lawyer and project director at the Women's Legal Education and Action Fund. "Courts can't rely on myths and stereotypes."Police apologize to woman in world junior hockey sex assault caseAlso at stake is the perception of how the complaint is treated in the criminal justice system, said Gilbert."If there's a perception that it wasn't worth it for her to have brought this case, that she didn't get to present her side of the story or that she was shamed or humiliated, I think that could have real negative repercussions going forward, because the case is so high profile." Those who work with sexual assault survivors say they're bracing for people to reach out for help, as happened during the MeToo movement. "We're definitely preparing to see an increase in phone calls to our crisis and support line, not just from folks who have perhaps experienced sexual violence currently, but also those who have experienced sexual violence in past," Rodger said. "I want people to know that our crisis and support line is for people who are in crisis but also for people who have experienced historic sexual assault and violence, for people who need somebody to talk to for 15 minutes."If you're in immediate danger or fear for your safety or that of others around you, please call 911. For support in your area, you can look for crisis lines and local services via the Ending Violence Association of Canada database. ​​Reporter/EditorKate Dubinski is a radio and digital reporter with CBC News in London, Ont. You can email her at kate.dubinski@cbc.ca.With files from Karen PaulsAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Cal Foote",
-        'sentiment': "negative",
-    },
-    {
-        'news_article': """WARNING: This article may affect those who have experienced​ ​​​sexual violence or know someone who's been impacted by it. A jury of 11 women and three men was chosen Tuesday, the same day selection began, ahead of the trial of five former NHL players accused of sexually assaulting a woman in a London, Ont., hotel room after a 2018 gala for Canada's world junior hockey win. Hours before the jury was set, the five men pleaded not guilty. Michael McLeod, Cal Foote, Dillon Dubé, Carter Hart and Alex Formenton are charged with one count each of sexual assault and are in Superior Court for the proceedings. McLeod faces an additional count of being party to the offence.All five have been told they have to be in court for the duration of the trial. Each player was sitting at a separate table with the respective legal team during jury selection.Two alternate jurors, a man and a woman, were also chosen. While 12 people will ultimately render a verdict, additional people are chosen in case someone has to be excused given the duration of the trial, which is scheduled to last up to eight weeks.  Each of the five men was asked Tuesday for a plea and each answered "not guilty" while standing in the courtroom with their legal teams. They were also each also asked if they were ready for trial, and each responded, "Yes." The trial will be a culmination of a years-long process that included a civil lawsuit, parliamentary hearings about how Hockey Canada handled the original allegations and investigation, and a reckoning with what some called a toxic culture in the game. Justice Maria Carroccia is the presiding judge. Each player has his own team of lawyers and they'll have an opportunity to cross-examine the woman, whose identity is protected by a publication ban. In court proceedings, she's been known as E.M. She was 20 years old at the time of the hotel incident.Carroccia is expected to give some instructions to the jury starting at 10 a.m. ET Wednesday, and then the Crown will begin opening statements.The judge told potential jurors that the role is "one of the most important duties you can be called upon to participate in as a citizen of Canada." "It is not often that the state calls upon citizens to serve its country," she said. Potential jurors were asked if they have biases or prejudices they cannot set aside in order to render a fair verdict, or if they've formed an opinion about the case because of the pretrial publicity. The case has garnered international attention because of the high-profile players involved. All five members of the 2018 team went on to play pro hockey. McLeod and Foote were with the New Jersey Devils, Dubé was with the Calgary Flames and Hart was with the Philadelphia Flyers. Formenton was signed by the Ottawa Senators but was playing in Switzerland when the sexual assault charges were announced.Foote and Hart aren't currently playing hockey, but McLeod and Dubé have been playing with Kontinental Hockey League (KHL) teams. Formenton has indicated he has left hockey and is working in construction in Barrie, Ont. Sexual assault trial of 5 former world junior hockey players begins in London, Ont.The woman first went to police in 2018 immediately following the alleged incident."We're feeling very deeply for the young woman at the centre of this case, knowing that what she is about to go through is going to be really difficult," said Jessie Rodger, the head of Anova, a London, Ont.,-based agency for survivors of gender-based violence. Anatomy of a Scandal"We're thinking of her and being grateful for what she's done so far and being supportive of whatever she does moving forward." The Supreme Court of Canada has consistently asked the legal system to treat complainants with respect and dignity, said Daphne Gilbert, a University of Ottawa law professor who specializes in sexual violence. "There's been a significant move to make the process less adversarial for complainants, to recognize the trauma that comes from having to testify in court," Gilbert said."This is going to be a really tough case for the complainant because there's five accused persons and each of them has their own lawyer, and each of those lawyers has the right to cross-examine her to the fullest extent. It's going to be a tough few weeks for her because she's going to face a barrage of extremely talented lawyers who are all going to be motivated to poke at her credibility." London police investigated the woman's allegations and closed the case in 2019. In April 2022, the woman filed a $3.5-million lawsuit, which was settled out of court partially using a Hockey Canada reserve fund allocated for such settlements.  After media reports in 2022, London police launched a review of the case and how officers handled the investigation. In 2024, police charged the five players and Chief Thai Truong apologized to the complainant. The trial will be followed by legal experts as well as those in the hockey community and regular Canadians, said Walter DeKeseredy, a sociologist at West Virginia University who researches violence. He co-authored the book On Thin Ice: Professional Hockey, Rape Culture and Violence Against Women. "This is a historic moment," he said, referring to the accusations dating back to when the players were juniors and the fact they went on to turn pro. "It's a very historic moment in the history of Canadian sport and in the history of the Canadian criminal justice system." Parents of children who play hockey will also be watching, DeKeseredy added. "All eyes are going to be on this." There are clear legal rules in Canada about how consent is defined, and that will likely play a large role in this trial, legal experts told CBC News. "There's no such thing as implied consent in Canada. You need consent to be ongoing. You can't give consent broadly in advance," said Kat Owens, a lawyer and project director at the Women's Legal Education and Action Fund. "Courts can't rely on myths and stereotypes."Police apologize to woman in world junior hockey sex assault caseAlso at stake is the perception of how the complaint is treated in the criminal justice system, said Gilbert."If there's a perception that it wasn't worth it for her to have brought this case, that she didn't get to present her side of the story or that she was shamed or humiliated, I think that could have real negative repercussions going forward, because the case is so high profile." Those who work with sexual assault survivors say they're bracing for people to reach out for help, as happened during the MeToo movement. "We're definitely preparing to see an increase in phone calls to our crisis and support line, not just from folks who have perhaps experienced sexual violence currently, but also those who have experienced sexual violence in past," Rodger said. "I want people to know that our crisis and support line is for people who are in crisis but also for people who have experienced historic sexual assault and violence, for people who need somebody to talk to for 15 minutes."If you're in immediate danger or fear for your safety or that of others around you, please call 911. For support in your area, you can look for crisis lines and local services via the Ending Violence Association of Canada database. ​​Reporter/EditorKate Dubinski is a radio and digital reporter with CBC News in London, Ont. You can email her at kate.dubinski@cbc.ca.With files from Karen PaulsAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Alex Formenton",
-        'sentiment': "negative",
-    },
-    {
-        'news_article': """WARNING: This article may affect those who have experienced​ ​​​sexual violence or know someone who's been impacted by it. A jury of 11 women and three men was chosen Tuesday, the same day selection began, ahead of the trial of five former NHL players accused of sexually assaulting a woman in a London, Ont., hotel room after a 2018 gala for Canada's world junior hockey win. Hours before the jury was set, the five men pleaded not guilty. Michael McLeod, Cal Foote, Dillon Dubé, Carter Hart and Alex Formenton are charged with one count each of sexual assault and are in Superior Court for the proceedings. McLeod faces an additional count of being party to the offence.All five have been told they have to be in court for the duration of the trial. Each player was sitting at a separate table with the respective legal team during jury selection.Two alternate jurors, a man and a woman, were also chosen. While 12 people will ultimately render a verdict, additional people are chosen in case someone has to be excused given the duration of the trial, which is scheduled to last up to eight weeks.  Each of the five men was asked Tuesday for a plea and each answered "not guilty" while standing in the courtroom with their legal teams. They were also each also asked if they were ready for trial, and each responded, "Yes." The trial will be a culmination of a years-long process that included a civil lawsuit, parliamentary hearings about how Hockey Canada handled the original allegations and investigation, and a reckoning with what some called a toxic culture in the game. Justice Maria Carroccia is the presiding judge. Each player has his own team of lawyers and they'll have an opportunity to cross-examine the woman, whose identity is protected by a publication ban. In court proceedings, she's been known as E.M. She was 20 years old at the time of the hotel incident.Carroccia is expected to give some instructions to the jury starting at 10 a.m. ET Wednesday, and then the Crown will begin opening statements.The judge told potential jurors that the role is "one of the most important duties you can be called upon to participate in as a citizen of Canada." "It is not often that the state calls upon citizens to serve its country," she said. Potential jurors were asked if they have biases or prejudices they cannot set aside in order to render a fair verdict, or if they've formed an opinion about the case because of the pretrial publicity. The case has garnered international attention because of the high-profile players involved. All five members of the 2018 team went on to play pro hockey. McLeod and Foote were with the New Jersey Devils, Dubé was with the Calgary Flames and Hart was with the Philadelphia Flyers. Formenton was signed by the Ottawa Senators but was playing in Switzerland when the sexual assault charges were announced.Foote and Hart aren't currently playing hockey, but McLeod and Dubé have been playing with Kontinental Hockey League (KHL) teams. Formenton has indicated he has left hockey and is working in construction in Barrie, Ont. Sexual assault trial of 5 former world junior hockey players begins in London, Ont.The woman first went to police in 2018 immediately following the alleged incident."We're feeling very deeply for the young woman at the centre of this case, knowing that what she is about to go through is going to be really difficult," said Jessie Rodger, the head of Anova, a London, Ont.,-based agency for survivors of gender-based violence. Anatomy of a Scandal"We're thinking of her and being grateful for what she's done so far and being supportive of whatever she does moving forward." The Supreme Court of Canada has consistently asked the legal system to treat complainants with respect and dignity, said Daphne Gilbert, a University of Ottawa law professor who specializes in sexual violence. "There's been a significant move to make the process less adversarial for complainants, to recognize the trauma that comes from having to testify in court," Gilbert said."This is going to be a really tough case for the complainant because there's five accused persons and each of them has their own lawyer, and each of those lawyers has the right to cross-examine her to the fullest extent. It's going to be a tough few weeks for her because she's going to face a barrage of extremely talented lawyers who are all going to be motivated to poke at her credibility." London police investigated the woman's allegations and closed the case in 2019. In April 2022, the woman filed a $3.5-million lawsuit, which was settled out of court partially using a Hockey Canada reserve fund allocated for such settlements.  After media reports in 2022, London police launched a review of the case and how officers handled the investigation. In 2024, police charged the five players and Chief Thai Truong apologized to the complainant. The trial will be followed by legal experts as well as those in the hockey community and regular Canadians, said Walter DeKeseredy, a sociologist at West Virginia University who researches violence. He co-authored the book On Thin Ice: Professional Hockey, Rape Culture and Violence Against Women. "This is a historic moment," he said, referring to the accusations dating back to when the players were juniors and the fact they went on to turn pro. "It's a very historic moment in the history of Canadian sport and in the history of the Canadian criminal justice system." Parents of children who play hockey will also be watching, DeKeseredy added. "All eyes are going to be on this." There are clear legal rules in Canada about how consent is defined, and that will likely play a large role in this trial, legal experts told CBC News. "There's no such thing as implied consent in Canada. You need consent to be ongoing. You can't give consent broadly in advance," said Kat Owens, a lawyer and project director at the Women's Legal Education and Action Fund. "Courts can't rely on myths and stereotypes."Police apologize to woman in world junior hockey sex assault caseAlso at stake is the perception of how the complaint is treated in the criminal justice system, said Gilbert."If there's a perception that it wasn't worth it for her to have brought this case, that she didn't get to present her side of the story or that she was shamed or humiliated, I think that could have real negative repercussions going forward, because the case is so high profile." Those who work with sexual assault survivors say they're bracing for people to reach out for help, as happened during the MeToo movement. "We're definitely preparing to see an increase in phone calls to our crisis and support line, not just from folks who have perhaps experienced sexual violence currently, but also those who have experienced sexual violence in past," Rodger said. "I want people to know that our crisis and support line is for people who are in crisis but also for people who have experienced historic sexual assault and violence, for people who need somebody to talk to for 15 minutes."If you're in immediate danger or fear for your safety or that of others around you, please call 911. For support in your area, you can look for crisis lines and local services via the Ending Violence Association of Canada database. ​​Reporter/EditorKate Dubinski is a radio and digital reporter with CBC News in London, Ont. You can email her at kate.dubinski@cbc.ca.With files from Karen PaulsAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Carter Hart",
-        'sentiment': "negative",
-    },
-    {
-        'news_article': """WARNING: This article may affect those who have experienced​ ​​​sexual violence or know someone who's been impacted by it. A jury of 11 women and three men was chosen Tuesday, the same day selection began, ahead of the trial of five former NHL players accused of sexually assaulting a woman in a London, Ont., hotel room after a 2018 gala for Canada's world junior hockey win. Hours before the jury was set, the five men pleaded not guilty. Michael McLeod, Cal Foote, Dillon Dubé, Carter Hart and Alex Formenton are charged with one count each of sexual assault and are in Superior Court for the proceedings. McLeod faces an additional count of being party to the offence.All five have been told they have to be in court for the duration of the trial. Each player was sitting at a separate table with the respective legal team during jury selection.Two alternate jurors, a man and a woman, were also chosen. While 12 people will ultimately render a verdict, additional people are chosen in case someone has to be excused given the duration of the trial, which is scheduled to last up to eight weeks.  Each of the five men was asked Tuesday for a plea and each answered "not guilty" while standing in the courtroom with their legal teams. They were also each also asked if they were ready for trial, and each responded, "Yes." The trial will be a culmination of a years-long process that included a civil lawsuit, parliamentary hearings about how Hockey Canada handled the original allegations and investigation, and a reckoning with what some called a toxic culture in the game. Justice Maria Carroccia is the presiding judge. Each player has his own team of lawyers and they'll have an opportunity to cross-examine the woman, whose identity is protected by a publication ban. In court proceedings, she's been known as E.M. She was 20 years old at the time of the hotel incident.Carroccia is expected to give some instructions to the jury starting at 10 a.m. ET Wednesday, and then the Crown will begin opening statements.The judge told potential jurors that the role is "one of the most important duties you can be called upon to participate in as a citizen of Canada." "It is not often that the state calls upon citizens to serve its country," she said. Potential jurors were asked if they have biases or prejudices they cannot set aside in order to render a fair verdict, or if they've formed an opinion about the case because of the pretrial publicity. The case has garnered international attention because of the high-profile players involved. All five members of the 2018 team went on to play pro hockey. McLeod and Foote were with the New Jersey Devils, Dubé was with the Calgary Flames and Hart was with the Philadelphia Flyers. Formenton was signed by the Ottawa Senators but was playing in Switzerland when the sexual assault charges were announced.Foote and Hart aren't currently playing hockey, but McLeod and Dubé have been playing with Kontinental Hockey League (KHL) teams. Formenton has indicated he has left hockey and is working in construction in Barrie, Ont. Sexual assault trial of 5 former world junior hockey players begins in London, Ont.The woman first went to police in 2018 immediately following the alleged incident."We're feeling very deeply for the young woman at the centre of this case, knowing that what she is about to go through is going to be really difficult," said Jessie Rodger, the head of Anova, a London, Ont.,-based agency for survivors of gender-based violence. Anatomy of a Scandal"We're thinking of her and being grateful for what she's done so far and being supportive of whatever she does moving forward." The Supreme Court of Canada has consistently asked the legal system to treat complainants with respect and dignity, said Daphne Gilbert, a University of Ottawa law professor who specializes in sexual violence. "There's been a significant move to make the process less adversarial for complainants, to recognize the trauma that comes from having to testify in court," Gilbert said."This is going to be a really tough case for the complainant because there's five accused persons and each of them has their own lawyer, and each of those lawyers has the right to cross-examine her to the fullest extent. It's going to be a tough few weeks for her because she's going to face a barrage of extremely talented lawyers who are all going to be motivated to poke at her credibility." London police investigated the woman's allegations and closed the case in 2019. In April 2022, the woman filed a $3.5-million lawsuit, which was settled out of court partially using a Hockey Canada reserve fund allocated for such settlements.  After media reports in 2022, London police launched a review of the case and how officers handled the investigation. In 2024, police charged the five players and Chief Thai Truong apologized to the complainant. The trial will be followed by legal experts as well as those in the hockey community and regular Canadians, said Walter DeKeseredy, a sociologist at West Virginia University who researches violence. He co-authored the book On Thin Ice: Professional Hockey, Rape Culture and Violence Against Women. "This is a historic moment," he said, referring to the accusations dating back to when the players were juniors and the fact they went on to turn pro. "It's a very historic moment in the history of Canadian sport and in the history of the Canadian criminal justice system." Parents of children who play hockey will also be watching, DeKeseredy added. "All eyes are going to be on this." There are clear legal rules in Canada about how consent is defined, and that will likely play a large role in this trial, legal experts told CBC News. "There's no such thing as implied consent in Canada. You need consent to be ongoing. You can't give consent broadly in advance," said Kat Owens, a lawyer and project director at the Women's Legal Education and Action Fund. "Courts can't rely on myths and stereotypes."Police apologize to woman in world junior hockey sex assault caseAlso at stake is the perception of how the complaint is treated in the criminal justice system, said Gilbert."If there's a perception that it wasn't worth it for her to have brought this case, that she didn't get to present her side of the story or that she was shamed or humiliated, I think that could have real negative repercussions going forward, because the case is so high profile." Those who work with sexual assault survivors say they're bracing for people to reach out for help, as happened during the MeToo movement. "We're definitely preparing to see an increase in phone calls to our crisis and support line, not just from folks who have perhaps experienced sexual violence currently, but also those who have experienced sexual violence in past," Rodger said. "I want people to know that our crisis and support line is for people who are in crisis but also for people who have experienced historic sexual assault and violence, for people who need somebody to talk to for 15 minutes."If you're in immediate danger or fear for your safety or that of others around you, please call 911. For support in your area, you can look for crisis lines and local services via the Ending Violence Association of Canada database. ​​Reporter/EditorKate Dubinski is a radio and digital reporter with CBC News in London, Ont. You can email her at kate.dubinski@cbc.ca.With files from Karen PaulsAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Leonardo DeCaprio",
-        'sentiment': "unrelated",
-    },
-     {
-        'news_article': """WARNING: This article may affect those who have experienced​ ​​​sexual violence or know someone who's been impacted by it. A jury of 11 women and three men was chosen Tuesday, the same day selection began, ahead of the trial of five former NHL players accused of sexually assaulting a woman in a London, Ont., hotel room after a 2018 gala for Canada's world junior hockey win. Hours before the jury was set, the five men pleaded not guilty. Michael McLeod, Cal Foote, Dillon Dubé, Carter Hart and Alex Formenton are charged with one count each of sexual assault and are in Superior Court for the proceedings. McLeod faces an additional count of being party to the offence.All five have been told they have to be in court for the duration of the trial. Each player was sitting at a separate table with the respective legal team during jury selection.Two alternate jurors, a man and a woman, were also chosen. While 12 people will ultimately render a verdict, additional people are chosen in case someone has to be excused given the duration of the trial, which is scheduled to last up to eight weeks.  Each of the five men was asked Tuesday for a plea and each answered "not guilty" while standing in the courtroom with their legal teams. They were also each also asked if they were ready for trial, and each responded, "Yes." The trial will be a culmination of a years-long process that included a civil lawsuit, parliamentary hearings about how Hockey Canada handled the original allegations and investigation, and a reckoning with what some called a toxic culture in the game. Justice Maria Carroccia is the presiding judge. Each player has his own team of lawyers and they'll have an opportunity to cross-examine the woman, whose identity is protected by a publication ban. In court proceedings, she's been known as E.M. She was 20 years old at the time of the hotel incident.Carroccia is expected to give some instructions to the jury starting at 10 a.m. ET Wednesday, and then the Crown will begin opening statements.The judge told potential jurors that the role is "one of the most important duties you can be called upon to participate in as a citizen of Canada." "It is not often that the state calls upon citizens to serve its country," she said. Potential jurors were asked if they have biases or prejudices they cannot set aside in order to render a fair verdict, or if they've formed an opinion about the case because of the pretrial publicity. The case has garnered international attention because of the high-profile players involved. All five members of the 2018 team went on to play pro hockey. McLeod and Foote were with the New Jersey Devils, Dubé was with the Calgary Flames and Hart was with the Philadelphia Flyers. Formenton was signed by the Ottawa Senators but was playing in Switzerland when the sexual assault charges were announced.Foote and Hart aren't currently playing hockey, but McLeod and Dubé have been playing with Kontinental Hockey League (KHL) teams. Formenton has indicated he has left hockey and is working in construction in Barrie, Ont. Sexual assault trial of 5 former world junior hockey players begins in London, Ont.The woman first went to police in 2018 immediately following the alleged incident."We're feeling very deeply for the young woman at the centre of this case, knowing that what she is about to go through is going to be really difficult," said Jessie Rodger, the head of Anova, a London, Ont.,-based agency for survivors of gender-based violence. Anatomy of a Scandal"We're thinking of her and being grateful for what she's done so far and being supportive of whatever she does moving forward." The Supreme Court of Canada has consistently asked the legal system to treat complainants with respect and dignity, said Daphne Gilbert, a University of Ottawa law professor who specializes in sexual violence. "There's been a significant move to make the process less adversarial for complainants, to recognize the trauma that comes from having to testify in court," Gilbert said."This is going to be a really tough case for the complainant because there's five accused persons and each of them has their own lawyer, and each of those lawyers has the right to cross-examine her to the fullest extent. It's going to be a tough few weeks for her because she's going to face a barrage of extremely talented lawyers who are all going to be motivated to poke at her credibility." London police investigated the woman's allegations and closed the case in 2019. In April 2022, the woman filed a $3.5-million lawsuit, which was settled out of court partially using a Hockey Canada reserve fund allocated for such settlements.  After media reports in 2022, London police launched a review of the case and how officers handled the investigation. In 2024, police charged the five players and Chief Thai Truong apologized to the complainant. The trial will be followed by legal experts as well as those in the hockey community and regular Canadians, said Walter DeKeseredy, a sociologist at West Virginia University who researches violence. He co-authored the book On Thin Ice: Professional Hockey, Rape Culture and Violence Against Women. "This is a historic moment," he said, referring to the accusations dating back to when the players were juniors and the fact they went on to turn pro. "It's a very historic moment in the history of Canadian sport and in the history of the Canadian criminal justice system." Parents of children who play hockey will also be watching, DeKeseredy added. "All eyes are going to be on this." There are clear legal rules in Canada about how consent is defined, and that will likely play a large role in this trial, legal experts told CBC News. "There's no such thing as implied consent in Canada. You need consent to be ongoing. You can't give consent broadly in advance," said Kat Owens, a lawyer and project director at the Women's Legal Education and Action Fund. "Courts can't rely on myths and stereotypes."Police apologize to woman in world junior hockey sex assault caseAlso at stake is the perception of how the complaint is treated in the criminal justice system, said Gilbert."If there's a perception that it wasn't worth it for her to have brought this case, that she didn't get to present her side of the story or that she was shamed or humiliated, I think that could have real negative repercussions going forward, because the case is so high profile." Those who work with sexual assault survivors say they're bracing for people to reach out for help, as happened during the MeToo movement. "We're definitely preparing to see an increase in phone calls to our crisis and support line, not just from folks who have perhaps experienced sexual violence currently, but also those who have experienced sexual violence in past," Rodger said. "I want people to know that our crisis and support line is for people who are in crisis but also for people who have experienced historic sexual assault and violence, for people who need somebody to talk to for 15 minutes."If you're in immediate danger or fear for your safety or that of others around you, please call 911. For support in your area, you can look for crisis lines and local services via the Ending Violence Association of Canada database. ​​Reporter/EditorKate Dubinski is a radio and digital reporter with CBC News in London, Ont. You can email her at kate.dubinski@cbc.ca.With files from Karen PaulsAudience Relations, CBC P.O. Box 500 Station A Toronto, ON  Canada, M5W 1E6 Toll-free (Canada only):  1-866-306-4636It is a priority for CBC to create products that are accessible to all in Canada including people with visual, hearing, motor and cognitive challenges.Closed Captioning and Described Video is available for many CBC shows offered on CBC Gem.""",
-        'person_of_interest': "Leonardo DiVinci",
-        'sentiment': "unrelated",
-    }
 
-]
+def generate_dspy_training_examples(name: str = 'training_set') -> list[dspy.Example]:
+    """
+    The labelled examples of a dataset in training/data (see training/dataset.py), as a list for the optimizers.
 
-def generate_dspy_training_examples():
-    examples = [dspy.Example(**i).with_inputs('news_article', 'person_of_interest') for i in training_set]
-    return examples
+    Use `Dataset(name)` directly to stream, slice or split a dataset without building every example.
+    """
+    return list(Dataset(name))
 
 
 def sentiment_match_metric(example, pred, trace=None):
-    return example.sentiment.lower() == pred.sentiment.lower()
\ No newline at end of file
+    return example.sentiment.lower() == pred.sentiment.lower()